@@ -0,0 +1 @@
+"""Monte-Carlo balance farm: scripted strategies over many headless games (run with `python -m balance`)."""
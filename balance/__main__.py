@@ -0,0 +1,5 @@
+import sys
+
+from balance.farm import main
+
+sys.exit(main())
@@ -0,0 +1,322 @@
+"""
+Monte-Carlo balance farm.
+
+Plays many headless games per scripted strategy (balance/strategies.py)
+across a ProcessPoolExecutor. Every played wave sends one row back to the
+parent as soon as it finishes (lives, gold, XP/SPL, towers, kills, leaks,
+ticks and tick time), so long runs can be watched and streamed to disk,
+and the rows are aggregated into per-wave percentile tables.
+
+Every strategy plays the same list of game seeds, so strategies are
+compared on identical maps, shops and spawns.
+
+Usage (from the repo root):
+    python -m balance --games 1000 --strategy greedy --waves 20
+    python -m balance --games 200 --strategy greedy --strategy builder --rows rows.jsonl --out tables.json
+    python -m balance --games 50 --workers 1 --metric kills --metric tick_ms
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from balance.strategies import STRATEGIES
+from core.game import Game
+from core.headless import HeadlessRunner
+
+# Per-wave row fields aggregated into tables (state is read after the wave ends)
+METRICS = ("lives", "gold", "xp", "spl", "towers", "kills", "leaks", "ticks", "tick_ms")
+DEFAULT_METRICS = ("lives", "gold", "towers", "kills", "tick_ms")
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def play_game(seed, strategy, waves, minimal=False, max_ticks_per_wave=36000, emit=None):
+    """
+    Play one headless game with a scripted strategy.
+
+    Args:
+        seed: Game seed
+        strategy: Name in STRATEGIES
+        waves: Waves to play (fewer if the game ends first)
+        minimal: Play in minimal mode (no XP/SPL)
+        max_ticks_per_wave: Safety cap per wave (see HeadlessRunner)
+        emit: Called with each per-wave row as soon as the wave ends
+
+    Returns:
+        dict: Final summary; "waves" is the number of rows emitted
+    """
+    game = Game(minimal_mode=minimal, headless=True, seed=seed)
+    # Own stream, seeded like core.rng's, so the strategy never draws from the game's
+    player = STRATEGIES[strategy](random.Random(f"{seed}:strategy"))
+    runner = HeadlessRunner(game, max_ticks_per_wave)
+    played = 0
+    for _ in range(waves):
+        if game.game_over:
+            break
+        player.between_waves(game)
+        wave = game.round_num
+        killed, leaked, elapsed = game.enemies_killed, game.enemies_leaked, runner.elapsed
+        ticks = runner.run_wave()
+        seconds = runner.elapsed - elapsed
+        row = {
+            "seed": seed,
+            "strategy": strategy,
+            "wave": wave,
+            "lives": game.lives,
+            "gold": game.gold,
+            "xp": getattr(game, "xp", 0),
+            "spl": getattr(game, "shop_power_level", 0),
+            "towers": len(game.towers),
+            "kills": game.enemies_killed - killed,
+            "leaks": game.enemies_leaked - leaked,
+            "ticks": ticks,
+            "tick_ms": seconds * 1000.0 / ticks if ticks else 0.0,
+            "game_over": game.game_over,
+        }
+        played += 1
+        if emit is not None:
+            emit(row)
+    return {
+        "seed": seed,
+        "strategy": strategy,
+        "waves": played,
+        "round_num": game.round_num,
+        "lives": game.lives,
+        "gold": game.gold,
+        "game_over": game.game_over,
+    }
+
+
+# ----------------------------------------------------------------------
+# Worker processes
+# ----------------------------------------------------------------------
+
+_rows = None  # Worker side of the row queue (set by _init_worker)
+
+
+def _init_worker(rows):
+    global _rows
+    _rows = rows
+
+
+def _play_in_worker(seed, strategy, waves, minimal, max_ticks_per_wave):
+    return play_game(seed, strategy, waves, minimal, max_ticks_per_wave, emit=_rows.put)
+
+
+def game_seeds(games, seed=0):
+    """The seeds each strategy plays, derived from one farm seed."""
+    rng = random.Random(seed)
+    return [rng.randrange(2 ** 32) for _ in range(games)]
+
+
+def run_farm(strategies, games, waves, workers=None, seed=0, minimal=False,
+             max_ticks_per_wave=36000, on_row=None, on_game=None):
+    """
+    Play `games` games per strategy and aggregate the per-wave rows.
+
+    Args:
+        strategies: Strategy names
+        games: Games per strategy
+        waves: Waves per game
+        workers: Worker processes (None = one per CPU; 1 = play in this process)
+        seed: Farm seed (see game_seeds)
+        minimal: Play in minimal mode
+        max_ticks_per_wave: Safety cap per wave
+        on_row: Called with each row as it arrives (in arrival order)
+        on_game: Called with each game's summary as it finishes
+
+    Returns:
+        tuple: (FarmStats, list of game summaries)
+    """
+    stats = FarmStats()
+    summaries = []
+    jobs = [(s, strategy, waves, minimal, max_ticks_per_wave)
+            for strategy in strategies for s in game_seeds(games, seed)]
+
+    def handle_row(row):
+        stats.add(row)
+        if on_row is not None:
+            on_row(row)
+
+    def handle_game(summary):
+        summaries.append(summary)
+        if on_game is not None:
+            on_game(summary)
+
+    if (workers or os.cpu_count() or 1) <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            handle_game(play_game(*job, emit=handle_row))
+        return stats, summaries
+
+    ctx = multiprocessing.get_context()
+    rows = ctx.Queue()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_worker, initargs=(rows,)) as pool:
+        pending = {pool.submit(_play_in_worker, *job) for job in jobs}
+        expected = received = 0
+        # A game's result can overtake its last rows (separate pipes), so
+        # keep draining until every row the finished games reported is in
+        while pending or received < expected:
+            if pending:
+                done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    summary = future.result()
+                    expected += summary["waves"]
+                    handle_game(summary)
+            try:
+                while True:
+                    handle_row(rows.get(timeout=0 if pending else 0.05))
+                    received += 1
+            except queue.Empty:
+                pass
+    return stats, summaries
+
+
+# ----------------------------------------------------------------------
+# Aggregation
+# ----------------------------------------------------------------------
+
+def percentile(ordered, p):
+    """Nearest-rank percentile of an already sorted list (p in 0-100)."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100.0))]
+
+
+class FarmStats:
+    """Per-strategy, per-wave metric samples."""
+
+    def __init__(self):
+        self.samples = {}  # strategy -> wave -> metric -> [values]
+        self.rows = 0
+
+    def add(self, row):
+        waves = self.samples.setdefault(row["strategy"], {})
+        metrics = waves.get(row["wave"])
+        if metrics is None:
+            metrics = waves[row["wave"]] = {metric: [] for metric in METRICS}
+        for metric in METRICS:
+            metrics[metric].append(row[metric])
+        self.rows += 1
+
+    def table(self, strategy, metric, percentiles=PERCENTILES):
+        """
+        Percentiles of one metric per wave.
+
+        Returns:
+            dict: wave -> {"n": games that played the wave, "p5": ..., "p50": ..., ...}
+        """
+        out = {}
+        for wave, metrics in sorted(self.samples.get(strategy, {}).items()):
+            ordered = sorted(metrics[metric])
+            entry = {"n": len(ordered)}
+            for p in percentiles:
+                entry[f"p{p}"] = percentile(ordered, p)
+            out[wave] = entry
+        return out
+
+    def to_dict(self, metrics=METRICS, percentiles=PERCENTILES):
+        """All tables, as {strategy: {metric: {wave: {...}}}} (JSON-ready)."""
+        return {strategy: {metric: self.table(strategy, metric, percentiles) for metric in metrics}
+                for strategy in self.samples}
+
+
+def summarize(summaries):
+    """
+    Final-state stats per strategy.
+
+    Returns:
+        dict: strategy -> {"games", "game_over_rate", "round_num": {"p5", ..., "p95"}}
+    """
+    by_strategy = {}
+    for s in summaries:
+        by_strategy.setdefault(s["strategy"], []).append(s)
+    out = {}
+    for strategy, games in by_strategy.items():
+        rounds = sorted(s["round_num"] for s in games)
+        out[strategy] = {
+            "games": len(games),
+            "game_over_rate": sum(1 for s in games if s["game_over"]) / len(games),
+            "round_num": {f"p{p}": percentile(rounds, p) for p in PERCENTILES},
+        }
+    return out
+
+
+def print_tables(stats, metrics=DEFAULT_METRICS, percentiles=PERCENTILES):
+    for strategy in stats.samples:
+        for metric in metrics:
+            print(f"\n{strategy} / {metric}")
+            print(f"{'wave':>5}{'n':>7}" + "".join(f"{'p' + str(p):>10}" for p in percentiles))
+            for wave, entry in stats.table(strategy, metric, percentiles).items():
+                cells = "".join(_cell(entry[f"p{p}"]) for p in percentiles)
+                print(f"{wave:>5}{entry['n']:>7}{cells}")
+
+
+def print_summary(summary):
+    print(f"\n{'strategy':<12}{'games':>7}{'game over':>11}  final wave p5 / p50 / p95")
+    for strategy, s in summary.items():
+        r = s["round_num"]
+        print(f"{strategy:<12}{s['games']:>7}{s['game_over_rate']:>11.0%}  {r['p5']} / {r['p50']} / {r['p95']}")
+
+
+def _cell(value):
+    return f"{value:10.3f}" if isinstance(value, float) else f"{value:>10}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tower Defense 3 Monte-Carlo balance farm")
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES),
+                        help="Strategy to play (repeatable; default: greedy)")
+    parser.add_argument("--games", type=int, default=100, help="Games per strategy")
+    parser.add_argument("--waves", type=int, default=15, help="Waves per game")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0, help="Farm seed (picks the game seeds)")
+    parser.add_argument("--minimal", action="store_true", help="Play in minimal mode")
+    parser.add_argument("--metric", action="append", choices=METRICS,
+                        help="Metric to print a table for (repeatable; default: %s)" % ", ".join(DEFAULT_METRICS))
+    parser.add_argument("--rows", help="Stream every per-wave row to this JSON-lines file")
+    parser.add_argument("--out", help="Write all percentile tables and the summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    strategies = args.strategy or ["greedy"]
+    total = args.games * len(strategies)
+    rows_file = open(args.rows, "w") if args.rows else None
+    finished = 0
+    start = time.perf_counter()
+
+    def on_row(row):
+        if rows_file is not None:
+            rows_file.write(json.dumps(row) + "\n")
+
+    def on_game(summary):
+        nonlocal finished
+        finished += 1
+        print(f"\r{finished}/{total} games", end="", file=sys.stderr, flush=True)
+
+    try:
+        stats, summaries = run_farm(strategies, args.games, args.waves, args.workers, args.seed,
+                                    args.minimal, on_row=on_row, on_game=on_game)
+    finally:
+        if rows_file is not None:
+            rows_file.close()
+    print(f"\r{total} games, {stats.rows} waves in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    print_tables(stats, args.metric or DEFAULT_METRICS)
+    summary = summarize(summaries)
+    print_summary(summary)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({"tables": stats.to_dict(), "summary": summary,
+                       "games": args.games, "waves": args.waves, "seed": args.seed},
+                      f, indent=2, sort_keys=True)
+        print(f"\nTables written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+Scripted players for the balance farm.
+
+A strategy makes its moves between waves, through the same EconomyManager
+and Game calls the UI makes (move_to_bench, select_for_merge +
+confirm_merge, place_tower, place_tile_from_bench, track_direction...),
+so whatever the YAML/data tables say about costs, merges and tiles is
+exactly what it plays against.
+
+Each strategy gets its own random.Random, kept apart from the game's RNG
+streams, so a strategy's choices never shift the game's shop or spawn
+rolls.
+"""
+
+# Track/DirectionalBeam direction index -> (dx, dy); see Tower.update
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# Coverage is scored within this reach (Overwatch's 99 would rate every cell the same)
+MAX_REACH = 4
+
+
+# ----------------------------------------------------------------------
+# Shared moves
+# ----------------------------------------------------------------------
+
+def ensure_shop_mode(game, mode):
+    """Cycle the shop until it's in `mode` ("towers", "tiles" or "upgrades")."""
+    for _ in range(3):
+        if game.shop_mode == mode:
+            return
+        game.economy.cycle_shop_mode()
+
+
+def buy_cards(game, reserve=0, skip=(), limit=None):
+    """
+    Buy shop cards, cheapest first, while gold stays at or above `reserve`.
+
+    Returns:
+        int: Cards bought
+    """
+    bought = 0
+    order = sorted((i for i, card in enumerate(game.shop) if card and card["type"] not in skip),
+                   key=lambda i: game.shop[i]["cost"])
+    for i in order:
+        if game.gold - game.shop[i]["cost"] < reserve or bought == limit:
+            break
+        if game.economy.move_to_bench(i):
+            bought += 1
+    return bought
+
+
+def merge_pairs(game, same_type=True):
+    """
+    Merge bench towers of equal tier (and type, if same_type) while gold allows.
+
+    Never pairs different tiers: that's an egrem attempt, which costs gold
+    and can put a Nanite Swarm (enemy spawner) on the bench.
+
+    Returns:
+        int: Merges made
+    """
+    economy = game.economy
+    merges = 0
+    while True:
+        pair = _merge_pair(game, same_type)
+        if pair is None:
+            return merges
+        i, j = pair
+        economy.select_for_merge(i)
+        economy.select_for_merge(j)
+        if not economy.confirm_merge():
+            economy.cancel_merge()
+            return merges
+        merges += 1
+
+
+def _merge_pair(game, same_type):
+    by_key = {}
+    for i, tower in enumerate(game.bench):
+        if tower is None or tower.base_type == "Nanite Swarm":
+            continue
+        tier = tower.get_merge_tier()
+        key = (tower.base_type, tier) if same_type else tier
+        if key in by_key and game.gold >= tier * 20:
+            return by_key[key], i
+        by_key.setdefault(key, i)
+    return None
+
+
+def coverage_scores(game, reach):
+    """
+    Score every empty cell by the number of path cells within Manhattan `reach`.
+
+    Returns:
+        dict: (x, y) -> path cells covered (cells covering none are left out)
+    """
+    path_cells = game.path_index
+    scores = {}
+    for y in range(game.height):
+        row = game.grid[y]
+        for x in range(game.width):
+            if row[x] != '.':
+                continue
+            score = 0
+            for dy in range(-reach, reach + 1):
+                span = reach - abs(dy)
+                for dx in range(-span, span + 1):
+                    if (x + dx, y + dy) in path_cells:
+                        score += 1
+            if score:
+                scores[(x, y)] = score
+    return scores
+
+
+def best_direction(game, tower):
+    """Direction index whose line (up to the tower's range) crosses the most path cells."""
+    reach = max(1, int(min(tower.range, MAX_REACH)))
+
+    def crossed(d):
+        dx, dy = DIRECTIONS[d]
+        return sum(1 for dist in range(1, reach + 1)
+                   if (tower.x + dx * dist, tower.y + dy * dist) in game.path_index)
+
+    return max(range(len(DIRECTIONS)), key=crossed)
+
+
+def place_bench_towers(game, pick_cell):
+    """
+    Place every bench tower (highest tier first) on the cell chosen by pick_cell(tower, scores).
+
+    Returns:
+        int: Towers placed
+    """
+    placed = 0
+    slots = sorted((i for i, t in enumerate(game.bench) if t is not None and t.base_type != "Nanite Swarm"),
+                   key=lambda i: -game.bench[i].get_merge_tier())
+    scores = {}
+    for i in slots:
+        tower = game.bench[i]
+        reach = max(1, int(min(tower.range, MAX_REACH)))
+        if reach not in scores:
+            scores[reach] = coverage_scores(game, reach)
+        cell = pick_cell(tower, scores[reach])
+        if cell is None or not game.economy.place_tower(cell[0], cell[1], i):
+            continue
+        for table in scores.values():
+            table.pop(cell, None)
+        if tower.fire_type in ("Track", "DirectionalBeam"):
+            tower.track_direction = best_direction(game, tower)
+        placed += 1
+    return placed
+
+
+def best_tile_spot(game, tile_data):
+    """
+    Find where a tile extends the path farthest from the start.
+
+    Returns:
+        tuple: (gx, gy, rotation), or None if it fits nowhere
+    """
+    if not game.path:
+        return None
+    (sx, sy), (ex, ey) = game.path[0], game.path[-1]
+    best, best_reach = None, -1
+    for rotation in range(4):
+        for gy in range(ey - 3, ey + 2):
+            for gx in range(ex - 3, ex + 2):
+                if not game.can_place_tile(tile_data, gx, gy, rotation):
+                    continue
+                cells = game._get_tile_path_cells(tile_data, gx, gy, rotation)
+                reach = max(abs(x - sx) + abs(y - sy) for x, y in cells)
+                if reach > best_reach:
+                    best, best_reach = (gx, gy, rotation), reach
+    return best
+
+
+def place_bench_tiles(game):
+    """Place each map tile on the bench where it extends the path farthest. Returns tiles placed."""
+    placed = 0
+    for i, tile_data in enumerate(game.map_tile_bench):
+        if tile_data is None:
+            continue
+        spot = best_tile_spot(game, tile_data)
+        if spot is not None and game.place_tile_from_bench(i, *spot):
+            placed += 1
+    return placed
+
+
+# ----------------------------------------------------------------------
+# Strategies
+# ----------------------------------------------------------------------
+
+class Strategy:
+    """Does nothing: the baseline every other strategy is measured against."""
+
+    name = "idle"
+
+    def __init__(self, rng):
+        """
+        Args:
+            rng: random.Random for this strategy's own choices
+        """
+        self.rng = rng
+
+    def between_waves(self, game):
+        """Make this strategy's moves before the next wave starts."""
+
+
+class RandomStrategy(Strategy):
+    """Buys random cards and drops towers on random cells near the path."""
+
+    name = "random"
+
+    def between_waves(self, game):
+        ensure_shop_mode(game, "towers")
+        for _ in range(self.rng.randint(0, 3)):
+            cards = [i for i, card in enumerate(game.shop) if card and card["cost"] <= game.gold]
+            if not cards:
+                break
+            game.economy.move_to_bench(self.rng.choice(cards))
+        if self.rng.random() < 0.3:
+            merge_pairs(game, same_type=False)
+        place_bench_towers(game, self._pick)
+
+    def _pick(self, tower, scores):
+        return self.rng.choice(list(scores)) if scores else None
+
+
+class GreedyStrategy(Strategy):
+    """Spends everything on towers, merges pure pairs and places for maximum path coverage."""
+
+    name = "greedy"
+    reserve = 0  # Gold kept back for later waves
+
+    def between_waves(self, game):
+        ensure_shop_mode(game, "towers")
+        buy_cards(game, self.reserve, skip=("Nanite Swarm",))
+        merge_pairs(game)
+        place_bench_towers(game, self._pick)
+
+    def _pick(self, tower, scores):
+        if not scores:
+            return None
+        top = max(scores.values())
+        return self.rng.choice([cell for cell, score in scores.items() if score == top])
+
+
+class BuilderStrategy(GreedyStrategy):
+    """Greedy, but first buys a map tile each wave to lengthen the path."""
+
+    name = "builder"
+
+    def between_waves(self, game):
+        ensure_shop_mode(game, "tiles")
+        if not any(game.map_tile_bench):
+            buy_cards(game, reserve=5, skip=("Loop",), limit=1)
+        place_bench_tiles(game)
+        super().between_waves(game)
+
+
+# name -> Strategy subclass
+STRATEGIES = {cls.name: cls for cls in (Strategy, RandomStrategy, GreedyStrategy, BuilderStrategy)}
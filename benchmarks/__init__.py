@@ -0,0 +1 @@
+"""Scenario benchmarks for the simulation and renderer (run with `python -m benchmarks`)."""
@@ -0,0 +1,231 @@
+"""
+Scenario benchmark runner.
+
+Measures WaveManager.update_wave ticks/sec and Renderer.draw frames/sec for
+each scenario in benchmarks/scenarios.py, writes the results to JSON and
+optionally compares them against a stored baseline run.
+
+Usage (from the repo root):
+    python -m benchmarks                              # all scenarios, print results
+    python -m benchmarks --out results.json           # also write JSON
+    python -m benchmarks --baseline benchmarks/baseline.json
+    python -m benchmarks --scenario enemies_2000 --no-render
+
+Rendering uses SDL's dummy video driver, so no window is opened.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from benchmarks.scenarios import SCENARIOS
+
+METRICS = ("ticks_per_sec", "frames_per_sec")
+
+
+def _build(name, seed):
+    return SCENARIOS[name](random.Random(seed))
+
+
+def _tick(game, frame):
+    """One simulation tick, restarting the wave if it cleared so the load stays up."""
+    if not game.wave_active:
+        game.wave_manager.start_next_wave()
+    game.wave_manager.update_wave(frame)
+
+
+def bench_sim(name, ticks, seed=0):
+    """
+    Time `ticks` calls of update_wave on a freshly built scenario.
+
+    Returns:
+        dict: ticks, seconds, ticks_per_sec and entity counts at start/end
+    """
+    game = _build(name, seed)
+    start_enemies = len(game.enemies)
+    start = time.perf_counter()
+    for frame in range(1, ticks + 1):
+        _tick(game, frame)
+    seconds = time.perf_counter() - start
+    return {
+        "ticks": ticks,
+        "seconds": seconds,
+        "ticks_per_sec": ticks / seconds if seconds > 0 else 0.0,
+        "enemies_start": start_enemies,
+        "enemies_end": len(game.enemies),
+        "towers": len(game.towers),
+        "grid": [game.width, game.height],
+        "path": len(game.path),
+    }
+
+
+def bench_render(name, frames, seed=0):
+    """
+    Time `frames` calls of Renderer.draw, ticking the simulation (untimed) between frames.
+
+    Returns:
+        dict: frames, seconds, frames_per_sec
+    """
+    import pygame
+    from ui.renderer import Renderer
+
+    pygame.init()
+    try:
+        game = _build(name, seed)
+        renderer = Renderer(game)
+        renderer.draw(0)  # Warm the caches/atlas so the first build isn't averaged in
+        seconds = 0.0
+        for frame in range(1, frames + 1):
+            _tick(game, frame)
+            start = time.perf_counter()
+            renderer.draw(frame)
+            seconds += time.perf_counter() - start
+    finally:
+        pygame.quit()
+    return {
+        "frames": frames,
+        "seconds": seconds,
+        "frames_per_sec": frames / seconds if seconds > 0 else 0.0,
+    }
+
+
+def run(names, ticks=600, frames=120, repeat=3, render=True, seed=0):
+    """
+    Run each scenario `repeat` times and keep the best throughput of each kind.
+
+    Returns:
+        dict: {"meta": {...}, "scenarios": {name: {"sim": {...}, "render": {...}}}}
+    """
+    results = {}
+    for name in names:
+        sim = max((bench_sim(name, ticks, seed) for _ in range(repeat)), key=lambda r: r["ticks_per_sec"])
+        entry = {"sim": sim}
+        if render:
+            entry["render"] = max((bench_render(name, frames, seed) for _ in range(repeat)),
+                                  key=lambda r: r["frames_per_sec"])
+        results[name] = entry
+    return {"meta": _meta(ticks, frames, repeat, seed), "scenarios": results}
+
+
+def _meta(ticks, frames, repeat, seed):
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ticks": ticks,
+        "frames": frames,
+        "repeat": repeat,
+        "seed": seed,
+    }
+    try:
+        import numpy
+        meta["numpy"] = numpy.__version__
+    except ImportError:
+        meta["numpy"] = None
+    try:
+        import pygame
+        meta["pygame"] = pygame.version.ver
+    except ImportError:
+        meta["pygame"] = None
+    return meta
+
+
+def _metrics(entry):
+    """Flatten one scenario's results to {metric: value}."""
+    out = {}
+    if "sim" in entry:
+        out["ticks_per_sec"] = entry["sim"]["ticks_per_sec"]
+    if "render" in entry:
+        out["frames_per_sec"] = entry["render"]["frames_per_sec"]
+    return out
+
+
+def compare(results, baseline):
+    """
+    Compare a run against a baseline run.
+
+    Args:
+        results: Output of run()
+        baseline: Output of an earlier run() (e.g. loaded from JSON)
+
+    Returns:
+        list: (scenario, metric, baseline value, new value, change) rows for metrics
+        present in both; change is new/baseline - 1 (negative = slower)
+    """
+    rows = []
+    for name, entry in results["scenarios"].items():
+        base_entry = baseline.get("scenarios", {}).get(name)
+        if not base_entry:
+            continue
+        new, old = _metrics(entry), _metrics(base_entry)
+        for metric in METRICS:
+            if metric in new and old.get(metric):
+                rows.append((name, metric, old[metric], new[metric], new[metric] / old[metric] - 1.0))
+    return rows
+
+
+def regressions(rows, tolerance=0.10):
+    """Rows from compare() that are more than `tolerance` slower than the baseline."""
+    return [row for row in rows if row[4] < -tolerance]
+
+
+def print_results(results):
+    print(f"{'scenario':<22}{'ticks/sec':>12}{'frames/sec':>12}  enemies  towers  grid")
+    for name, entry in results["scenarios"].items():
+        sim = entry["sim"]
+        fps = entry.get("render", {}).get("frames_per_sec")
+        fps_text = f"{fps:12.1f}" if fps is not None else f"{'-':>12}"
+        print(f"{name:<22}{sim['ticks_per_sec']:12.1f}{fps_text}  "
+              f"{sim['enemies_start']:>7}  {sim['towers']:>6}  {sim['grid'][0]}x{sim['grid'][1]}")
+
+
+def print_comparison(rows, tolerance=0.10):
+    print(f"\n{'scenario':<22}{'metric':<16}{'baseline':>10}{'now':>10}{'change':>9}")
+    for name, metric, old, new, change in rows:
+        flag = "  REGRESSION" if change < -tolerance else ""
+        print(f"{name:<22}{metric:<16}{old:10.1f}{new:10.1f}{change:+9.1%}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tower Defense 3 scenario benchmarks")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--ticks", type=int, default=600, help="update_wave ticks timed per run")
+    parser.add_argument("--frames", type=int, default=120, help="Renderer.draw frames timed per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for scenario setup and the simulation")
+    parser.add_argument("--no-render", action="store_true", help="Skip the Renderer.draw benchmarks")
+    parser.add_argument("--out", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a JSON file written by --out")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Slowdown vs baseline reported as a regression (default 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    results = run(names, args.ticks, args.frames, args.repeat, not args.no_render, args.seed)
+    print_results(results)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline)
+        print_comparison(rows, args.tolerance)
+        if regressions(rows, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Benchmark scenarios.
+
+Each scenario builds a Game in a known heavy state: many towers, thousands of
+enemies, stacked latches or a huge grid. Builders take a random.Random that
+drives both the setup and the Game's seed, so the same seed always produces
+the same board and the same simulation, and runs stay comparable.
+"""
+
+from core.game import Game
+from core.spawn_queue import SpawnSpec
+from data.tiles import get_tile_types
+from models.assimilator import Assimilator
+from models.enemy import Enemy
+from models.tower import Tower
+
+# Lives high enough that leaks never end a run early
+BENCH_LIVES = 10 ** 9
+
+
+def _bench_game(rng, **kwargs):
+    game = Game(seed=rng.randrange(2 ** 32), **kwargs)
+    game.lives = BENCH_LIVES
+    game.gold = 10 ** 6
+    return game
+
+
+def _free_cells_by_distance(game):
+    """Empty grid cells, nearest to the path first (Manhattan)."""
+    path_cells = set(game.path)
+    cells = [(x, y) for y in range(game.height) for x in range(game.width) if game.grid[y][x] == '.']
+
+    def dist(cell):
+        return min(abs(cell[0] - px) + abs(cell[1] - py) for px, py in path_cells)
+
+    return sorted(cells, key=lambda c: (dist(c), c[1], c[0]))
+
+
+def place_towers(game, count, rng):
+    """
+    Place `count` towers on the free cells nearest the path, cycling through fire types.
+
+    Mixes base towers, merged tiers and the Radius/Beam fire types (which
+    only come from upgrades in play), and puts a resist_2 aura on every
+    tenth tower.
+
+    Returns:
+        list: The towers placed
+    """
+    base_types = [t for t in Tower.BASE_TYPES if Tower.BASE_TYPES[t]["fire_type"] != "Spawner"]
+    variants = [(t, None) for t in base_types] + [("Thermal Regulator", "Radius"), ("Neural Processor", "Beam")]
+    placed = []
+    for i, (gx, gy) in enumerate(_free_cells_by_distance(game)[:count]):
+        tower_type, fire_type = variants[i % len(variants)]
+        tower = Tower(0, 0, tower_type)
+        if fire_type:
+            tower.fire_type = fire_type
+        tower.merge_generation = rng.randint(0, 2)
+        if i % 10 == 9:
+            tower.upgrades.append("resist_2")
+        tower._calculate_stats()
+        game.bench[0] = tower
+        if game.economy.place_tower(gx, gy, 0):
+            placed.append(tower)
+    return placed
+
+
+def extend_path_with_tiles(game, tiles, rng):
+    """
+    Extend the path by placing map tiles at the path end, as a player would.
+
+    Picks, among the tiles that fit next to the path end, one that takes
+    the end farthest from the path start (random among ties), so the path
+    keeps heading outward instead of boxing itself in, and expands the grid
+    whenever a tile lands near an edge.
+
+    Returns:
+        int: Number of tiles placed (fewer than `tiles` if the path boxed itself in)
+    """
+    tile_types = [t for t in get_tile_types(minimal_mode=True) if t["name"] != "Loop"]
+    placed = 0
+    for _ in range(tiles):
+        ex, ey = game.path[-1]
+        options = [(tile, gx, gy, rot)
+                   for tile in tile_types for rot in range(4)
+                   for gx in range(ex - 2, ex + 2) for gy in range(ey - 2, ey + 2)
+                   if game.can_place_tile(tile, gx, gy, rot)]
+        if not options:
+            break
+        sx, sy = game.path[0]
+        rng.shuffle(options)
+        tile, gx, gy, rot = max(options, key=lambda o: _end_distance(game, o, sx, sy))
+        game.place_map_tile(tile, gx, gy, rot)
+        cells = game._get_tile_path_cells(tile, gx, gy, rot)
+        if game.should_expand_map(cells):
+            game.expand_grid(cells)
+        placed += 1
+    return placed
+
+
+def _end_distance(game, option, sx, sy):
+    """Manhattan distance from (sx, sy) to the farthest cell of a candidate tile."""
+    tile, gx, gy, rot = option
+    return max(abs(x - sx) + abs(y - sy) for x, y in game._get_tile_path_cells(tile, gx, gy, rot))
+
+
+def spawn_along_path(game, count, enemy_types, wave_num, rng):
+    """Register `count` enemies spread over the whole path (as if mid-wave)."""
+    for _ in range(count):
+        e = Enemy(game.path, rng.choice(list(enemy_types)), wave_num)
+        e.position_index = rng.randrange(len(game.path) - 1)
+        game.wave_manager.register_enemy(e)
+
+
+def _mid_wave(game, round_num, rng):
+    """Start wave `round_num` with its whole spawn queue already out, spread along the path."""
+    game.round_num = round_num
+    game.wave_manager.start_next_wave()
+    while game.spawn_queue:
+        e = game.wave_manager._build_enemy(*game.spawn_queue.next_spawn())
+        e.position_index = rng.randrange(len(game.path) - 1)
+        game.wave_manager.register_enemy(e)
+
+
+def wave30_mixed_towers(rng):
+    """Wave 30 against 60 towers of every fire type on an 18x14 core."""
+    game = _bench_game(rng, height=14, width=18, min_path_len=40)
+    place_towers(game, 60, rng)
+    _mid_wave(game, 30, rng)
+    return game
+
+
+def enemies_2000(rng):
+    """2,000 live enemies on a path extended by 80 map tiles, topped up by one spawn per tick."""
+    game = _bench_game(rng)
+    extend_path_with_tiles(game, 80, rng)
+    types = ("Drone", "Scout", "Harvester", "Adaptor")
+    game.round_num = 10
+    game.wave_active = True
+    spawn_along_path(game, 2000, types, 10, rng)
+    # Replace leaks roughly as fast as they happen so the count stays near 2,000
+    game.spawn_interval = 1
+    game.spawn_queue.add(SpawnSpec(types, 10, 10 ** 6))
+    return game
+
+
+def latched_40(rng):
+    """40 Assimilators latched onto 8 hybrid walls (stacks of 5), plus towers."""
+    game = _bench_game(rng)
+    place_towers(game, 12, rng)
+    game.round_num = 12
+    game.wave_active = True
+    path_cells = set(game.path)
+    walls = 0
+    for index, (px, py) in enumerate(game.path):
+        if walls == 8:
+            break
+        for wx, wy in ((px, py - 1), (px, py + 1), (px - 1, py), (px + 1, py)):
+            if (0 <= wx < game.width and 0 <= wy < game.height and (wx, wy) not in path_cells
+                    and game.grid[wy][wx] == '.' and not game.board.wall_manager.get_wall(wx, wy)):
+                game.board.add_hybrid_wall(wx, wy, max_integrity=10 ** 6)
+                for _ in range(5):
+                    a = Assimilator(game.path, wave_num=12)
+                    a.position_index = index
+                    game.wave_manager.register_enemy(a)
+                    a.set_game_reference(game)
+                    a.latch_to(wx, wy, 'wall', game.board.wall_manager)
+                walls += 1
+                break
+    return game
+
+
+def grid_120(rng):
+    """A 120x120 grid grown by repeated expand_grid, with a wave running."""
+    game = _bench_game(rng)
+    # Grow 2 cells at a time, alternating sides so west/north shifts are included
+    step = 0
+    while game.width < 120:
+        game.expand_grid([(0 if step % 2 else game.width - 1, game.height // 2)])
+        step += 1
+    while game.height < 120:
+        game.expand_grid([(game.width // 2, 0 if step % 2 else game.height - 1)])
+        step += 1
+    place_towers(game, 20, rng)
+    _mid_wave(game, 10, rng)
+    return game
+
+
+# name -> builder(rng) -> Game
+SCENARIOS = {
+    "wave30_mixed_towers": wave30_mixed_towers,
+    "enemies_2000": enemies_2000,
+    "latched_40": latched_40,
+    "grid_120": grid_120,
+}
@@ -0,0 +1,64 @@
+"""
+Precomputed tower aura fields.
+
+"resist_2" towers slow every enemy within range. Rather than each tower
+walking its diamond every tick, SlowAuraField compiles all of them into a
+per-path-index table of the strongest slow covering that cell. It is only
+rebuilt when the path or the set of aura towers (position, range) changes,
+and each enemy then reads its own entry once per tick.
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AURA_UPGRADE = "resist_2"
+AURA_SLOW_PCT = 30      # Slow applied by a resist_2 aura
+AURA_SLOW_FRAMES = 60   # Refreshed every tick while inside the aura
+
+
+class SlowAuraField:
+    """Max slow % per game.path index (and per cell) from all slow-aura towers."""
+
+    def __init__(self):
+        self.key = None
+        self.by_index = []  # path index -> max slow % (0 = no aura)
+        self.by_cell = {}   # (x, y) -> max slow %, only covered cells
+        self.array = None   # by_index as a NumPy array (when available)
+        self.active = False
+
+    def refresh(self, game):
+        """Rebuild the field if the path or aura towers changed since the last call."""
+        auras = tuple((t.x, t.y, t.range) for t in game.towers if AURA_UPGRADE in t.upgrades)
+        key = (getattr(game, 'path_version', 0), len(game.path), auras)
+        if key == self.key:
+            return
+        self.key = key
+        by_cell = {}
+        by_index = [0] * len(game.path)
+        if auras:
+            for i, (px, py) in enumerate(game.path):
+                for tx, ty, rng in auras:
+                    if abs(px - tx) + abs(py - ty) <= rng:
+                        by_index[i] = AURA_SLOW_PCT
+                        by_cell[(px, py)] = AURA_SLOW_PCT
+                        break
+        self.by_index = by_index
+        self.by_cell = by_cell
+        self.active = bool(by_cell)
+        self.array = np.array(by_index, dtype="f8") if np is not None else None
+
+    def apply(self, game):
+        """Slow every live enemy standing in the field (one lookup per enemy)."""
+        if not self.active:
+            return
+        store = getattr(game, 'enemy_store', None)
+        if store is not None:
+            store.apply_slow_field(self.array, AURA_SLOW_FRAMES)
+            return
+        for e in game.enemies:
+            if e.alive and not e.leaked:
+                amount = self.by_cell.get(e.get_position(), 0)
+                if amount:
+                    e.apply_debuff('slow', amount, AURA_SLOW_FRAMES)
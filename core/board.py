@@ -177,10 +177,7 @@ class BoardManager:
 
     def _get_tower_at(self, x, y):
         """Get tower at the specified position."""
-        for tower in self.game.towers:
-            if tower.x == x and tower.y == y:
-                return tower
-        return None
+        return self.game.get_tower_at(x, y)
 
     def initialize_from_map(self):
         """
@@ -1,4 +1,3 @@
-import random
 from models.tower import Tower
 from data.units import UNIT_TYPES
 from data.tiles import get_tile_types
@@ -10,10 +9,11 @@ class EconomyManager:
         self.game = game
 
     def generate_shop(self):
+        rng = self.game.rng.economy
         for i in range(5):
             if self.game.shop[i] is None:
                 if self.game.shop_mode == "towers":
-                    typ = random.choice([u["name"] for u in UNIT_TYPES])
+                    typ = rng.choice([u["name"] for u in UNIT_TYPES])
                     cost = next(u["base_cost"] for u in UNIT_TYPES if u["name"] == typ)
                     self.game.shop[i] = {"type": typ, "cost": cost}
                 elif self.game.shop_mode == "tiles":
@@ -28,7 +28,7 @@ class EconomyManager:
                         if available_tiles:
                             # Weight rare tiles higher at higher SPL
                             weights = [1.0 + (t.get("unlock_level", 1) - 1) * 0.5 for t in available_tiles]
-                            tile = random.choices(available_tiles, weights=weights, k=1)[0]
+                            tile = rng.choices(available_tiles, weights=weights, k=1)[0]
                             # Scale cost for advanced tiles
                             base_cost = tile["base_cost"]
                             unlock_level = tile.get("unlock_level", 1)
@@ -37,17 +37,28 @@ class EconomyManager:
                         else:
                             # Fallback to basic tiles
                             basic_tiles = [t for t in available_tile_types if t.get("unlock_level", 1) == 1]
-                            tile = random.choice(basic_tiles) if basic_tiles else available_tile_types[0]
+                            tile = rng.choice(basic_tiles) if basic_tiles else available_tile_types[0]
                             self.game.shop[i] = {"type": tile["name"], "cost": tile["base_cost"], "tile_data": tile}
                     else:
                         # Basic tile selection (pre-SPL system)
-                        tile = random.choice(available_tile_types)
+                        tile = rng.choice(available_tile_types)
                         self.game.shop[i] = {"type": tile["name"], "cost": tile["base_cost"], "tile_data": tile}
                 elif self.game.shop_mode == "upgrades":
-                    upgrade_id = random.choice(list(UPGRADE_DEFS.keys()))
+                    upgrade_id = rng.choice(list(UPGRADE_DEFS.keys()))
                     u = UPGRADE_DEFS[upgrade_id]
                     self.game.shop[i] = {"type": upgrade_id, "cost": u["cost"], "name": u["name"], "desc": u["desc"]}
 
+    def cycle_shop_mode(self):
+        """Switch the shop towers -> tiles -> upgrades -> towers and roll a fresh shop."""
+        if self.game.shop_mode == "towers":
+            self.game.shop_mode = "tiles"
+        elif self.game.shop_mode == "tiles":
+            self.game.shop_mode = "upgrades"
+        else:
+            self.game.shop_mode = "towers"
+        self.game.shop = [None] * 5
+        self.generate_shop()
+
     def move_to_bench(self, shop_idx):
         if shop_idx < 0 or shop_idx >= 5 or self.game.shop[shop_idx] is None:
             return False
@@ -304,7 +315,7 @@ class EconomyManager:
         tower = self.game.bench[bench_idx]
         tower.x = gx
         tower.y = gy
-        self.game.towers.append(tower)
+        self.game.add_tower(tower)
         self.game.grid[gy][gx] = tower.base_type[0]
         self.game.bench[bench_idx] = None
         self.game.selected_tower = None
@@ -326,16 +337,16 @@ class EconomyManager:
 
     def sell_tower_from_grid(self, gx, gy):
         """Remove tower at (gx, gy) and refund 60% of gold_invested."""
-        for t in self.game.towers[:]:
-            if t.x == gx and t.y == gy:
-                refund = int(t.gold_invested * 0.6)
-                self.game.gold += refund
-                self.game.towers.remove(t)
-                self.game.grid[gy][gx] = '.'
-                if self.game.upgrade_dialog_tower is t:
-                    self.game.upgrade_dialog_tower = None
-                return True
-        return False
+        t = self.game.get_tower_at(gx, gy)
+        if t is None:
+            return False
+        refund = int(t.gold_invested * 0.6)
+        self.game.gold += refund
+        self.game.remove_tower(t)
+        self.game.grid[gy][gx] = '.'
+        if self.game.upgrade_dialog_tower is t:
+            self.game.upgrade_dialog_tower = None
+        return True
 
     def get_upgrade_choices(self, tower):
         effective = tower.get_effective_traits()
@@ -348,17 +359,18 @@ class EconomyManager:
                 synergy.append(uid)
         wildcard = [k for k in UPGRADE_DEFS if k.startswith("wild") and k not in already]
 
+        rng = self.game.rng.economy
         chosen = []
         if len(synergy) >= 2:
-            chosen = random.sample(synergy, 2)
+            chosen = rng.sample(synergy, 2)
         elif synergy:
             chosen = synergy[:]
         while len(chosen) < 2 and wildcard:
-            pick = random.choice(wildcard)
+            pick = rng.choice(wildcard)
             wildcard.remove(pick)
             chosen.append(pick)
         if wildcard and len(chosen) < 3:
-            chosen.append(random.choice(wildcard))
+            chosen.append(rng.choice(wildcard))
         return chosen[:3]
 
     def apply_upgrade(self, tower, upgrade_id):
@@ -0,0 +1,107 @@
+"""
+Path-progress enemy index.
+
+Enemies only ever sit on game.path, so they can be bucketed by
+position_index and kept in a sorted list of occupied indices. A tower's
+coverage is a handful of path-index intervals, so "all enemies in range"
+and "nearest enemy in range" become bisect lookups over those intervals
+instead of scans over grid cells.
+"""
+
+from bisect import bisect_left, insort
+
+
+class PathEnemyIndex:
+    """Enemies bucketed by absolute path index, with a sorted list of occupied indices."""
+
+    def __init__(self):
+        self.buckets = {}   # path index -> list of enemies at that index
+        self.occupied = []  # sorted path indices with a non-empty bucket
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def add(self, enemy, index):
+        """File an enemy under a path index."""
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            bucket = self.buckets[index] = []
+            insort(self.occupied, index)
+        bucket.append(enemy)
+        enemy.path_slot = index
+
+    def remove(self, enemy):
+        """Take an enemy out of the index (no-op if it isn't filed)."""
+        index = getattr(enemy, 'path_slot', None)
+        if index is None:
+            return
+        bucket = self.buckets.get(index)
+        if bucket is not None and enemy in bucket:
+            bucket.remove(enemy)
+            if not bucket:
+                del self.buckets[index]
+                self.occupied.pop(bisect_left(self.occupied, index))
+        enemy.path_slot = None
+
+    def move(self, enemy, index):
+        """Refile an enemy after its position_index changed (None removes it)."""
+        if getattr(enemy, 'path_slot', None) == index:
+            return
+        self.remove(enemy)
+        if index is not None:
+            self.add(enemy, index)
+
+    def clear(self):
+        self.buckets.clear()
+        self.occupied.clear()
+
+    def all_in(self, intervals):
+        """
+        Get every live enemy whose path index falls in the given intervals.
+
+        Args:
+            intervals: Sorted (lo, hi) inclusive path-index ranges
+
+        Returns:
+            list: Enemies in path order
+        """
+        found = []
+        occupied = self.occupied
+        for lo, hi in intervals:
+            i = bisect_left(occupied, lo)
+            while i < len(occupied) and occupied[i] <= hi:
+                for e in self.buckets[occupied[i]]:
+                    if e.alive and not e.leaked:
+                        found.append(e)
+                i += 1
+        return found
+
+    def nearest_in(self, intervals, path, x, y):
+        """
+        Get the live enemy nearest (Manhattan) to (x, y) within the given intervals.
+
+        Ties go to the cell a row-major scan of the range diamond reaches
+        first (smaller dy, then smaller dx), then to the enemy filed first.
+
+        Args:
+            intervals: Sorted (lo, hi) inclusive path-index ranges
+            path: The path the indices refer to (game.path)
+            x, y: Grid position to measure from
+
+        Returns:
+            Enemy or None
+        """
+        best = best_key = None
+        occupied = self.occupied
+        for lo, hi in intervals:
+            i = bisect_left(occupied, lo)
+            while i < len(occupied) and occupied[i] <= hi:
+                px, py = path[occupied[i]]
+                key = (abs(px - x) + abs(py - y), py - y, px - x)
+                if best_key is None or key < best_key:
+                    for e in self.buckets[occupied[i]]:
+                        if e.alive and not e.leaked:
+                            best, best_key = e, key
+                            break
+                i += 1
+        return best
@@ -1,7 +1,7 @@
-import random
 from enum import Enum
 from models.enemy import Enemy
 from models.tower import Tower
+from models.enemy_store import EnemyStore, NUMPY_AVAILABLE
 from map.path_graph import PathGraph
 from data.tiles import TILE_TYPES
 from data.units import UNIT_TYPES, TOWER_TRAITS
@@ -12,6 +12,11 @@ from config import log_debug
 from .economy import EconomyManager
 from .wave_manager import WaveManager
 from .board import BoardManager
+from .enemy_index import PathEnemyIndex
+from .spawn_queue import SpawnQueue
+from .auras import SlowAuraField
+from .profiler import FrameProfiler
+from .rng import GameRNG
 
 
 class Direction(Enum):
@@ -22,8 +27,12 @@ class Direction(Enum):
 
 
 class Game:
-    def __init__(self, height=6, width=10, min_path_len=20, web_mode=False, minimal_mode=False):
-        log_debug("Game.__init__ start", {"height": height, "width": width, "web_mode": web_mode, "minimal_mode": minimal_mode}, location="game.py")
+    def __init__(self, height=6, width=10, min_path_len=20, web_mode=False, minimal_mode=False, headless=False, seed=None):
+        log_debug("Game.__init__ start", {"height": height, "width": width, "web_mode": web_mode, "minimal_mode": minimal_mode, "headless": headless, "seed": seed}, location="game.py")
+
+        # Seeded sim/economy/map/visual streams; every random call goes through one (see core/rng.py)
+        self.rng = GameRNG(seed)
+        self.seed = self.rng.seed
 
         # Core playable area (center of expanded grid)
         self.core_height = height
@@ -40,14 +49,22 @@ class Game:
         self.path_graph = PathGraph()
         log_debug("PathGraph initialized", location="game.py")
 
-        self.path_gen = PathGenerator(self.core_height, self.core_width)
+        self.path_gen = PathGenerator(self.core_height, self.core_width, rng=self.rng.map)
         log_debug("PathGenerator initialized", location="game.py")
 
+        self.path_version = 0  # Bumped whenever path cells change; keys tower coverage caches
+        self.path_index = {}   # (x, y) -> first index of that cell in self.path
+
         self.regenerate_map(min_path_len)
         log_debug("Map regenerated", location="game.py")
         self.enemies = []
         self.enemy_grid = [[[] for _ in range(self.width)] for _ in range(self.height)]
+        self.enemy_index = PathEnemyIndex()  # Enemies by path index, for range queries
+        # Struct-of-arrays enemy fields for batched move/damage (None without NumPy)
+        self.enemy_store = EnemyStore(self.path) if NUMPY_AVAILABLE else None
         self.towers = []
+        self.tower_index = {}  # (x, y) -> Tower for placed towers; see get_tower_at
+        self.slow_aura = SlowAuraField()  # resist_2 slow per path cell
         self.gold = 50
         self.lives = 20
         self.round_num = 1
@@ -70,9 +87,12 @@ class Game:
         self.game_over = False
         self.final_wave = 1
         self.final_gold = 50
-        self.spawn_queue = []
+        self.enemies_killed = 0  # Running totals, for stats (see balance/)
+        self.enemies_leaked = 0
+        self.spawn_queue = SpawnQueue(self.rng.sim)  # Lazy SpawnSpec runs for the current wave
         self.spawn_timer = 0
         self.spawn_interval = 30
+        self.profiler = FrameProfiler()  # Off unless toggled (F3); see core/profiler.py
         self.wave_bonus_text = ""
         self.wave_bonus_show_until = 0
         self.upgrade_dialog_tower = None  # Tower on grid when upgrade dialog is open
@@ -86,9 +106,11 @@ class Game:
         self.egrem_flash_until = 0    # frame when flash ends
         self.egrem_flash_bench_idx = None
         self.auto_mode = False  # Auto wave toggle
+        self.sim_speed = 1  # Fast-forward multiplier (1/2/4/8, 0 = max); see core.timestep
         self.shop_mode = "towers"  # "towers" or "tiles"
         self.web_mode = web_mode  # Flag for reduced load in browser
         self.minimal_mode = minimal_mode  # True = reduced features for debugging/performance
+        self.headless = headless  # True = no renderer/display; visual effects are off
 
         # Shop Power Level and XP system (disabled in minimal mode)
         if not minimal_mode:
@@ -109,15 +131,20 @@ class Game:
         log_debug("Enemy base_xp initialized", location="game.py")
 
         # Check for pygame availability (pygbag compatibility)
+        # Headless runs never draw, so skip the import entirely
         log_debug("Checking pygame availability", location="game.py")
-        try:
-            import pygame
-            self.pygame_available = True
-            log_debug("Pygame available", location="game.py")
-        except ImportError:
+        if headless:
             self.pygame_available = False
-            log_debug("Pygame not available", location="game.py")
-            print("Warning: Pygame not available, visual effects will be disabled")
+            log_debug("Headless mode, skipping pygame", location="game.py")
+        else:
+            try:
+                import pygame
+                self.pygame_available = True
+                log_debug("Pygame available", location="game.py")
+            except ImportError:
+                self.pygame_available = False
+                log_debug("Pygame not available", location="game.py")
+                print("Warning: Pygame not available, visual effects will be disabled")
 
         # Initialize managers
         log_debug("Initializing managers", location="game.py")
@@ -168,7 +195,9 @@ class Game:
                 self.grid[y][x] = 'P'  # Mark as path cell
 
         # Keep backward compatibility - compute ordered path
-        self.path = self.path_graph.get_ordered_path()
+        # (a copy: the graph extends its cached list in place)
+        self.path = list(self.path_graph.get_ordered_path())
+        self.reindex_path()
 
     # ------------------------------------------------------------------
     # Tile placement helpers
@@ -333,25 +362,24 @@ class Game:
 
         tile_placement_log("place_map_tile_ordered", {"ordered": ordered, "path_end": map_end, "new_end": exit_cell})
 
-        # Update PathGraph with new tiles
-        for pos in ordered:
-            self.path_graph.add_node(pos)
-        for i in range(len(ordered) - 1):
-            self.path_graph.add_edge(ordered[i], ordered[i+1])
-        if ordered and self.path:
-            self.path_graph.add_edge(self.path[-1], ordered[0])
-
-        # Update path end so BFS computes the full extended path
-        new_end = ordered[-1] if ordered else (exit_cell or map_end)
-        if new_end is not None:
-            self.path_graph.set_end(new_end)
-
-        # Recompute ordered path (start to new end)
-        # Mutate in place so enemies/spawn_queue (which hold path refs) see the update
-        new_path = self.path_graph.get_ordered_path()
-        self.path.clear()
-        self.path.extend(new_path)
-        tile_placement_log("place_map_tile_path_updated", {"new_path_length": len(self.path), "new_end": new_end})
+        # Update PathGraph with new tiles: chain path end -> ordered tile cells
+        # Mutate self.path in place so enemies (which hold path refs) see the update
+        if self.path_graph.extend_path(ordered):
+            # Pure extension at the end: existing indices are unchanged
+            start = len(self.path)
+            self.path.extend(ordered)
+            for i, pos in enumerate(ordered, start):
+                self.path_index.setdefault(pos, i)
+            self.path_version += 1
+        else:
+            new_path = self.path_graph.get_ordered_path()
+            self.path[:] = new_path
+            self.reindex_path()
+            # Indices may now name other cells: refile every enemy on the field
+            for e in self.enemies:
+                if e.alive and not e.leaked:
+                    self.wave_manager._sync_enemy_cell(e)
+        tile_placement_log("place_map_tile_path_updated", {"new_path_length": len(self.path), "new_end": self.path_graph.end})
 
         # Mark grid cells
         for dy in range(tile_h):
@@ -362,6 +390,30 @@ class Game:
                     self.grid[gy + dy][gx + dx] = 'X'  # expanded non-path
         tile_placement_log("place_map_tile_DONE")
 
+    def place_tile_from_bench(self, bench_idx, gx, gy, rotation):
+        """
+        Place the map tile from map_tile_bench[bench_idx], expanding the grid if it lands near an edge.
+
+        Returns:
+            bool: True if the tile was placed (and removed from the bench)
+        """
+        tile_data = self.map_tile_bench[bench_idx] if 0 <= bench_idx < len(self.map_tile_bench) else None
+        if not tile_data or not self.can_place_tile(tile_data, gx, gy, rotation):
+            return False
+        self.place_map_tile(tile_data, gx, gy, rotation)
+
+        # Check if expansion needed
+        tile_cells = self._get_tile_path_cells(tile_data, gx, gy, rotation)
+        if self.should_expand_map(tile_cells):
+            self.expand_grid(tile_cells)
+
+        # Remove tile from bench
+        self.map_tile_bench[bench_idx] = None
+        if self.selected_map_tile == bench_idx:
+            self.selected_map_tile = None
+            self.selected_tile_rotation = 0
+        return True
+
     def should_expand_map(self, tile_cells):
         """Check if tile placement should trigger map expansion."""
         for tx, ty in tile_cells:
@@ -396,30 +448,97 @@ class Game:
 
         # Update coordinates if expanding west/north
         if expand_west or expand_north:
-            # Mutate path in place so enemies/spawn_queue (which hold path refs) see the update
+            # Mutate path in place so enemies (which hold path refs) see the update
             for i in range(len(self.path)):
                 x, y = self.path[i]
                 self.path[i] = (x + offset_x, y + offset_y)
 
-            # Update path graph
-            self.path_graph = PathGraph()
-            for pos in self.path:
-                self.path_graph.add_node(pos)
-            for i in range(len(self.path) - 1):
-                self.path_graph.add_edge(self.path[i], self.path[i+1])
-            if self.path:
-                self.path_graph.set_end(self.path[-1])
+            # Shift the path graph (and its cached path) with the grid
+            self.path_graph.translate(offset_x, offset_y)
 
             # Update towers
             for tower in self.towers:
                 tower.x += offset_x
                 tower.y += offset_y
+            self.rebuild_tower_index()
+
+            # Enemy cells moved with the copied enemy_grid lists
+            for e in self.enemies:
+                if e.grid_cell is not None:
+                    e.grid_cell = (e.grid_cell[0] + offset_x, e.grid_cell[1] + offset_y)
 
         # Update grid references
         self.grid = new_grid
         self.enemy_grid = new_enemy_grid
         self.width = new_width
         self.height = new_height
+        self.reindex_path()
+
+    # ------------------------------------------------------------------
+    # Path position index
+    # ------------------------------------------------------------------
+
+    def reindex_path(self):
+        """Rebuild path_index from self.path and bump path_version."""
+        index = {}
+        for i, pos in enumerate(self.path):
+            index.setdefault(pos, i)
+        self.path_index = index
+        self.path_version += 1
+
+    def closest_path_index(self, x, y):
+        """
+        Get the path index nearest (Manhattan) to a grid position.
+
+        Searches outward ring by ring through path_index; ties go to the
+        earliest index, as a min() over the path would.
+
+        Returns:
+            int or None: Path index, or None if the path is empty
+        """
+        if not self.path_index:
+            return None
+        if (x, y) in self.path_index:
+            return self.path_index[(x, y)]
+        for r in range(1, self.width + self.height + abs(x) + abs(y) + 1):
+            best = None
+            for dx in range(-r, r + 1):
+                dy = r - abs(dx)
+                for cell in ((x + dx, y + dy), (x + dx, y - dy)):
+                    i = self.path_index.get(cell)
+                    if i is not None and (best is None or i < best):
+                        best = i
+            if best is not None:
+                return best
+        return None
+
+    # ------------------------------------------------------------------
+    # Tower position index
+    # ------------------------------------------------------------------
+
+    def add_tower(self, tower):
+        """Place a tower on the grid (list + position index)."""
+        self.towers.append(tower)
+        self.tower_index[(tower.x, tower.y)] = tower
+
+    def remove_tower(self, tower):
+        """Take a tower off the grid (list + position index)."""
+        self.towers.remove(tower)
+        if self.tower_index.get((tower.x, tower.y)) is tower:
+            del self.tower_index[(tower.x, tower.y)]
+
+    def rebuild_tower_index(self):
+        """Rebuild tower_index from self.towers (after towers move, e.g. expand_grid)."""
+        self.tower_index = {(t.x, t.y): t for t in self.towers}
+
+    def get_tower_at(self, x, y):
+        """
+        Get the placed tower at a grid position.
+
+        Returns:
+            Tower or None
+        """
+        return self.tower_index.get((x, y))
 
     def check_spl_level_up(self):
         """Check for SPL level up based on current XP."""
@@ -0,0 +1,94 @@
+"""
+Headless simulation runner.
+
+Drives Game + WaveManager.update_wave with no Renderer, EventHandler or
+pygame display so waves can be soak/balance tested at full CPU speed.
+Nothing in here (or in the modules it pulls in) imports from ui/.
+"""
+
+import time
+
+
+class HeadlessRunner:
+    """Runs waves back-to-back as fast as the CPU allows."""
+
+    def __init__(self, game, max_ticks_per_wave=36000):
+        self.game = game
+        self.max_ticks_per_wave = max_ticks_per_wave  # Safety cap (10 min of game time at 60 Hz)
+        self.frame = 0
+        self.ticks = 0
+        self.elapsed = 0.0
+        self.waves_completed = 0
+
+    def run_wave(self):
+        """
+        Start the next wave and tick it until it clears or the game ends.
+
+        Returns:
+            int: Number of simulation ticks the wave took
+        """
+        game = self.game
+        if game.game_over:
+            return 0
+
+        game.paused = False
+        game.wave_manager.start_next_wave()
+        start_round = game.round_num
+        wave_ticks = 0
+        start = time.perf_counter()
+
+        while game.wave_active and not game.game_over:
+            self.frame += 1
+            game.wave_manager.update_wave(self.frame)
+            wave_ticks += 1
+            if self.max_ticks_per_wave and wave_ticks >= self.max_ticks_per_wave:
+                break
+
+        self.elapsed += time.perf_counter() - start
+        self.ticks += wave_ticks
+        if game.round_num > start_round:
+            self.waves_completed += 1
+        return wave_ticks
+
+    def run(self, waves):
+        """
+        Run up to `waves` waves, stopping early on game over.
+
+        Returns:
+            dict: Final stats (see get_stats)
+        """
+        for _ in range(waves):
+            if self.game.game_over:
+                break
+            self.run_wave()
+        return self.get_stats()
+
+    def get_stats(self):
+        """Get throughput and final game state."""
+        game = self.game
+        return {
+            "seed": game.seed,
+            "ticks": self.ticks,
+            "elapsed": self.elapsed,
+            "ticks_per_sec": self.ticks / self.elapsed if self.elapsed > 0 else 0.0,
+            "waves_completed": self.waves_completed,
+            "round_num": game.round_num,
+            "lives": game.lives,
+            "gold": game.gold,
+            "towers": len(game.towers),
+            "enemies": len(game.enemies),
+            "game_over": game.game_over,
+        }
+
+    def print_report(self):
+        """Print ticks/sec and the final state to stdout."""
+        stats = self.get_stats()
+        print(f"Seed:       {stats['seed']}")
+        print(f"Ticks:      {stats['ticks']} in {stats['elapsed']:.3f}s "
+              f"({stats['ticks_per_sec']:.0f} ticks/sec)")
+        print(f"Waves:      {stats['waves_completed']} completed, now on wave {stats['round_num']}")
+        print(f"Lives:      {stats['lives']}")
+        print(f"Gold:       {stats['gold']}")
+        print(f"Towers:     {stats['towers']}")
+        print(f"Enemies:    {stats['enemies']}")
+        print(f"Game over:  {stats['game_over']}")
@@ -0,0 +1,168 @@
+"""
+Frame profiler.
+
+Collects rolling per-section timings (avg / p95 / max over the last
+`window` samples) for event handling, each stage of
+WaveManager.update_wave and each Renderer._draw_* method, plus entity
+counts, for the F3 overlay and the F4 JSON dump.
+
+Disabled, it costs one `if` per update_wave stage: update_wave only laps
+when `enabled` is set, and the event/draw methods are wrapped by
+instrument() on enable and unwrapped again on disable, so the
+uninstrumented methods run untouched.
+"""
+
+import json
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """Rolling timings per named section."""
+
+    def __init__(self, window=120):
+        """
+        Args:
+            window: Samples kept per section for the rolling stats
+        """
+        self.window = window
+        self.enabled = False
+        self.samples = {}        # section name -> deque of ms
+        self._lap_start = None
+        self._instrumented = []  # (obj, method name) wrapped by instrument()
+
+    def record(self, name, ms):
+        """Add one timing sample (milliseconds) for a section."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(ms)
+
+    def begin_laps(self):
+        """Start timing a run of consecutive stages (see lap)."""
+        self._lap_start = time.perf_counter()
+
+    def lap(self, name):
+        """Record the time since the previous lap/begin_laps under `name`."""
+        now = time.perf_counter()
+        self.record(name, (now - self._lap_start) * 1000.0)
+        self._lap_start = now
+
+    def instrument(self, obj, sections):
+        """
+        Time calls to methods of obj by shadowing them with wrappers on the instance.
+
+        Args:
+            obj: Instance whose methods to time
+            sections: Method name -> section name
+        """
+        for name, section in sections.items():
+            setattr(obj, name, self._timed(section, getattr(obj, name)))
+            self._instrumented.append((obj, name))
+
+    def _timed(self, section, method):
+        perf_counter = time.perf_counter
+        record = self.record
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                record(section, (perf_counter() - start) * 1000.0)
+
+        return timed
+
+    def uninstrument(self):
+        """Remove every wrapper added by instrument()."""
+        for obj, name in self._instrumented:
+            obj.__dict__.pop(name, None)
+        self._instrumented = []
+
+    def enable(self, handler=None, renderer=None):
+        """
+        Start profiling.
+
+        Args:
+            handler: EventHandler whose handle_events to time
+            renderer: Renderer whose _draw_* methods to time
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        if handler is not None:
+            self.instrument(handler, {"handle_events": "events"})
+        if renderer is not None:
+            sections = {"draw": "draw"}
+            for name in dir(type(renderer)):
+                if name.startswith("_draw_"):
+                    sections[name] = "draw." + name[len("_draw_"):]
+            self.instrument(renderer, sections)
+
+    def disable(self):
+        """Stop profiling and restore the original methods (samples are kept)."""
+        self.enabled = False
+        self.uninstrument()
+
+    def toggle(self, handler=None, renderer=None):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable(handler, renderer)
+        return self.enabled
+
+    def clear(self):
+        self.samples.clear()
+
+    def stats(self):
+        """
+        Get rolling stats per section.
+
+        Returns:
+            dict: name -> {"avg": ms, "p95": ms, "max": ms, "n": samples}
+        """
+        out = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            n = len(ordered)
+            out[name] = {
+                "avg": sum(ordered) / n,
+                "p95": ordered[min(n - 1, int(n * 0.95))],
+                "max": ordered[-1],
+                "n": n,
+            }
+        return out
+
+    @staticmethod
+    def entity_counts(game, renderer=None):
+        """Counts worth watching next to the timings."""
+        counts = {
+            "enemies": len(game.enemies),
+            "towers": len(game.towers),
+            "path": len(game.path),
+            "queued": len(game.spawn_queue),
+            "latched": sum(1 for e in game.enemies if getattr(e, 'is_latched', False)),
+        }
+        if renderer is not None:
+            counts["particles"] = len(renderer.swarm_fx.particles)
+        return counts
+
+    def dump(self, path, game=None, renderer=None):
+        """
+        Write the current stats (and entity counts) to a JSON file.
+
+        Returns:
+            str: The path written
+        """
+        data = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "window": self.window,
+            "sections": self.stats(),
+        }
+        if game is not None:
+            data["counts"] = self.entity_counts(game, renderer)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        return path
@@ -0,0 +1,332 @@
+"""
+Input replay: record game-affecting actions and play them back headlessly.
+
+EventHandler reports every action that changes game state (shop buys,
+merges, placements, tile placements, upgrades, wave/pause/auto toggles...)
+to a ReplayRecorder, keyed by the simulation tick it happened on. Together
+with the game's seed (see core/rng.py) that is enough to reproduce the
+whole game: ReplayPlayer rebuilds the Game from the seed and feeds the
+actions back through the same Game/EconomyManager calls, with no display,
+at full CPU speed.
+
+File format (all integers are LEB128 varints, signed ones zigzag-encoded):
+
+    header   b"TDRP", version byte, flags byte (bit 0 minimal, bit 1 web), seed
+    record   tick delta from the previous record, action code byte, args...
+
+The argument count is fixed per action (see ACTIONS), so a typical record
+is 2-5 bytes.
+"""
+
+import time
+
+MAGIC = b"TDRP"
+VERSION = 1
+
+FLAG_MINIMAL = 1
+FLAG_WEB = 2
+
+# Action name -> (code, argument count)
+ACTIONS = {
+    "buy": (1, 1),              # shop slot
+    "reroll": (2, 0),
+    "cycle_shop_mode": (3, 0),
+    "select_bench": (4, 1),     # bench slot (merge selection / placement pick)
+    "confirm_merge": (5, 0),
+    "complete_egrem": (6, 0),
+    "cancel_merge": (7, 0),
+    "place_tower": (8, 3),      # gx, gy, bench slot
+    "place_tile": (9, 4),       # map tile bench slot, gx, gy, rotation
+    "sell_bench": (10, 1),      # bench slot
+    "sell_tower": (11, 2),      # gx, gy
+    "apply_upgrade": (12, 3),   # gx, gy, upgrade bench slot
+    "inspect_tower": (13, 2),   # gx, gy (rolls the upgrade dialog choices)
+    "track_direction": (14, 3), # gx, gy, direction
+    "start_wave": (15, 0),
+    "pause": (16, 1),           # new paused state
+    "auto": (17, 1),            # new auto_mode state
+}
+ACTION_NAMES = {code: name for name, (code, _) in ACTIONS.items()}
+
+
+class ReplayError(ValueError):
+    """Raised for files that aren't replays or are truncated/corrupt."""
+
+
+# ----------------------------------------------------------------------
+# Varint encoding
+# ----------------------------------------------------------------------
+
+def _write_uvarint(out, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _write_svarint(out, value):
+    # Zigzag: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ... (works for any int size)
+    _write_uvarint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def _read_uvarint(data, pos):
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("Truncated replay")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+def _read_svarint(data, pos):
+    value, pos = _read_uvarint(data, pos)
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1), pos
+
+
+# ----------------------------------------------------------------------
+# Replay data
+# ----------------------------------------------------------------------
+
+class Replay:
+    """A recorded game: how to rebuild it, plus its (tick, action, args) list."""
+
+    def __init__(self, seed, minimal_mode=False, web_mode=False, actions=None):
+        self.seed = seed
+        self.minimal_mode = minimal_mode
+        self.web_mode = web_mode
+        self.actions = actions if actions is not None else []
+
+    def header_bytes(self):
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        out.append((FLAG_MINIMAL if self.minimal_mode else 0) | (FLAG_WEB if self.web_mode else 0))
+        _write_svarint(out, self.seed)
+        return bytes(out)
+
+    def to_bytes(self):
+        out = bytearray(self.header_bytes())
+        last_tick = 0
+        for tick, name, args in self.actions:
+            last_tick = encode_action(out, last_tick, tick, name, args)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != MAGIC:
+            raise ReplayError("Not a replay file")
+        if len(data) < 6 or data[4] != VERSION:
+            raise ReplayError(f"Unsupported replay version: {data[4] if len(data) > 4 else None}")
+        flags = data[5]
+        seed, pos = _read_svarint(data, 6)
+        actions = []
+        tick = 0
+        while pos < len(data):
+            delta, pos = _read_uvarint(data, pos)
+            tick += delta
+            if pos >= len(data):
+                raise ReplayError("Truncated replay")
+            name = ACTION_NAMES.get(data[pos])
+            if name is None:
+                raise ReplayError(f"Unknown action code {data[pos]} at byte {pos}")
+            pos += 1
+            args = []
+            for _ in range(ACTIONS[name][1]):
+                value, pos = _read_svarint(data, pos)
+                args.append(value)
+            actions.append((tick, name, tuple(args)))
+        return cls(seed, bool(flags & FLAG_MINIMAL), bool(flags & FLAG_WEB), actions)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+def encode_action(out, last_tick, tick, name, args):
+    """
+    Append one record to `out`.
+
+    Returns:
+        int: `tick`, to pass as last_tick for the next record
+    """
+    code, argc = ACTIONS[name]
+    if len(args) != argc:
+        raise ValueError(f"{name} takes {argc} args, got {len(args)}")
+    if tick < last_tick:
+        raise ValueError(f"Tick {tick} is before the previous record ({last_tick})")
+    _write_uvarint(out, tick - last_tick)
+    out.append(code)
+    for value in args:
+        _write_svarint(out, int(value))
+    return tick
+
+
+class ReplayRecorder:
+    """Streams actions to a replay file as they happen (so a crash still leaves a usable log)."""
+
+    def __init__(self, path, game):
+        """
+        Args:
+            path: Replay file to (over)write
+            game: Game being recorded (its seed and mode flags go in the header)
+        """
+        self.path = path
+        self.replay = Replay(game.seed, game.minimal_mode, game.web_mode)
+        self._file = open(path, "wb")
+        self._file.write(self.replay.header_bytes())
+        self._last_tick = 0
+        self.count = 0
+
+    def record(self, tick, name, *args):
+        """Log one action issued at simulation tick `tick`."""
+        out = bytearray()
+        self._last_tick = encode_action(out, self._last_tick, tick, name, args)
+        self._file.write(out)
+        self._file.flush()
+        self.replay.actions.append((tick, name, tuple(args)))
+        self.count += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+# ----------------------------------------------------------------------
+# Playback
+# ----------------------------------------------------------------------
+
+def apply_action(game, tick, name, args):
+    """Perform one recorded action on `game`, through the same calls EventHandler makes."""
+    economy = game.economy
+    if name == "buy":
+        economy.move_to_bench(args[0])
+    elif name == "reroll":
+        economy.reroll_shop()
+    elif name == "cycle_shop_mode":
+        economy.cycle_shop_mode()
+    elif name == "select_bench":
+        economy.select_for_merge(args[0], tick)
+    elif name == "confirm_merge":
+        economy.confirm_merge()
+    elif name == "complete_egrem":
+        economy._complete_egrem()
+    elif name == "cancel_merge":
+        economy.cancel_merge()
+    elif name == "place_tower":
+        economy.place_tower(*args)
+    elif name == "place_tile":
+        game.place_tile_from_bench(*args)
+    elif name == "sell_bench":
+        economy.sell_from_bench(args[0])
+    elif name == "sell_tower":
+        economy.sell_tower_from_grid(*args)
+    elif name == "apply_upgrade":
+        gx, gy, slot = args
+        tower = game.get_tower_at(gx, gy)
+        if tower is not None:
+            economy.apply_upgrade_from_bench(tower, game.upgrade_bench[slot], slot)
+    elif name == "inspect_tower":
+        tower = game.get_tower_at(*args)
+        if tower is not None:
+            economy.get_upgrade_choices(tower)
+    elif name == "track_direction":
+        gx, gy, direction = args
+        tower = game.get_tower_at(gx, gy)
+        if tower is not None:
+            tower.track_direction = direction
+    elif name == "start_wave":
+        game.wave_manager.start_next_wave()
+    elif name == "pause":
+        game.paused = bool(args[0])
+    elif name == "auto":
+        game.auto_mode = bool(args[0])
+
+
+class ReplayPlayer:
+    """Replays a recording headlessly, as fast as the CPU allows."""
+
+    def __init__(self, replay, tail_ticks=36000):
+        """
+        Args:
+            replay: Replay to play
+            tail_ticks: Max ticks to keep simulating after the last action
+                while a wave is still running (0 = stop at the last action)
+        """
+        from core.game import Game
+
+        self.replay = replay
+        self.tail_ticks = tail_ticks
+        self.game = Game(minimal_mode=replay.minimal_mode, web_mode=replay.web_mode,
+                         headless=True, seed=replay.seed)
+        self.frame = 0
+        self.actions_applied = 0
+        self.elapsed = 0.0
+
+    def run(self):
+        """
+        Play the whole replay, mirroring main.py's loop: actions issued at
+        tick T run before simulation tick T + 1.
+
+        Returns:
+            dict: Final stats (see get_stats)
+        """
+        game = self.game
+        actions = self.replay.actions
+        end = (actions[-1][0] if actions else 0)
+        i = 0
+        start = time.perf_counter()
+        while not game.game_over:
+            while i < len(actions) and actions[i][0] <= self.frame:
+                tick, name, args = actions[i]
+                apply_action(game, tick, name, args)
+                i += 1
+            if i >= len(actions) and (not game.wave_active or game.paused
+                                      or self.frame >= end + self.tail_ticks):
+                break
+            self.frame += 1
+            if not game.paused:
+                game.wave_manager.update_wave(self.frame)
+        self.actions_applied = i
+        self.elapsed = time.perf_counter() - start
+        return self.get_stats()
+
+    def get_stats(self):
+        game = self.game
+        return {
+            "seed": game.seed,
+            "ticks": self.frame,
+            "actions": self.actions_applied,
+            "elapsed": self.elapsed,
+            "ticks_per_sec": self.frame / self.elapsed if self.elapsed > 0 else 0.0,
+            "round_num": game.round_num,
+            "lives": game.lives,
+            "gold": game.gold,
+            "towers": len(game.towers),
+            "enemies": len(game.enemies),
+            "game_over": game.game_over,
+        }
+
+    def print_report(self):
+        stats = self.get_stats()
+        print(f"Seed:       {stats['seed']}")
+        print(f"Actions:    {stats['actions']} of {len(self.replay.actions)}")
+        print(f"Ticks:      {stats['ticks']} in {stats['elapsed']:.3f}s "
+              f"({stats['ticks_per_sec']:.0f} ticks/sec)")
+        print(f"Wave:       {stats['round_num']}")
+        print(f"Lives:      {stats['lives']}")
+        print(f"Gold:       {stats['gold']}")
+        print(f"Towers:     {stats['towers']}")
+        print(f"Enemies:    {stats['enemies']}")
+        print(f"Game over:  {stats['game_over']}")
@@ -0,0 +1,446 @@
+"""
+Binary save/load snapshots of a whole Game.
+
+capture() walks the game into plain Python data (no custom classes): the
+grid, path and PathGraph, towers (upgrades, heat, cooldowns, lineage),
+enemies mid-wave, the spawn queue, walls and latches, benches and shop,
+every economy counter and the state of each RNG stream. restore() builds
+a Game from that data which ticks on exactly as the original would have,
+including the order enemies sit in enemy_index buckets and enemy_grid
+cells (tower targeting depends on it).
+
+Enemy hot fields (the EnemyStore columns) are saved column-wise as packed
+native arrays, so a field of thousands of enemies costs a few bytes per
+enemy per field and loads without a per-value decode.
+
+File format:
+
+    header   b"TDSV", version byte
+    payload  zlib-compressed pickle of the captured state
+
+The payload holds only builtin types, and load refuses any pickle that
+references a class or function, so a snapshot file can't run code.
+
+Autosaver writes a snapshot each time a wave is cleared. The capture and
+pickling block the game loop (a few hundred microseconds between waves,
+and it has to see one consistent tick); only compression and the disk
+write run on a background thread.
+"""
+
+import io
+import os
+import pickle
+import queue
+import threading
+import zlib
+from array import array
+from collections import deque
+
+from core.game import Game
+from core.spawn_queue import SpawnSpec
+from map.path_graph import PathGraph
+from models.assimilator import Assimilator
+from models.enemy import Enemy
+from models.enemy_store import EnemyStore
+from models.path_wall import PathWall
+from models.tower import Tower
+
+MAGIC = b"TDSV"
+VERSION = 1
+
+# zlib level: 1 is several times faster than the default for ~10% larger files
+COMPRESS_LEVEL = 1
+
+# Game attributes saved as-is (all plain values)
+GAME_FIELDS = (
+    "gold", "lives", "round_num", "wave_active", "paused", "reroll_cost",
+    "game_over", "final_wave", "final_gold", "enemies_killed", "enemies_leaked",
+    "spawn_timer", "spawn_interval",
+    "wave_bonus_text", "wave_bonus_show_until", "auto_mode", "sim_speed", "shop_mode",
+    "current_merge_cost", "egrem_preview", "egrem_consecutive", "egrem_combo",
+    "egrem_total_spent", "egrem_flash_until", "egrem_flash_bench_idx",
+    "selected_tower", "selected_map_tile", "selected_upgrade", "selected_tile_rotation",
+    "merge_tower_1", "merge_tower_2", "upgrade_dialog_choices",
+    # Full mode only
+    "shop_power_level", "xp", "xp_to_next", "spl_max",
+)
+
+# Object attributes that are references or caches, rebuilt on restore
+_SKIP_ATTRS = frozenset((
+    "game", "path", "_store", "_slot", "_local", "grid_cell", "path_slot",
+    "_coverage_intervals", "_coverage_key",
+))
+
+# EnemyStore dtype -> array typecode (same item sizes, so store columns copy straight in)
+_TYPECODES = {"i8": "q", "f8": "d", "?": "b"}
+
+_ENEMY_CLASSES = {"Enemy": Enemy, "Assimilator": Assimilator}
+
+
+class SnapshotError(ValueError):
+    """Raised for files that aren't snapshots, are corrupt, or come from another version."""
+
+
+# ----------------------------------------------------------------------
+# Capture
+# ----------------------------------------------------------------------
+
+def _attrs(obj):
+    return {k: v for k, v in vars(obj).items() if k not in _SKIP_ATTRS}
+
+
+def _capture_tower(tower):
+    return _attrs(tower) if tower is not None else None
+
+
+def _capture_enemies(game):
+    enemies = game.enemies
+    store = game.enemy_store
+    columns = {}
+    if store is not None and enemies:
+        slots = [e._slot for e in enemies]
+        for name in EnemyStore.FIELDS:
+            columns[name] = store.arrays[name][slots].tobytes()
+    else:
+        for name, dtype in EnemyStore.FIELDS.items():
+            columns[name] = array(_TYPECODES[dtype], [getattr(e, name) for e in enemies]).tobytes()
+
+    position = {id(e): i for i, e in enumerate(enemies)}
+    index_order = [(path_index, [position[id(e)] for e in bucket])
+                   for path_index, bucket in game.enemy_index.buckets.items()]
+    grid_order = []
+    for e in enemies:
+        cell = e.grid_cell
+        # One entry per occupied cell, taken from its first enemy
+        if cell is not None and game.enemy_grid[cell[1]][cell[0]][0] is e:
+            grid_order.append((cell, [position[id(o)] for o in game.enemy_grid[cell[1]][cell[0]]]))
+
+    return {
+        "classes": [type(e).__name__ for e in enemies],
+        "attrs": [_attrs(e) for e in enemies],
+        "game_ref": [getattr(e, "game", None) is game for e in enemies],
+        "columns": columns,
+        "index_order": index_order,
+        "grid_order": grid_order,
+    }
+
+
+def capture(game, frame=0):
+    """
+    Capture a game's full state as plain data.
+
+    The result shares lists/dicts with the live game, so encode it before
+    the next tick (save_game and Autosaver do).
+
+    Args:
+        game: Game to capture
+        frame: Current simulation tick (main.py's frame counter), restored by load
+
+    Returns:
+        dict: State for encode()/restore()
+    """
+    graph = game.path_graph
+    spawn_queue = game.spawn_queue
+    wall_manager = game.board.wall_manager
+    dialog_tower = game.upgrade_dialog_tower
+    return {
+        "seed": game.seed,
+        "frame": frame,
+        "minimal_mode": game.minimal_mode,
+        "web_mode": game.web_mode,
+        "size": (game.width, game.height, game.core_width, game.core_height, game.border_size),
+        "grid": "".join("".join(row) for row in game.grid).encode("ascii"),
+        "path": list(game.path),
+        "path_version": game.path_version,
+        "graph": {
+            "adj": list(graph.adj.items()),
+            "start": graph.start,
+            "end": graph.end,
+            "ordered": list(graph._ordered_path),
+            "dirty": graph._dirty,
+        },
+        "towers": [_capture_tower(t) for t in game.towers],
+        "enemies": _capture_enemies(game),
+        "next_uid": Enemy.peek_next_uid(),
+        "spawn_queue": {
+            "specs": [(s.enemy_type, s.wave_num, s.count, tuple(s.flags)) for s in spawn_queue._specs],
+            "front_left": spawn_queue._front_left,
+            "remaining": spawn_queue._remaining,
+        },
+        "walls": [_attrs(w) for w in wall_manager.walls.values()],
+        "wall_drain_rate": wall_manager.base_drain_rate,
+        "bench": [_capture_tower(t) for t in game.bench],
+        "shop": list(game.shop),
+        "map_tile_bench": list(game.map_tile_bench),
+        "upgrade_bench": list(game.upgrade_bench),
+        "merge_preview": _capture_tower(game.merge_preview),
+        "upgrade_dialog_tower": (dialog_tower.x, dialog_tower.y) if dialog_tower is not None else None,
+        "fields": {name: getattr(game, name) for name in GAME_FIELDS if hasattr(game, name)},
+        "rng": {name: getattr(game.rng, name).getstate() for name in game.rng.STREAMS},
+    }
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+
+class _StateUnpickler(pickle.Unpickler):
+    """Unpickler for builtin data only: any class or function reference is rejected."""
+
+    def find_class(self, module, name):
+        raise SnapshotError(f"Snapshot references {module}.{name}; refusing to load it")
+
+
+def dump_state(state):
+    """Pickle captured state (the uncompressed payload)."""
+    return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pack(payload):
+    """Compress a dump_state payload and add the header."""
+    return MAGIC + bytes((VERSION,)) + zlib.compress(payload, COMPRESS_LEVEL)
+
+
+def encode(state):
+    """Captured state -> snapshot file bytes."""
+    return pack(dump_state(state))
+
+
+def decode(data):
+    """
+    Snapshot file bytes -> captured state.
+
+    Raises:
+        SnapshotError: Not a snapshot, wrong version, or corrupt
+    """
+    if data[:4] != MAGIC:
+        raise SnapshotError("Not a snapshot file")
+    if len(data) < 5 or data[4] != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version: {data[4] if len(data) > 4 else None}")
+    try:
+        payload = zlib.decompress(data[5:])
+        state = _StateUnpickler(io.BytesIO(payload)).load()
+    except SnapshotError:
+        raise
+    except (zlib.error, pickle.UnpicklingError, EOFError, ValueError, IndexError, KeyError, TypeError) as e:
+        raise SnapshotError(f"Corrupt snapshot: {e}") from e
+    if not isinstance(state, dict):
+        raise SnapshotError("Corrupt snapshot: payload is not a state dict")
+    return state
+
+
+# ----------------------------------------------------------------------
+# Restore
+# ----------------------------------------------------------------------
+
+def _restore_tower(attrs):
+    if attrs is None:
+        return None
+    tower = Tower(attrs["x"], attrs["y"], attrs["base_type"])
+    tower.__dict__.update(attrs)
+    tower._coverage_key = None
+    return tower
+
+
+def _restore_enemies(game, data):
+    names = list(EnemyStore.FIELDS)
+    columns = []
+    for name, dtype in EnemyStore.FIELDS.items():
+        column = array(_TYPECODES[dtype])
+        column.frombytes(data["columns"][name])
+        columns.append(column.tolist() if dtype != "?" else [bool(v) for v in column])
+
+    enemies = game.enemies
+    store = game.enemy_store
+    path = game.path
+    # Saved attrs are everything __init__ sets, so skip it (and its stat recalculation)
+    for cls_name, attrs, game_ref, hot in zip(data["classes"], data["attrs"], data["game_ref"], zip(*columns)):
+        enemy = _ENEMY_CLASSES[cls_name].__new__(_ENEMY_CLASSES[cls_name])
+        enemy.__dict__.update(attrs)
+        enemy._store = enemy._slot = enemy.grid_cell = enemy.path_slot = None
+        enemy._local = dict(zip(names, hot))
+        enemy.path = path
+        if game_ref:
+            enemy.set_game_reference(game)
+        enemies.append(enemy)
+        if store is not None:
+            store.attach(enemy)
+
+    # Refile in the saved bucket/cell order so targeting picks the same enemies
+    for path_index, members in data["index_order"]:
+        for m in members:
+            game.enemy_index.add(enemies[m], path_index)
+    for (x, y), members in data["grid_order"]:
+        cell = game.enemy_grid[y][x]
+        for m in members:
+            cell.append(enemies[m])
+            enemies[m].grid_cell = (x, y)
+
+
+def restore(state, headless=False):
+    """
+    Build a Game from captured state.
+
+    Args:
+        state: Output of capture() / decode()
+        headless: Build the game without pygame (see Game)
+
+    Returns:
+        tuple: (game, frame)
+    """
+    width, height, core_width, core_height, border_size = state["size"]
+    game = Game(height=core_height, width=core_width, web_mode=state["web_mode"],
+                minimal_mode=state["minimal_mode"], headless=headless, seed=state["seed"])
+
+    game.width, game.height, game.border_size = width, height, border_size
+    cells = state["grid"].decode("ascii")
+    game.grid = [list(cells[y * width:(y + 1) * width]) for y in range(height)]
+    game.enemy_grid = [[[] for _ in range(width)] for _ in range(height)]
+
+    graph = PathGraph()
+    graph.adj = {pos: list(nbrs) for pos, nbrs in state["graph"]["adj"]}
+    graph.nodes = set(graph.adj)
+    graph.edges = {frozenset((pos, n)) for pos, nbrs in graph.adj.items() for n in nbrs}
+    graph.start = state["graph"]["start"]
+    graph.end = state["graph"]["end"]
+    graph._ordered_path = list(state["graph"]["ordered"])
+    graph._dirty = state["graph"]["dirty"]
+    game.path_graph = graph
+    # In place: the enemy store holds a reference to game.path
+    game.path[:] = state["path"]
+    game.path_version = state["path_version"]
+    game.reindex_path()
+
+    game.towers = []
+    game.tower_index = {}
+    for attrs in state["towers"]:
+        game.add_tower(_restore_tower(attrs))
+
+    wall_manager = game.board.wall_manager
+    wall_manager.walls = {}
+    for attrs in state["walls"]:
+        wall = PathWall(attrs["x"], attrs["y"])
+        wall.__dict__.update(attrs)
+        wall_manager.walls[(wall.x, wall.y)] = wall
+    wall_manager.base_drain_rate = state["wall_drain_rate"]
+
+    spawn_queue = game.spawn_queue
+    spawn_queue._specs = deque(SpawnSpec(t, w, c, f) for t, w, c, f in state["spawn_queue"]["specs"])
+    spawn_queue._front_left = state["spawn_queue"]["front_left"]
+    spawn_queue._remaining = state["spawn_queue"]["remaining"]
+
+    _restore_enemies(game, state["enemies"])
+    # Never hand out a uid that a restored enemy (or a latch/beam entry) already uses
+    Enemy.reserve_uids(state["next_uid"])
+
+    game.bench = [_restore_tower(t) for t in state["bench"]]
+    game.shop = list(state["shop"])
+    game.map_tile_bench = list(state["map_tile_bench"])
+    game.upgrade_bench = list(state["upgrade_bench"])
+    game.merge_preview = _restore_tower(state["merge_preview"])
+    for name, value in state["fields"].items():
+        setattr(game, name, value)
+    if state["upgrade_dialog_tower"] is not None:
+        game.upgrade_dialog_tower = game.get_tower_at(*state["upgrade_dialog_tower"])
+
+    for name, rng_state in state["rng"].items():
+        getattr(game.rng, name).setstate(rng_state)
+    return game, state["frame"]
+
+
+# ----------------------------------------------------------------------
+# Files
+# ----------------------------------------------------------------------
+
+def _write_atomic(path, data):
+    """Write via a temp file + rename, so a crash mid-write keeps the previous file."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def save_game(game, path, frame=0):
+    """Write a snapshot of `game` to `path` (synchronously)."""
+    _write_atomic(path, encode(capture(game, frame)))
+
+
+def load_game(path, headless=False):
+    """
+    Load a snapshot file.
+
+    Returns:
+        tuple: (game, frame)
+    """
+    with open(path, "rb") as f:
+        return restore(decode(f.read()), headless)
+
+
+class Autosaver:
+    """
+    Saves a snapshot whenever a wave is cleared.
+
+    capture() and the pickle run on the calling (game) thread; only zlib
+    compression and the file write are handed to the background thread.
+    """
+
+    def __init__(self, path, game=None, threaded=True):
+        """
+        Args:
+            path: Snapshot file to (over)write
+            game: Game being played (its current wave isn't saved again until it changes)
+            threaded: Write on a background thread (False for platforms without threads, e.g. the browser)
+        """
+        self.path = path
+        self.threaded = threaded
+        self.saves = 0
+        self.last_error = None
+        self._saved_round = game.round_num if game is not None else None
+        self._jobs = None
+        self._thread = None
+        if threaded:
+            self._jobs = queue.Queue()
+            self._thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+            self._thread.start()
+
+    def on_tick(self, game, frame):
+        """Call after each simulation tick; saves once per cleared wave."""
+        if game.round_num != self._saved_round and not game.game_over:
+            self.save(game, frame)
+
+    def save(self, game, frame):
+        """Capture and pickle `game` now (blocking); compress and write it in the background when threaded."""
+        self._saved_round = game.round_num
+        payload = dump_state(capture(game, frame))
+        if self.threaded:
+            self._jobs.put(payload)
+        else:
+            self._write(payload)
+
+    def _write(self, payload):
+        try:
+            _write_atomic(self.path, pack(payload))
+            self.saves += 1
+        except OSError as e:
+            self.last_error = e
+
+    def _worker(self):
+        while True:
+            payload = self._jobs.get()
+            try:
+                if payload is None:
+                    return
+                self._write(payload)
+            finally:
+                self._jobs.task_done()
+
+    def flush(self):
+        """Block until every queued save is on disk."""
+        if self.threaded:
+            self._jobs.join()
+
+    def close(self):
+        """Finish pending saves and stop the worker thread."""
+        if self._thread is not None and self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join()
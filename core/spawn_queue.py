@@ -0,0 +1,81 @@
+"""
+Streaming spawn queue.
+
+A wave is a handful of SpawnSpec runs (enemy type or pool of types, wave
+number, count, flags) instead of a list of pre-built Enemy objects.
+WaveManager builds each enemy only when it actually spawns, so memory and
+per-spawn cost stay flat no matter how large the wave is.
+"""
+
+import random
+from collections import deque
+
+
+class SpawnSpec:
+    """A run of `count` enemies sharing a type (or type pool), wave number and flags."""
+
+    def __init__(self, enemy_type, wave_num, count=1, flags=()):
+        """
+        Args:
+            enemy_type: Enemy type name, or a tuple of names to pick from per enemy
+            wave_num: Wave number used for stat scaling
+            count: Number of enemies in this run
+            flags: Extra spawn flags (e.g. "egrem" for is_egrem_spawned)
+        """
+        self.enemy_type = enemy_type
+        self.wave_num = wave_num
+        self.count = count
+        self.flags = frozenset(flags)
+
+    def __repr__(self):
+        return f"SpawnSpec({self.enemy_type!r}, {self.wave_num}, count={self.count}, flags={set(self.flags)})"
+
+
+class SpawnQueue:
+    """FIFO of SpawnSpec runs; hands out one (enemy_type, spec) per spawn."""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random  # Picks types from pools at spawn time
+        self._specs = deque()
+        self._front_left = 0      # Enemies left in the front spec
+        self._remaining = 0       # Enemies left across all specs
+
+    def __len__(self):
+        return self._remaining
+
+    def __bool__(self):
+        return self._remaining > 0
+
+    def add(self, spec):
+        """Queue a run of enemies (ignored if count < 1)."""
+        if spec.count < 1:
+            return
+        if not self._specs:
+            self._front_left = spec.count
+        self._specs.append(spec)
+        self._remaining += spec.count
+
+    def clear(self):
+        self._specs.clear()
+        self._front_left = 0
+        self._remaining = 0
+
+    def next_spawn(self):
+        """
+        Take the next enemy off the queue.
+
+        Returns:
+            tuple: (enemy_type, spec), or None if the queue is empty
+        """
+        if not self._specs:
+            return None
+        spec = self._specs[0]
+        enemy_type = spec.enemy_type
+        if isinstance(enemy_type, tuple):
+            enemy_type = self.rng.choice(enemy_type)
+        self._front_left -= 1
+        self._remaining -= 1
+        if self._front_left <= 0:
+            self._specs.popleft()
+            self._front_left = self._specs[0].count if self._specs else 0
+        return enemy_type, spec
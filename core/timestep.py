@@ -0,0 +1,71 @@
+"""
+Fixed-timestep simulation clock.
+
+Decouples the 60 Hz simulation from the render rate: each rendered frame
+feeds the real elapsed time into an accumulator and runs however many
+fixed ticks that covers, scaled by the fast-forward speed.
+"""
+
+import time
+
+# Fast-forward multipliers cycled by the speed key; MAX_SPEED runs as many
+# ticks as fit in the frame budget
+MAX_SPEED = 0
+FAST_FORWARD_SPEEDS = (1, 2, 4, 8, MAX_SPEED)
+
+
+def next_speed(speed):
+    """Return the fast-forward speed after `speed` (wraps back to 1x)."""
+    if speed not in FAST_FORWARD_SPEEDS:
+        return FAST_FORWARD_SPEEDS[0]
+    idx = FAST_FORWARD_SPEEDS.index(speed)
+    return FAST_FORWARD_SPEEDS[(idx + 1) % len(FAST_FORWARD_SPEEDS)]
+
+
+def speed_label(speed):
+    """Short display label for a fast-forward speed."""
+    return "MAX" if speed == MAX_SPEED else f"{speed}x"
+
+
+class FixedTimestep:
+    """Accumulator that turns real elapsed time into fixed simulation ticks."""
+
+    def __init__(self, tick_rate=60, max_frame_time=0.25, max_budget=0.012):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time  # Clamp so a stall can't queue up minutes of ticks
+        self.max_budget = max_budget          # Seconds of sim work per frame at MAX_SPEED
+        self.accumulator = 0.0                # Pending simulation time (seconds)
+
+    def run(self, elapsed, step, speed=1):
+        """
+        Run the simulation ticks owed for `elapsed` seconds of real time.
+
+        Args:
+            elapsed: Real seconds since the previous rendered frame
+            step: Callable that advances the simulation by one tick
+            speed: Fast-forward multiplier, or MAX_SPEED
+
+        Returns:
+            int: Number of ticks run
+        """
+        if speed == MAX_SPEED:
+            # Burn the frame budget; leftover accumulator would only cause a
+            # burst when dropping back to a fixed speed
+            self.accumulator = 0.0
+            deadline = time.perf_counter() + self.max_budget
+            ticks = 0
+            while True:
+                step()
+                ticks += 1
+                if time.perf_counter() >= deadline:
+                    return ticks
+
+        self.accumulator = min(self.accumulator + elapsed * speed, self.max_frame_time * speed)
+        ticks = 0
+        # Small tolerance so 60 frames of 1/60s don't drift into skipped ticks
+        while self.accumulator >= self.dt - 1e-9:
+            step()
+            self.accumulator -= self.dt
+            ticks += 1
+        return ticks
@@ -1,6 +1,6 @@
-import random
 from models.enemy import Enemy
 from models.assimilator import Assimilator
+from core.spawn_queue import SpawnSpec
 
 
 class WaveManager:
@@ -20,66 +20,53 @@ class WaveManager:
         if self.game.round_num >= 5: types.append("Harvester")
         if self.game.round_num >= 7: types.append("Adaptor")
         if self.game.round_num >= 9: types.append("Assimilator")
-        self.game.spawn_queue = []
-        for _ in range(wave_size):
-            enemy_type = random.choice(types)
-            if enemy_type == "Assimilator":
-                enemy = Assimilator(self.game.path, self.game.round_num, web_mode=self.game.web_mode)
-                enemy.set_game_reference(self.game)
-            else:
-                enemy = Enemy(self.game.path, enemy_type, self.game.round_num, web_mode=self.game.web_mode)
-            self.game.spawn_queue.append(enemy)
+        # Enemies are built lazily at spawn time (see core.spawn_queue)
+        self.game.spawn_queue.clear()
+        self.game.spawn_queue.add(SpawnSpec(tuple(types), self.game.round_num, wave_size))
         # Egrem towers on grid spawn 1-2 mini-boss style enemies per wave (fewer, stronger)
         for t in self.game.towers:
             if t.base_type == "Nanite Swarm":
                 if self.game.web_mode:
-                    spawn_count = random.randint(0, 1)
+                    spawn_count = self.game.rng.sim.randint(0, 1)
                 else:
-                    spawn_count = random.randint(1, 2)
-                for _ in range(spawn_count):
-                    self.game.spawn_queue.append(Enemy(self.game.path, "Assimilator", self.game.round_num + 2, web_mode=self.game.web_mode))
+                    spawn_count = self.game.rng.sim.randint(1, 2)
+                self.game.spawn_queue.add(SpawnSpec("Assimilator", self.game.round_num + 2, spawn_count))
         self.game.spawn_timer = 0
 
     def update_wave(self, frame):
         if not self.game.wave_active or self.game.paused:
             return
+        # Per-stage timings for the profiler overlay (None = off, no timing at all)
+        prof = self.game.profiler if self.game.profiler.enabled else None
+        if prof:
+            prof.begin_laps()
+
         self.game.spawn_timer += 1
         if self.game.spawn_queue and self.game.spawn_timer >= self.game.spawn_interval:
             self.game.spawn_timer = 0
-            self.game.enemies.append(self.game.spawn_queue.pop(0))
+            enemy_type, spec = self.game.spawn_queue.next_spawn()
+            self.register_enemy(self._build_enemy(enemy_type, spec))
+        if prof:
+            prof.lap("wave.spawn")
 
         # Update towers (including egrem spawning)
         for t in self.game.towers:
             t.update(self.game.enemies, frame, self.game)
+        if prof:
+            prof.lap("wave.towers")
 
-        # Apply auras
-        for t in self.game.towers:
-            if "resist_2" in t.upgrades:
-                for dy in range(-t.range, t.range + 1):
-                    for dx in range(-t.range, t.range + 1):
-                        if abs(dx) + abs(dy) > t.range:
-                            continue
-                        nx, ny = t.x + dx, t.y + dy
-                        if 0 <= nx < len(self.game.enemy_grid[0]) and 0 <= ny < len(self.game.enemy_grid):
-                            for e in self.game.enemy_grid[ny][nx]:
-                                if e.alive and not e.leaked:
-                                    e.apply_debuff('slow', 30, 60)
-
-        # Update enemy grid
-        for row in self.game.enemy_grid:
-            for cell in row:
-                cell.clear()
-        for e in self.game.enemies:
-            pos = e.get_position()
-            if pos:
-                self.game.enemy_grid[pos[1]][pos[0]].append(e)
+        # Apply auras (precompiled field, rebuilt only when aura towers or the path change)
+        self.game.slow_aura.refresh(self.game)
+        self.game.slow_aura.apply(self.game)
+        if prof:
+            prof.lap("wave.auras")
 
         # Assimilator latch logic (Circuit Stronghold)
         if hasattr(self.game, 'board') and self.game.board:
             assim_data = self.game.data_loader.get_assimilator_data() or {}
             base_chance = assim_data.get('chance_base', 0.4)
 
-            for e in self.game.enemies[:]:
+            for e in self.game.enemies:
                 if getattr(e, 'enemy_type', None) == 'Assimilator' and not getattr(e, 'is_latched', False):
                     pos = e.get_position()
                     if pos:
@@ -98,7 +85,7 @@ class WaveManager:
 
                             if not repel_active:
                                 # Roll assimilate chance
-                                if random.random() < base_chance:
+                                if self.game.rng.sim.random() < base_chance:
                                     if e.latch_to(tx, ty, ttype, self.game.board.wall_manager):
                                         # Update stack_count from target
                                         if ttype == 'wall':
@@ -107,29 +94,42 @@ class WaveManager:
                                                 e.stack_count = wall.get_latch_count()
                                         # Set game reference for tower access
                                         e.set_game_reference(self.game)
+        if prof:
+            prof.lap("wave.latch")
 
         # Update latched assimilators
-        for e in self.game.enemies[:]:
+        for e in self.game.enemies:
             if getattr(e, 'is_latched', False):
                 e.update_latch(self.game.board.wall_manager)
 
         # Integrity drain (0.02/stack)
         self.game.integrity_tick()
+        if prof:
+            prof.lap("wave.walls")
 
-        for e in self.game.enemies[:]:
-            e.move()
-            if e.leaked:
-                self.game.lives -= 1
-                self.game.enemies.remove(e)
-        for e in self.game.enemies[:]:
-            if not e.alive:
-                gold = max(1, (3 + e.difficulty * 3) // 2)  # scaled back ~half
-                self.game.gold += gold
-                # Add XP for enemy kill (full mode only)
-                if not getattr(self.game, 'minimal_mode', True) and hasattr(self.game, 'xp'):
-                    base_xp = e.TYPES[e.enemy_type].get("base_xp", 5)
-                    self.game.xp += base_xp * e.difficulty
-                self.game.enemies.remove(e)
+        # Move enemies (one vectorized pass when the store is available);
+        # only those whose path index changed touch enemy_grid
+        store = self.game.enemy_store
+        if store is not None:
+            moved = store.move_all()
+        else:
+            moved = []
+            for e in self.game.enemies:
+                old_index = e.position_index
+                e.move()
+                if e.position_index != old_index:
+                    moved.append(e)
+        if prof:
+            prof.lap("wave.move")
+        for e in moved:
+            if not e.leaked:
+                self._sync_enemy_cell(e)
+        if prof:
+            prof.lap("wave.grid")
+        # Drop leaked and killed enemies in one O(n) pass (skipped when the
+        # store shows nothing left the field this tick)
+        if store is None or store.has_removed():
+            self._compact_enemies()
         if self.game.lives <= 0:
             self.game.game_over = True
             self.game.final_wave = self.game.round_num
@@ -151,22 +151,96 @@ class WaveManager:
             # Auto-start next wave if auto mode is enabled
             if self.game.auto_mode:
                 self.start_next_wave()
+        if prof:
+            prof.lap("wave.cleanup")
 
     def spawn_enemy_at_position(self, enemy_type, x, y, wave_num=1):
         """Spawn an enemy at a specific grid position (for egrem towers)."""
         if 0 <= x < self.game.width and 0 <= y < self.game.height:
             # Find the closest path point to this position
-            closest_pos = min(self.game.path, key=lambda p: abs(p[0]-x) + abs(p[1]-y))
-            closest_idx = self.game.path.index(closest_pos)
-            if enemy_type == "Assimilator":
-                enemy = Assimilator(self.game.path[closest_idx:], wave_num, is_egrem_spawned=True, web_mode=self.game.web_mode)
-                enemy.set_game_reference(self.game)
-            else:
-                enemy = Enemy(self.game.path[closest_idx:], enemy_type, wave_num, is_egrem_spawned=True, web_mode=self.game.web_mode)
-            self.game.enemies.append(enemy)
-            # Add to enemy_grid immediately so towers can target it
-            pos = enemy.get_position()
-            if pos and 0 <= pos[0] < self.game.width and 0 <= pos[1] < self.game.height:
-                self.game.enemy_grid[pos[1]][pos[0]].append(enemy)
+            closest_idx = self.game.closest_path_index(x, y)
+            if closest_idx is None:
+                return None
+            # Share game.path (starting part-way along it) so position_index stays
+            # an absolute path index for enemy_index and tile/expand updates
+            enemy = self._build_enemy(enemy_type, SpawnSpec(enemy_type, wave_num, flags=("egrem",)))
+            enemy.position_index = closest_idx
+            # Registers in enemy_grid immediately so towers can target it
+            self.register_enemy(enemy)
             return enemy
-        return None
\ No newline at end of file
+        return None
+
+    def _build_enemy(self, enemy_type, spec):
+        """Construct one enemy for a SpawnSpec at spawn time."""
+        is_egrem = "egrem" in spec.flags
+        if enemy_type == "Assimilator":
+            enemy = Assimilator(self.game.path, spec.wave_num, is_egrem_spawned=is_egrem, web_mode=self.game.web_mode)
+            enemy.set_game_reference(self.game)
+        else:
+            enemy = Enemy(self.game.path, enemy_type, spec.wave_num, is_egrem_spawned=is_egrem, web_mode=self.game.web_mode)
+        return enemy
+
+    def _compact_enemies(self):
+        """Remove leaked and killed enemies from game.enemies, applying lives/gold/XP."""
+        game = self.game
+        wall_manager = game.board.wall_manager if getattr(game, 'board', None) else None
+        full_mode = not getattr(game, 'minimal_mode', True) and hasattr(game, 'xp')
+        survivors = []
+        for e in game.enemies:
+            if e.alive and not e.leaked:
+                survivors.append(e)
+                continue
+            if e.leaked:
+                game.lives -= 1
+                game.enemies_leaked += 1
+            else:
+                game.enemies_killed += 1
+                gold = max(1, (3 + e.difficulty * 3) // 2)  # scaled back ~half
+                game.gold += gold
+                # Add XP for enemy kill (full mode only)
+                if full_mode:
+                    base_xp = e.TYPES[e.enemy_type].get("base_xp", 5)
+                    game.xp += base_xp * e.difficulty
+            # Don't leave references to the enemy behind
+            if wall_manager and getattr(e, 'is_latched', False):
+                e.unlatch(wall_manager)
+            if game.selected_enemy is e:
+                game.selected_enemy = None
+            self._unregister_enemy(e)
+        # In place: towers and the UI hold a reference to this list
+        game.enemies[:] = survivors
+
+    def register_enemy(self, enemy):
+        """Add a spawned enemy to game.enemies, the enemy store and enemy_grid/enemy_index."""
+        self.game.enemies.append(enemy)
+        if self.game.enemy_store is not None:
+            self.game.enemy_store.attach(enemy)
+        self._sync_enemy_cell(enemy)
+
+    def _sync_enemy_cell(self, enemy):
+        """Refile an enemy in enemy_grid and enemy_index after its path position changed."""
+        pos = enemy.get_position()
+        self.game.enemy_index.move(enemy, enemy.position_index if pos else None)
+        if pos == enemy.grid_cell:
+            return
+        self._remove_from_grid(enemy)
+        if pos and 0 <= pos[0] < self.game.width and 0 <= pos[1] < self.game.height:
+            self.game.enemy_grid[pos[1]][pos[0]].append(enemy)
+            enemy.grid_cell = pos
+
+    def _unregister_enemy(self, enemy):
+        """Take a dead or leaked enemy out of enemy_grid, enemy_index and the enemy store."""
+        self.game.enemy_index.remove(enemy)
+        self._remove_from_grid(enemy)
+        if self.game.enemy_store is not None:
+            self.game.enemy_store.detach(enemy)
+
+    def _remove_from_grid(self, enemy):
+        """Take an enemy out of its enemy_grid cell."""
+        if enemy.grid_cell is None:
+            return
+        x, y = enemy.grid_cell
+        cell = self.game.enemy_grid[y][x]
+        if enemy in cell:
+            cell.remove(enemy)
+        enemy.grid_cell = None
\ No newline at end of file
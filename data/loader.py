@@ -1,3 +1,4 @@
+import copy
 import os
 
 # pygbag compatibility - YAML may not be available in browser
@@ -7,6 +8,20 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Parsed YAML by file path: parsing is ~95% of Game() construction, and every
+# Game (snapshot loads, benchmarks, headless batches) would otherwise redo it
+_yaml_cache = {}
+
+
+def _read_yaml(path):
+    """Parse a YAML file once per process; callers get their own copy."""
+    data = _yaml_cache.get(path)
+    if data is None:
+        with open(path, 'r') as f:
+            data = _yaml_cache[path] = yaml.safe_load(f) or {}
+    return copy.deepcopy(data)
+
+
 class DataLoader:
     """Loads game data from YAML files with fallback to Python dicts."""
 
@@ -29,9 +44,7 @@ class DataLoader:
             # Load towers data
             towers_file = os.path.join(self.yaml_dir, 'merges.yaml')
             if os.path.exists(towers_file):
-                with open(towers_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    self.towers = data.get('towers', {})
+                self.towers = _read_yaml(towers_file).get('towers', {})
             else:
                 print(f"Warning: {towers_file} not found, using fallback data")
                 self._load_fallback_towers()
@@ -39,9 +52,7 @@ class DataLoader:
             # Load enemies data
             enemies_file = os.path.join(self.yaml_dir, 'enemies.yaml')
             if os.path.exists(enemies_file):
-                with open(enemies_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    self.enemies = data.get('enemies', {})
+                self.enemies = _read_yaml(enemies_file).get('enemies', {})
             else:
                 print(f"Warning: {enemies_file} not found, using fallback data")
                 self._load_fallback_enemies()
@@ -49,9 +60,7 @@ class DataLoader:
             # Load meta unlocks data
             meta_file = os.path.join(self.yaml_dir, 'meta_unlocks.yaml')
             if os.path.exists(meta_file):
-                with open(meta_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    self.meta_unlocks = data.get('meta_unlocks', {})
+                self.meta_unlocks = _read_yaml(meta_file).get('meta_unlocks', {})
             else:
                 print(f"Warning: {meta_file} not found, using fallback data")
                 self._load_fallback_meta_unlocks()
@@ -59,9 +68,7 @@ class DataLoader:
             # Load assimilators data
             assimilators_file = os.path.join(self.yaml_dir, 'assimilators.yaml')
             if os.path.exists(assimilators_file):
-                with open(assimilators_file, 'r') as f:
-                    data = yaml.safe_load(f)
-                    self.assimilators = data.get('assimilators', {})
+                self.assimilators = _read_yaml(assimilators_file).get('assimilators', {})
             else:
                 print(f"Warning: {assimilators_file} not found, using fallback data")
                 self._load_fallback_assimilators()
@@ -1,18 +1,57 @@
 import argparse
 import asyncio
 import sys
-import pygame
+import time
 from core.game import Game
-from ui.renderer import Renderer
-from ui.events import EventHandler
+from core.timestep import FixedTimestep
 from config import log_debug
 
 # Parse --minimal flag for reduced features (debugging/performance)
 parser = argparse.ArgumentParser(description="Tower Defense 3: Borg Assimilation")
 parser.add_argument("--minimal", action="store_true", help="Use minimal mode (reduced features)")
+parser.add_argument("--headless", action="store_true", help="Run the simulation with no display at full CPU speed")
+parser.add_argument("--waves", type=int, default=10, help="Number of waves to run in --headless mode")
+parser.add_argument("--seed", type=int, default=None, help="Game seed (same seed = same map, shops and waves)")
+parser.add_argument("--record", metavar="PATH", help="Record every game-affecting action (and the seed) to a replay file")
+parser.add_argument("--replay", metavar="PATH", help="Play a recorded replay headlessly at full CPU speed and print a report")
+parser.add_argument("--profile", metavar="PATH", help="With --replay: write per-stage update_wave timings to PATH (JSON)")
+parser.add_argument("--load", metavar="PATH", help="Resume from a snapshot file (see --autosave)")
+parser.add_argument("--autosave", metavar="PATH", help="Save a snapshot to PATH each time a wave is cleared")
 args = parser.parse_args()
+if args.load and args.record:
+    parser.error("--record replays from the seed, so it can't start from a --load snapshot")
 FEATURE_MODE = "minimal" if args.minimal else "full"
 
+# Replay: rebuild the recorded game from its seed and feed the actions back, no display
+if args.replay:
+    from core.replay import Replay, ReplayPlayer
+    player = ReplayPlayer(Replay.load(args.replay))
+    if args.profile:
+        player.game.profiler.window = None  # Keep every tick, not just the rolling window
+        player.game.profiler.enable()
+    player.run()
+    player.print_report()
+    if args.profile:
+        player.game.profiler.dump(args.profile, player.game)
+    sys.exit(0)
+
+# Headless: no renderer, no event handler, no pygame - just simulate and report
+if args.headless:
+    from core.headless import HeadlessRunner
+    if args.load:
+        from core.snapshot import load_game
+        game, _ = load_game(args.load, headless=True)
+    else:
+        game = Game(minimal_mode=(FEATURE_MODE == "minimal"), headless=True, seed=args.seed)
+    runner = HeadlessRunner(game)
+    runner.run(args.waves)
+    runner.print_report()
+    sys.exit(0)
+
+import pygame
+from ui.renderer import Renderer
+from ui.events import EventHandler
+
 # Detect web/browser mode (pygbag runs on emscripten)
 WEB_MODE = sys.platform == "emscripten"
 
@@ -34,8 +73,13 @@ except Exception as e:
 
 # Create game and UI components
 log_debug("Creating Game instance", location="main.py")
+frame = 0  # Simulation tick counter (advances at a fixed 60 Hz, scaled by fast-forward)
 try:
-    game = Game(web_mode=WEB_MODE, minimal_mode=(FEATURE_MODE == "minimal"))
+    if args.load:
+        from core.snapshot import load_game
+        game, frame = load_game(args.load)
+    else:
+        game = Game(web_mode=WEB_MODE, minimal_mode=(FEATURE_MODE == "minimal"), seed=args.seed)
     log_debug("Game instance created successfully", location="main.py")
 except Exception as e:
     log_debug("Game creation failed", {"error": str(e)}, location="main.py")
@@ -51,70 +95,102 @@ except Exception as e:
 
 log_debug("Creating EventHandler instance", location="main.py")
 try:
-    handler = EventHandler(game, renderer)
+    recorder = None
+    if args.record:
+        from core.replay import ReplayRecorder
+        recorder = ReplayRecorder(args.record, game)
+    handler = EventHandler(game, renderer, recorder)
     log_debug("EventHandler instance created successfully", location="main.py")
 except Exception as e:
     log_debug("EventHandler creation failed", {"error": str(e)}, location="main.py")
     raise
 
+autosaver = None
+if args.autosave:
+    from core.snapshot import Autosaver
+    # No threads in the browser build; there the (small) write happens inline
+    autosaver = Autosaver(args.autosave, game, threaded=not WEB_MODE)
+
 clock = pygame.time.Clock()
-frame = 0
+timestep = FixedTimestep(tick_rate=60)
+rendered = 0  # Rendered frame counter
 
 
-async def main():
+def sim_step():
+    """Advance the simulation by one fixed tick."""
     global frame
+    frame += 1
+    # Update game state (if not paused)
+    if not game.paused:
+        game.wave_manager.update_wave(frame)
+        if autosaver is not None:
+            autosaver.on_tick(game, frame)
+
+
+async def main():
+    global rendered
     log_debug("Main game loop starting", location="main.py")
+    last_time = time.perf_counter()
     try:
         while handler.running:
-            frame += 1
-            if frame <= 5:
-                log_debug(f"Frame {frame} starting", location="main.py")
+            rendered += 1
+            if rendered <= 5:
+                log_debug(f"Frame {rendered} starting", location="main.py")
+
+            now = time.perf_counter()
+            elapsed = now - last_time
+            last_time = now
 
             # Handle events
             try:
                 handler.handle_events(frame)
-                if frame <= 5:
-                    log_debug(f"Frame {frame}: Events handled", location="main.py")
+                if rendered <= 5:
+                    log_debug(f"Frame {rendered}: Events handled", location="main.py")
+            except Exception as e:
+                log_debug(f"Frame {rendered}: Event handling failed", {"error": str(e)}, location="main.py")
+                raise
+
+            # Run the fixed-rate simulation ticks owed for this frame.
+            # Fast-forward only applies while a wave is actually running.
+            speed = game.sim_speed if game.wave_active and not game.paused else 1
+            try:
+                ticks = timestep.run(elapsed, sim_step, speed)
+                if rendered <= 5:
+                    log_debug(f"Frame {rendered}: Game state updated", {"ticks": ticks}, location="main.py")
             except Exception as e:
-                log_debug(f"Frame {frame}: Event handling failed", {"error": str(e)}, location="main.py")
+                log_debug(f"Frame {rendered}: Game state update failed", {"error": str(e), "tick": frame}, location="main.py")
                 raise
 
-            # Update game state (if not paused)
-            if not game.paused:
-                try:
-                    game.wave_manager.update_wave(frame)
-                    if frame <= 5:
-                        log_debug(f"Frame {frame}: Game state updated", location="main.py")
-                except Exception as e:
-                    log_debug(f"Frame {frame}: Game state update failed", {"error": str(e)}, location="main.py")
-                    raise
-
-            # Render everything
+            # Render everything (once per frame, however many ticks ran)
             try:
                 renderer.draw(frame)
-                if frame <= 5:
-                    log_debug(f"Frame {frame}: Rendering completed", location="main.py")
+                if rendered <= 5:
+                    log_debug(f"Frame {rendered}: Rendering completed", location="main.py")
             except Exception as e:
-                log_debug(f"Frame {frame}: Rendering failed", {"error": str(e)}, location="main.py")
+                log_debug(f"Frame {rendered}: Rendering failed", {"error": str(e)}, location="main.py")
                 raise
 
-            # Display and maintain frame rate
+            # Display (only the dirty rects when the renderer allows it) and cap the render rate
             try:
-                pygame.display.flip()
+                renderer.present()
                 clock.tick(60)
-                if frame <= 5:
-                    log_debug(f"Frame {frame}: Display flipped", location="main.py")
+                if rendered <= 5:
+                    log_debug(f"Frame {rendered}: Display flipped", location="main.py")
             except Exception as e:
-                log_debug(f"Frame {frame}: Display flip failed", {"error": str(e)}, location="main.py")
+                log_debug(f"Frame {rendered}: Display flip failed", {"error": str(e)}, location="main.py")
                 raise
 
             await asyncio.sleep(0)  # Yield to browser event loop
 
         log_debug("Main game loop ended normally", location="main.py")
     except Exception as e:
-        log_debug("Main game loop crashed", {"error": str(e), "frame": frame}, location="main.py")
+        log_debug("Main game loop crashed", {"error": str(e), "frame": rendered, "tick": frame}, location="main.py")
         raise
     finally:
+        if handler.recorder is not None:
+            handler.recorder.close()
+        if autosaver is not None:
+            autosaver.close()
         pygame.quit()
 
 
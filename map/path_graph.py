@@ -1,49 +1,108 @@
 # ==============================
 # PATH GRAPH (Single Source of Truth for Path)
 # ==============================
+from collections import deque
+
+
 class PathGraph:
     def __init__(self):
         self.nodes = set()  # set of (x, y) tuples
         self.edges = set()  # set of frozenset({(x,y), (x,y)}) for adjacent pairs
+        self.adj = {}       # (x, y) -> list of neighbour (x, y), in insertion order
         self.start = None   # (x, y) start position
         self.end = None     # (x, y) end position
         self._ordered_path = []  # cached ordered path from start to end
+        self._dirty = True       # cache needs a full BFS recompute
 
     def add_node(self, pos):
         """Add a path node at position (x, y)."""
+        if pos in self.nodes:
+            return
         self.nodes.add(pos)
-        self._ordered_path = []  # invalidate cache
+        self.adj[pos] = []
+        # An isolated node can't change the start->end path; cache stays valid
 
     def add_edge(self, pos1, pos2):
         """Add an edge between two positions."""
         # Allow any edge - the path generator knows what connections are valid
-        self.edges.add(frozenset([pos1, pos2]))
-        self._ordered_path = []  # invalidate cache
+        edge = frozenset([pos1, pos2])
+        if edge in self.edges:
+            return
+        self.add_node(pos1)
+        self.add_node(pos2)
+        self.edges.add(edge)
+        self.adj[pos1].append(pos2)
+        if pos2 != pos1:
+            self.adj[pos2].append(pos1)
+        self._dirty = True  # structural change: recompute on next read
 
     def set_start(self, pos):
         """Set the start position."""
         self.start = pos
-        if pos not in self.nodes:
-            self.add_node(pos)
-        self._ordered_path = []  # invalidate cache
+        self.add_node(pos)
+        self._dirty = True
 
     def set_end(self, pos):
         """Set the end position."""
         self.end = pos
-        if pos not in self.nodes:
-            self.add_node(pos)
-        self._ordered_path = []  # invalidate cache
+        self.add_node(pos)
+        self._dirty = True
+
+    def extend_path(self, cells):
+        """
+        Append an ordered run of cells after the current end.
+
+        Links end -> cells[0] -> ... -> cells[-1] and makes cells[-1] the new
+        end. When the cells are all new nodes, the shortest path can only be
+        the old one plus this chain, so the cached path is extended in
+        O(len(cells)) instead of re-running the BFS.
+
+        Args:
+            cells: Ordered (x, y) cells, entry first
+
+        Returns:
+            bool: True if the cached path was extended incrementally
+        """
+        if not cells:
+            return False
+        incremental = (
+            not self._dirty and self._ordered_path and self.end == self._ordered_path[-1]
+            and len(set(cells)) == len(cells) and not any(c in self.nodes for c in cells)
+        )
+        prev = self.end
+        for pos in cells:
+            if prev is not None:
+                self.add_edge(prev, pos)
+            else:
+                self.add_node(pos)
+            prev = pos
+        self.set_end(cells[-1])
+        if incremental:
+            self._ordered_path.extend(cells)
+            self._dirty = False
+        return incremental
+
+    def translate(self, dx, dy):
+        """Shift every node (and the cached path) by (dx, dy), e.g. when the grid grows west/north."""
+        def move(pos):
+            return (pos[0] + dx, pos[1] + dy) if pos is not None else None
+
+        self.nodes = {move(p) for p in self.nodes}
+        self.edges = {frozenset(move(p) for p in edge) for edge in self.edges}
+        self.adj = {move(p): [move(n) for n in nbrs] for p, nbrs in self.adj.items()}
+        self.start = move(self.start)
+        self.end = move(self.end)
+        self._ordered_path = [move(p) for p in self._ordered_path]
 
     def compute_ordered_path(self):
         """Compute ordered path from start to end using BFS."""
         if not self.start or not self.end:
             return []
 
-        if self._ordered_path:  # return cached path
+        if not self._dirty:  # return cached path
             return self._ordered_path
 
         # BFS to find path from start to end
-        from collections import deque
         queue = deque([self.start])
         came_from = {self.start: None}
 
@@ -52,28 +111,24 @@ class PathGraph:
             if current == self.end:
                 break
 
-            # Find neighbors via edges
-            for edge in self.edges:
-                if current in edge:
-                    neighbor = next(p for p in edge if p != current)
-                    if neighbor not in came_from:
-                        came_from[neighbor] = current
-                        queue.append(neighbor)
+            for neighbor in self.adj.get(current, ()):
+                if neighbor not in came_from:
+                    came_from[neighbor] = current
+                    queue.append(neighbor)
 
         # Reconstruct path
-        if self.end not in came_from:
-            return []  # no path found
-
         path = []
-        current = self.end
-        while current is not None:
-            path.append(current)
-            current = came_from[current]
-        path.reverse()
+        if self.end in came_from:
+            current = self.end
+            while current is not None:
+                path.append(current)
+                current = came_from[current]
+            path.reverse()
 
         self._ordered_path = path
+        self._dirty = False
         return path
 
     def get_ordered_path(self):
         """Get the ordered path from start to end."""
-        return self.compute_ordered_path()
\ No newline at end of file
+        return self.compute_ordered_path()
@@ -9,6 +9,15 @@ from models.enemy import Enemy
 class Assimilator(Enemy):
     """Assimilator enemy that can latch onto walls and towers."""
 
+    @property
+    def is_latched(self):
+        # Backed by Enemy.held so the batched move in EnemyStore skips latched assimilators
+        return self.held
+
+    @is_latched.setter
+    def is_latched(self, value):
+        self.held = value
+
     def __init__(self, path, wave_num=1, is_egrem_spawned=False, web_mode=False):
         # Initialize as base Enemy with Assimilator type
         super().__init__(path, enemy_type="Assimilator", wave_num=wave_num,
@@ -41,7 +50,7 @@ class Assimilator(Enemy):
 
         if target_type == 'wall':
             wall = wall_manager.get_wall(target_x, target_y)
-            if wall and wall.add_latch(id(self)):
+            if wall and wall.add_latch(self.uid):
                 self._perform_latch(target_x, target_y, target_type)
                 # Update stack count from wall
                 self.stack_count = wall.get_latch_count()
@@ -80,7 +89,7 @@ class Assimilator(Enemy):
         if self.latch_target_type == 'wall':
             wall = wall_manager.get_wall(self.latch_target[0], self.latch_target[1])
             if wall:
-                wall.remove_latch(id(self))
+                wall.remove_latch(self.uid)
 
         # Reset latch state
         self.is_latched = False
@@ -190,12 +199,6 @@ class Assimilator(Enemy):
             info['latched'] = False
         return info
 
-    def _get_tower_at(self, x, y):
-        """Helper to get tower at position (needs game reference)."""
-        # This should be passed in or accessed via game reference
-        # For now, return None - will be implemented when integrated
-        return None
-
     def _can_latch_tower(self, tower):
         """Helper to check if tower can be latched."""
         return hasattr(tower, 'can_be_latched') and tower.can_be_latched()
@@ -208,8 +211,4 @@ class Assimilator(Enemy):
         """Get tower at position using game reference."""
         if not hasattr(self, 'game') or not self.game:
             return None
-
-        for tower in self.game.towers:
-            if tower.x == x and tower.y == y:
-                return tower
-        return None
\ No newline at end of file
+        return self.game.get_tower_at(x, y)
\ No newline at end of file
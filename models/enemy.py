@@ -1,6 +1,26 @@
 # ==============================
 # ENEMY
 # ==============================
+
+
+def _stored(name):
+    """Attribute kept on the object until the enemy joins an EnemyStore, then read from its arrays."""
+    def fget(self):
+        store = self._store
+        if store is None:
+            return self._local[name]
+        return store.arrays[name][self._slot].item()
+
+    def fset(self, value):
+        store = self._store
+        if store is None:
+            self._local[name] = value
+        else:
+            store.arrays[name][self._slot] = value
+
+    return property(fget, fset)
+
+
 class Enemy:
     TYPES = {
         "Drone":    {"health": 10, "speed": 10, "difficulty": 1, "display": "Drone", "symbol": "D"},
@@ -20,7 +40,36 @@ class Enemy:
             cls.TYPES["Adaptor"]["base_xp"] = 15
             cls.TYPES["Assimilator"]["base_xp"] = 20
 
+    @staticmethod
+    def peek_next_uid():
+        """The uid the next enemy will get, without using it up."""
+        return Enemy._next_uid
+
+    @staticmethod
+    def reserve_uids(next_uid):
+        """Make sure no enemy created from now on gets a uid below `next_uid` (e.g. after a load)."""
+        Enemy._next_uid = max(Enemy._next_uid, next_uid)
+
+    # Hot fields; see models.enemy_store.EnemyStore
+    health = _stored("health")
+    position_index = _stored("position_index")
+    move_counter = _stored("move_counter")
+    move_speed = _stored("move_speed")
+    slow_amount = _stored("slow_amount")
+    slow_frames = _stored("slow_frames")
+    alive = _stored("alive")
+    leaked = _stored("leaked")
+    held = _stored("held")
+
+    # Monotonic IDs: unlike id(), never reused after an enemy is freed
+    _next_uid = 1
+
     def __init__(self, path, enemy_type="Drone", wave_num=1, is_egrem_spawned=False, web_mode=False):
+        self.uid = Enemy._next_uid  # Stable key for beam_targets, wall latch lists, etc.
+        Enemy._next_uid += 1
+        self._store = None  # EnemyStore holding the hot fields once registered
+        self._slot = None
+        self._local = {"slow_amount": 0.0, "slow_frames": 0, "held": False}
         self.path = path
         self.position_index = 0
         self.enemy_type = enemy_type if enemy_type in self.TYPES else "Drone"
@@ -29,10 +78,20 @@ class Enemy:
         self.leaked = False
         self.move_counter = 0.0
         self.is_egrem_spawned = is_egrem_spawned
-        self.debuffs = {}  # debuff_type: {'amount': val, 'frames_left': int}
+        self._other_debuffs = {}  # Non-slow debuffs: debuff_type: {'amount': val, 'frames_left': int}
         self.web_mode = web_mode
+        self.grid_cell = None  # (x, y) cell this enemy is filed under in game.enemy_grid
+        self.path_slot = None  # position_index this enemy is filed under in game.enemy_index
         self._calculate_stats()
 
+    @property
+    def debuffs(self):
+        """Active debuffs as {debuff_type: {'amount': val, 'frames_left': int}} (a snapshot)."""
+        debuffs = dict(self._other_debuffs)
+        if self.slow_frames > 0:
+            debuffs['slow'] = {'amount': self.slow_amount, 'frames_left': self.slow_frames}
+        return debuffs
+
     def _calculate_stats(self):
         from data.units import WEB_MODE_CONFIG
         base_stats = self.TYPES.get(self.enemy_type, self.TYPES["Drone"])
@@ -53,12 +112,12 @@ class Enemy:
         if not self.alive or self.leaked:
             return
         increment = 1.0
-        if 'slow' in self.debuffs:
-            slow_pct = self.debuffs['slow']['amount'] / 100.0
+        if self.slow_frames > 0:
+            slow_pct = self.slow_amount / 100.0
             increment = 1.0 * (1 - slow_pct)
-            self.debuffs['slow']['frames_left'] -= 1
-            if self.debuffs['slow']['frames_left'] <= 0:
-                del self.debuffs['slow']
+            self.slow_frames -= 1
+            if self.slow_frames <= 0:
+                self.slow_amount = 0.0
         self.move_counter += increment
         if self.move_counter >= self.move_speed:
             self.move_counter -= self.move_speed
@@ -80,9 +139,19 @@ class Enemy:
         return False
 
     def apply_debuff(self, debuff_type, amount, duration):
-        if debuff_type not in self.debuffs:
-            self.debuffs[debuff_type] = {'amount': amount, 'frames_left': duration}
+        if debuff_type == 'slow':
+            # Slow lives in the store arrays so the batched move can apply it
+            if self.slow_frames <= 0:
+                self.slow_amount = amount
+                self.slow_frames = duration
+            else:
+                if duration > self.slow_frames:
+                    self.slow_frames = duration
+                self.slow_amount = max(self.slow_amount, amount)
+            return
+        if debuff_type not in self._other_debuffs:
+            self._other_debuffs[debuff_type] = {'amount': amount, 'frames_left': duration}
         else:
-            if duration > self.debuffs[debuff_type]['frames_left']:
-                self.debuffs[debuff_type]['frames_left'] = duration
-            self.debuffs[debuff_type]['amount'] = max(self.debuffs[debuff_type]['amount'], amount)
\ No newline at end of file
+            if duration > self._other_debuffs[debuff_type]['frames_left']:
+                self._other_debuffs[debuff_type]['frames_left'] = duration
+            self._other_debuffs[debuff_type]['amount'] = max(self._other_debuffs[debuff_type]['amount'], amount)
@@ -0,0 +1,171 @@
+"""
+Struct-of-arrays storage for live enemies.
+
+Once registered with a game, an Enemy's hot fields (health, path progress,
+movement and slow state) live in NumPy arrays here, and the Enemy object
+becomes a thin view onto its slot. WaveManager moves every enemy in one
+vectorized pass per tick and Radius towers damage in batches, instead of
+paying Python attribute access per enemy.
+
+NumPy is optional: without it Game.enemy_store is None and enemies keep
+their fields on the object, moved one at a time as before.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class EnemyStore:
+    """Fixed-dtype arrays indexed by slot, one slot per registered enemy."""
+
+    # Field name -> dtype. Names match the Enemy attributes they back.
+    FIELDS = {
+        "health": "i8",
+        "position_index": "i8",
+        "move_counter": "f8",
+        "move_speed": "i8",
+        "slow_amount": "f8",   # Percent slow (0 = none)
+        "slow_frames": "i8",   # Frames of slow left
+        "alive": "?",
+        "leaked": "?",
+        "held": "?",           # Not moving along the path (latched Assimilator)
+    }
+
+    def __init__(self, path, capacity=256):
+        """
+        Args:
+            path: Shared game.path list (mutated in place as tiles are placed)
+            capacity: Initial number of slots (grows by doubling)
+        """
+        self.path = path
+        self.capacity = 0
+        self.arrays = {}
+        self.in_use = np.zeros(0, dtype="?")
+        self.path_len = np.zeros(0, dtype="i8")  # -1 = shared path, else length of the enemy's own path
+        self.enemies = []  # slot -> Enemy (None when free)
+        self.free = []
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.capacity - len(self.free)
+
+    def _grow(self, capacity):
+        """Resize every array to `capacity` slots, keeping existing data."""
+        old = self.capacity
+        for name, dtype in self.FIELDS.items():
+            arr = np.zeros(capacity, dtype=dtype)
+            if old:
+                arr[:old] = self.arrays[name]
+            self.arrays[name] = arr
+            setattr(self, name, arr)
+        in_use = np.zeros(capacity, dtype="?")
+        in_use[:old] = self.in_use
+        self.in_use = in_use
+        path_len = np.full(capacity, -1, dtype="i8")
+        path_len[:old] = self.path_len
+        self.path_len = path_len
+        self.enemies.extend([None] * (capacity - old))
+        # Pop from the end so low slots are handed out first
+        self.free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def attach(self, enemy):
+        """Move an enemy's fields into a free slot; the enemy then reads/writes the arrays."""
+        if enemy._store is not None:
+            return
+        if not self.free:
+            self._grow(max(16, self.capacity * 2))
+        slot = self.free.pop()
+        for name in self.FIELDS:
+            self.arrays[name][slot] = enemy._local[name]
+        self.in_use[slot] = True
+        self.path_len[slot] = -1 if enemy.path is self.path else len(enemy.path)
+        self.enemies[slot] = enemy
+        enemy._store = self
+        enemy._slot = slot
+
+    def detach(self, enemy):
+        """Copy an enemy's fields back onto the object and free its slot."""
+        if enemy._store is not self:
+            return
+        slot = enemy._slot
+        for name in self.FIELDS:
+            enemy._local[name] = self.arrays[name][slot].item()
+        self.in_use[slot] = False
+        self.enemies[slot] = None
+        self.free.append(slot)
+        enemy._store = None
+        enemy._slot = None
+
+    def move_all(self):
+        """
+        Advance every registered enemy by one tick (vectorized Enemy.move).
+
+        Returns:
+            list: Enemies whose position_index changed (including ones that leaked)
+        """
+        active = self.in_use & self.alive & ~self.leaked & ~self.held
+
+        # Slow debuff: scales this tick's increment and counts down
+        slowed = active & (self.slow_frames > 0)
+        increment = np.where(slowed, 1.0 - self.slow_amount / 100.0, 1.0)
+        self.slow_frames[slowed] -= 1
+        self.slow_amount[slowed & (self.slow_frames <= 0)] = 0
+
+        self.move_counter[active] += increment[active]
+        step = active & (self.move_counter >= self.move_speed)
+        self.move_counter[step] -= self.move_speed[step]
+        self.position_index[step] += 1
+
+        path_len = np.where(self.path_len < 0, len(self.path), self.path_len)
+        leak = step & (self.position_index >= path_len)
+        self.leaked[leak] = True
+        self.alive[leak] = False
+
+        enemies = self.enemies
+        return [enemies[slot] for slot in np.flatnonzero(step)]
+
+    def damage(self, enemies, dmg):
+        """
+        Apply `dmg` to each enemy in one pass (vectorized Enemy.take_damage).
+
+        Args:
+            enemies: Registered enemies (each at most once)
+            dmg: Damage per enemy
+
+        Returns:
+            bool: True if any of them died
+        """
+        if not enemies:
+            return False
+        slots = np.fromiter((e._slot for e in enemies), dtype=np.intp, count=len(enemies))
+        self.health[slots] -= dmg
+        killed = slots[self.health[slots] <= 0]
+        self.alive[killed] = False
+        return len(killed) > 0
+
+    def apply_slow_field(self, field, frames):
+        """
+        Vectorized apply_debuff('slow', field[position_index], frames) for enemies on the shared path.
+
+        Args:
+            field: Slow % per path index (0 = none)
+            frames: Debuff duration
+        """
+        idx = self.position_index
+        live = self.in_use & self.alive & ~self.leaked & (self.path_len < 0) & (idx >= 0) & (idx < len(field))
+        slots = np.flatnonzero(live)
+        amount = field[idx[slots]]
+        hit = amount > 0
+        slots, amount = slots[hit], amount[hit]
+        fresh = self.slow_frames[slots] <= 0
+        self.slow_amount[slots] = np.where(fresh, amount, np.maximum(self.slow_amount[slots], amount))
+        self.slow_frames[slots] = np.where(fresh, frames, np.maximum(self.slow_frames[slots], frames))
+
+    def has_removed(self):
+        """True if any registered enemy died or leaked and is still awaiting removal."""
+        return bool((self.in_use & ~self.alive).any())
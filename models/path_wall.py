@@ -194,11 +194,7 @@ class PathWallManager:
 
     def _get_tower_at(self, x, y):
         """Get tower at position from game state."""
-        # This assumes towers are stored in self.game.towers as objects with x,y attributes
-        for tower in self.game.towers:
-            if tower.x == x and tower.y == y:
-                return tower
-        return None
+        return self.game.get_tower_at(x, y)
 
     def _can_latch_tower(self, tower):
         """Check if a tower can be latched (hybrid wall behavior)."""
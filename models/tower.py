@@ -1,7 +1,6 @@
 # ==============================
 # TOWER (Hardware + Software Upgrades)
 # ==============================
-import random
 from data.upgrades import UPGRADE_DEFS, EGREM_SPAWN_CONFIG
 from data.units import TOWER_TRAITS
 
@@ -36,7 +35,7 @@ class Tower:
         self.buffs = {}             # buff_type: {'amount': val, 'frames_left': int}
 
         # Fire type specific attributes
-        self.beam_targets = {}      # For Beam: enemy_id: (damage_per_frame, frames_applied)
+        self.beam_targets = {}      # For Beam: enemy uid: (damage_per_frame, frames_applied)
         self.track_direction = 0    # For Track: 0=N, 1=E, 2=S, 3=W
 
         # Egrem spawning state (only set for Egrem towers)
@@ -44,6 +43,10 @@ class Tower:
         self.egrem_spawn_timer = 0    # Frames until next spawn
         self.egrem_spawn_interval = 0 # Interval between spawns
 
+        # In-range path-index runs; see get_path_intervals
+        self._coverage_intervals = []
+        self._coverage_key = None
+
         self._calculate_stats()
 
     def get_traits(self):
@@ -81,6 +84,42 @@ class Tower:
                 self.range += 0.2   # small bonus
                 # could add more here
 
+        # Range may have changed (upgrade/merge)
+        self._coverage_key = None
+
+    def _refresh_coverage(self, game, effective_range):
+        """Rebuild the coverage cache if the path, position or range changed."""
+        key = (getattr(game, 'path_version', 0), self.x, self.y, effective_range)
+        if key == self._coverage_key:
+            return
+        intervals = []  # Inclusive (lo, hi) path-index runs
+        for i, (px, py) in enumerate(game.path):
+            if abs(px - self.x) + abs(py - self.y) > effective_range:
+                continue
+            if intervals and intervals[-1][1] == i - 1:
+                intervals[-1] = (intervals[-1][0], i)
+            else:
+                intervals.append((i, i))
+        self._coverage_intervals = intervals
+        self._coverage_key = key
+
+    def get_path_intervals(self, game, effective_range=None):
+        """
+        Get the path-index intervals this tower covers.
+
+        Cached until the path changes (game.path_version), the tower moves
+        or its range changes.
+
+        Args:
+            game: Game instance (provides path and path_version)
+            effective_range: Range to use instead of self.range
+
+        Returns:
+            list: Sorted inclusive (lo, hi) indices into game.path
+        """
+        self._refresh_coverage(game, self.range if effective_range is None else effective_range)
+        return self._coverage_intervals
+
     def get_merge_tier(self):
         return self.merge_generation
 
@@ -147,24 +186,22 @@ class Tower:
                 if self.egrem_spawn_timer <= 0:
                     self.egrem_spawn_timer = self.egrem_spawn_interval
                     for _ in range(self.egrem_spawn_count):
-                        enemy_type = random.choice(self.egrem_enemy_types)
-                        game.spawn_enemy_at_position(enemy_type, self.x, self.y, game.round_num)
+                        enemy_type = game.rng.sim.choice(self.egrem_enemy_types)
+                        game.wave_manager.spawn_enemy_at_position(enemy_type, self.x, self.y, game.round_num)
             return None  # Spawner towers don't attack
 
         elif self.fire_type == "Radius":
             # Damage all enemies in range each frame
             killed_any = False
-            for dy in range(-int(self.range), int(self.range) + 1):
-                for dx in range(-int(self.range), int(self.range) + 1):
-                    if abs(dx) + abs(dy) > self.range:
-                        continue
-                    nx, ny = self.x + dx, self.y + dy
-                    if 0 <= nx < len(game.enemy_grid[0]) and 0 <= ny < len(game.enemy_grid):
-                        for e in game.enemy_grid[ny][nx][:]:  # copy to avoid modification issues
-                            if e.alive and not e.leaked:
-                                killed = e.take_damage(self.dmg)
-                                if killed:
-                                    killed_any = True
+            targets = game.enemy_index.all_in(self.get_path_intervals(game))
+            store = getattr(game, 'enemy_store', None)
+            if store is not None:
+                killed_any = store.damage(targets, self.dmg)
+            else:
+                for e in targets:
+                    killed = e.take_damage(self.dmg)
+                    if killed:
+                        killed_any = True
             return (None, killed_any) if killed_any else None
 
         elif self.fire_type == "Track":
@@ -189,7 +226,7 @@ class Tower:
             killed_any = False
             directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # N, S, W, E
             dx, dy = directions[self.track_direction]
-            for dist in range(1, self.range + 1):
+            for dist in range(1, int(self.range) + 1):  # range is fractional after synergy bonuses
                 nx = self.x + dx * dist
                 ny = self.y + dy * dist
                 if 0 <= nx < len(game.enemy_grid[0]) and 0 <= ny < len(game.enemy_grid):
@@ -203,30 +240,10 @@ class Tower:
 
         elif self.fire_type == "Beam":
             # Find target, damage increases over time on same target
-            target = None
-            best_dist = float('inf')
-            enemy_count = 0
-            max_enemies = 10
-            for dy in range(-int(self.range), int(self.range) + 1):
-                for dx in range(-int(self.range), int(self.range) + 1):
-                    if abs(dx) + abs(dy) > self.range:
-                        continue
-                    nx, ny = self.x + dx, self.y + dy
-                    if 0 <= nx < len(game.enemy_grid[0]) and 0 <= ny < len(game.enemy_grid):
-                        for e in game.enemy_grid[ny][nx]:
-                            if enemy_count >= max_enemies:
-                                break
-                            if e.alive and not e.leaked:
-                                enemy_count += 1
-                                dist = abs(dx) + abs(dy)
-                                if dist < best_dist:
-                                    best_dist = dist
-                                    target = e
-                    if enemy_count >= max_enemies:
-                        break
+            target = game.enemy_index.nearest_in(self.get_path_intervals(game), game.path, self.x, self.y)
 
             if target:
-                enemy_id = id(target)
+                enemy_id = target.uid
                 if enemy_id in self.beam_targets:
                     dmg_mult, frames = self.beam_targets[enemy_id]
                     dmg_mult += 0.5  # increase damage over time
@@ -247,31 +264,10 @@ class Tower:
             return None
 
         else:  # Ball or Overwatch (default)
-            # Standard projectile targeting - optimized using enemy grid
-            target = None
-            best_dist = float('inf')
-            enemy_count = 0
-            max_enemies = 10
+            # Standard projectile targeting - nearest enemy in range
             effective_range = 99 if self.fire_type == "Overwatch" else self.range
-
-            # Iterate over diamond-shaped area within range using grid
-            for dy in range(-int(effective_range), int(effective_range) + 1):
-                for dx in range(-int(effective_range), int(effective_range) + 1):
-                    if abs(dx) + abs(dy) > effective_range:
-                        continue
-                    nx, ny = self.x + dx, self.y + dy
-                    if 0 <= nx < len(game.enemy_grid[0]) and 0 <= ny < len(game.enemy_grid):
-                        for e in game.enemy_grid[ny][nx]:
-                            if enemy_count >= max_enemies:
-                                break
-                            if e.alive and not e.leaked:
-                                enemy_count += 1
-                                dist = abs(dx) + abs(dy)
-                                if dist < best_dist:
-                                    best_dist = dist
-                                    target = e
-                    if enemy_count >= max_enemies:
-                        break
+            target = game.enemy_index.nearest_in(self.get_path_intervals(game, effective_range),
+                                                 game.path, self.x, self.y)
 
             if target:
                 killed = target.take_damage(self.dmg)
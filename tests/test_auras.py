@@ -0,0 +1,62 @@
+import pytest
+from core.game import Game
+from core.auras import SlowAuraField, AURA_SLOW_PCT, AURA_SLOW_FRAMES
+from models.enemy import Enemy
+from models.tower import Tower
+
+
+def _aura_game():
+    game = Game(headless=True)
+    x, y = game.path[4]
+    tower = Tower(x, y + 1, "Neural Processor")
+    tower.upgrades.append("resist_2")
+    game.add_tower(tower)
+    return game, tower
+
+
+def test_field_matches_diamond():
+    """Test that the field covers exactly the path cells within aura range."""
+    game, tower = _aura_game()
+    field = SlowAuraField()
+
+    field.refresh(game)
+
+    for i, (px, py) in enumerate(game.path):
+        in_range = abs(px - tower.x) + abs(py - tower.y) <= tower.range
+        assert field.by_index[i] == (AURA_SLOW_PCT if in_range else 0)
+
+
+def test_field_rebuilt_only_on_change():
+    """Test that refresh is a no-op until an aura tower or the path changes."""
+    game, tower = _aura_game()
+    field = SlowAuraField()
+    field.refresh(game)
+    built = field.by_index
+
+    field.refresh(game)
+    assert field.by_index is built
+
+    tower.upgrades.remove("resist_2")
+    field.refresh(game)
+    assert not field.active
+
+
+@pytest.mark.parametrize("use_store", [True, False])
+def test_wave_tick_slows_enemies_in_aura(use_store):
+    """Test that enemies inside the aura get the slow debuff during update_wave."""
+    game, tower = _aura_game()
+    if not use_store:
+        game.enemy_store = None
+    game.wave_active = True
+    far = [i for i, (px, py) in enumerate(game.path) if abs(px - tower.x) + abs(py - tower.y) > tower.range + 1]
+    inside, outside = Enemy(game.path, "Drone", 1), Enemy(game.path, "Drone", 1)
+    inside.position_index = 4
+    outside.position_index = far[0]
+    for e in (inside, outside):
+        game.wave_manager.register_enemy(e)
+
+    game.wave_manager.update_wave(1)
+
+    assert inside.debuffs['slow']['amount'] == AURA_SLOW_PCT
+    assert inside.debuffs['slow']['frames_left'] == AURA_SLOW_FRAMES - 1  # One move since
+    assert 'slow' not in outside.debuffs
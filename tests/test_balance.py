@@ -0,0 +1,71 @@
+import json
+import pytest
+
+from balance import farm
+from balance.farm import FarmStats, play_game, run_farm
+from balance.strategies import STRATEGIES
+
+
+def _untimed(rows):
+    return sorted((tuple((k, v) for k, v in sorted(row.items()) if k != "tick_ms") for row in rows))
+
+
+@pytest.mark.parametrize("name", sorted(STRATEGIES))
+def test_strategy_plays(name):
+    """Test that each strategy plays waves through the economy without errors."""
+    rows = []
+    summary = play_game(11, name, waves=3, emit=rows.append)
+
+    assert summary["waves"] == len(rows) > 0
+    assert [row["wave"] for row in rows] == list(range(1, len(rows) + 1))
+    if name in ("greedy", "builder"):
+        assert rows[-1]["towers"] > 0
+
+
+def test_rows_count_every_enemy():
+    """Test that each wave's kills + leaks add up to the enemies it sent."""
+    rows = []
+    play_game(4, "idle", waves=2, emit=rows.append)
+
+    assert rows[0]["kills"] + rows[0]["leaks"] == 5 + 1 * 2
+    assert rows[0]["leaks"] == 20 - rows[0]["lives"]
+
+
+def test_farm_parallel_matches_inline():
+    """Test that rows streamed back from worker processes match playing the same games inline."""
+    inline_rows, pool_rows = [], []
+    _, inline = run_farm(["greedy", "random"], games=3, waves=2, workers=1, seed=5, on_row=inline_rows.append)
+    stats, pooled = run_farm(["greedy", "random"], games=3, waves=2, workers=2, seed=5, on_row=pool_rows.append)
+
+    assert _untimed(pool_rows) == _untimed(inline_rows)
+    assert len(pooled) == len(inline) == 6
+    assert stats.rows == len(pool_rows)
+
+
+def test_percentile_tables():
+    """Test per-wave nearest-rank percentiles over many games."""
+    stats = FarmStats()
+    for i in range(100):
+        for wave in (1, 2):
+            stats.add({"strategy": "s", "wave": wave, "lives": i, "gold": 0, "xp": 0, "spl": 0,
+                       "towers": wave, "kills": 0, "leaks": 0, "ticks": 0, "tick_ms": 0.0})
+
+    table = stats.table("s", "lives")
+
+    assert table[1] == {"n": 100, "p5": 5, "p25": 25, "p50": 50, "p75": 75, "p95": 95}
+    assert stats.table("s", "towers")[2]["p50"] == 2
+    json.dumps(stats.to_dict())
+
+
+def test_cli_writes_tables(tmp_path, capsys):
+    """Test that the CLI streams rows and writes the tables and summary."""
+    rows, out = tmp_path / "rows.jsonl", tmp_path / "tables.json"
+
+    assert farm.main(["--games", "2", "--waves", "2", "--workers", "1", "--strategy", "idle",
+                      "--rows", str(rows), "--out", str(out)]) == 0
+
+    data = json.loads(out.read_text())
+    assert data["summary"]["idle"]["games"] == 2
+    assert "1" in data["tables"]["idle"]["lives"]
+    assert len(rows.read_text().splitlines()) == 4
+    assert "idle / lives" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+import pytest
+
+from benchmarks import runner
+from benchmarks.scenarios import SCENARIOS
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenario_runs(name):
+    """Test that each scenario builds its load and survives a short sim run."""
+    result = runner.bench_sim(name, ticks=20)
+
+    assert result["ticks"] == 20
+    assert result["ticks_per_sec"] > 0
+
+
+def test_scenario_loads():
+    """Test that the scenarios build the boards they are named after."""
+    assert len(runner._build("wave30_mixed_towers", 0).towers) == 60
+    assert len(runner._build("enemies_2000", 0).enemies) == 2000
+    game = runner._build("latched_40", 0)
+    assert sum(1 for e in game.enemies if e.is_latched) == 40
+    game = runner._build("grid_120", 0)
+    assert (game.width, game.height) == (120, 120)
+
+
+def test_scenarios_are_deterministic():
+    """Test that a seed always builds the same board."""
+    a, b = runner._build("enemies_2000", 3), runner._build("enemies_2000", 3)
+
+    assert a.path == b.path
+    assert [e.position_index for e in a.enemies] == [e.position_index for e in b.enemies]
+
+
+def test_render_benchmark():
+    """Test that the draw benchmark runs under the dummy video driver."""
+    pytest.importorskip("pygame")
+    result = runner.bench_render("latched_40", frames=3)
+
+    assert result["frames"] == 3 and result["frames_per_sec"] > 0
+
+
+def test_compare_flags_regressions():
+    """Test that only slowdowns beyond the tolerance count as regressions."""
+    baseline = {"scenarios": {"a": {"sim": {"ticks_per_sec": 1000.0}, "render": {"frames_per_sec": 100.0}}}}
+    results = {"scenarios": {"a": {"sim": {"ticks_per_sec": 950.0}, "render": {"frames_per_sec": 80.0}},
+                             "new": {"sim": {"ticks_per_sec": 1.0}}}}
+
+    rows = runner.compare(results, baseline)
+
+    assert [(r[0], r[1]) for r in rows] == [("a", "ticks_per_sec"), ("a", "frames_per_sec")]
+    assert [r[1] for r in runner.regressions(rows, tolerance=0.10)] == ["frames_per_sec"]
@@ -234,4 +234,16 @@ def test_web_mode_enemy_scaling():
     scout_web = Enemy(path, "Scout", 1, web_mode=True)
 
     assert scout_web.max_health == int(scout_normal.max_health * 0.75)
-    assert scout_web.move_speed == int(scout_normal.move_speed * 0.75)
\ No newline at end of file
+    assert scout_web.move_speed == int(scout_normal.move_speed * 0.75)
+
+def test_uid_peek_and_reserve():
+    """Test that peeking doesn't use up a uid and reserving never moves the counter back."""
+    path = [(0, 0), (1, 0)]
+    uid = Enemy.peek_next_uid()
+    assert Enemy.peek_next_uid() == uid
+    assert Enemy(path).uid == uid
+
+    Enemy.reserve_uids(uid + 50)
+    assert Enemy(path).uid == uid + 50
+    Enemy.reserve_uids(1)
+    assert Enemy(path).uid == uid + 51
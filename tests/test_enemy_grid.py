@@ -0,0 +1,114 @@
+import random
+import pytest
+from benchmarks.scenarios import extend_path_with_tiles
+from core.game import Game
+from models.enemy import Enemy
+
+
+def _grid_matches_enemies(game):
+    """Every live enemy is filed under its current cell and path index, and nothing else is."""
+    filed = {}
+    for y, row in enumerate(game.enemy_grid):
+        for x, cell in enumerate(row):
+            for e in cell:
+                assert id(e) not in filed, "enemy filed in two cells"
+                filed[id(e)] = (x, y)
+    expected = {id(e): e.get_position() for e in game.enemies if e.get_position()}
+    indexed = {id(e): i for i, bucket in game.enemy_index.buckets.items() for e in bucket}
+    expected_index = {id(e): e.position_index for e in game.enemies if e.get_position()}
+    return filed == expected and indexed == expected_index
+
+
+def test_grid_tracks_spawn_and_movement():
+    """Test that enemy_grid stays in sync as enemies spawn, move and leave."""
+    game = Game(headless=True)
+    game.lives = 1000
+    game.wave_manager.start_next_wave()
+
+    for frame in range(1, 600):
+        game.wave_manager.update_wave(frame)
+        assert _grid_matches_enemies(game), f"grid out of sync at frame {frame}"
+
+
+def test_dead_enemy_leaves_grid():
+    """Test that a killed enemy is removed from its cell in the same tick."""
+    game = Game(headless=True)
+    enemy = Enemy(game.path, "Basic", 1)
+    game.wave_manager.register_enemy(enemy)
+    x, y = enemy.get_position()
+    assert enemy in game.enemy_grid[y][x]
+
+    enemy.alive = False
+    game.wave_active = True
+    game.wave_manager.update_wave(1)
+
+    assert enemy not in game.enemy_grid[y][x]
+    assert enemy.grid_cell is None
+
+
+def test_grid_survives_expand():
+    """Test that registered cells shift with the grid when the map expands."""
+    game = Game(headless=True)
+    enemy = Enemy(game.path, "Basic", 1)
+    game.wave_manager.register_enemy(enemy)
+
+    game.expand_grid([(0, 0)])  # Touches the north-west corner: shifts by (2, 2)
+
+    assert _grid_matches_enemies(game)
+    x, y = enemy.grid_cell
+    assert (x, y) == enemy.get_position()
+    assert enemy in game.enemy_grid[y][x]
+
+
+def test_grid_survives_path_recompute():
+    """Test that enemies are refiled when a tile placement falls back to a full path recompute."""
+    game = Game(headless=True)
+    enemies = [Enemy(game.path, "Basic", 1) for _ in range(len(game.path))]
+    for i, e in enumerate(enemies):
+        e.position_index = i
+        game.wave_manager.register_enemy(e)
+    # A shortcut start -> cell 4 makes the BFS path skip cells 1-3 on the next recompute
+    game.path_graph.add_edge(game.path[0], game.path[4])
+    before = list(game.path)
+
+    assert extend_path_with_tiles(game, 1, random.Random(0)) == 1
+
+    assert game.path[:len(before)] != before
+    assert _grid_matches_enemies(game)
+
+
+def test_egrem_spawn_shares_game_path():
+    """Test that egrem-spawned enemies start part-way along game.path itself."""
+    game = Game(headless=True)
+    x, y = game.path[5]
+
+    enemy = game.wave_manager.spawn_enemy_at_position("Drone", x, y, 1)
+
+    assert enemy.path is game.path
+    assert enemy.position_index == 5
+    assert enemy in game.enemy_index.buckets[5]
+
+
+def test_compaction_clears_references():
+    """Test that removing a dead enemy drops the selection and its wall latch."""
+    from models.assimilator import Assimilator
+    game = Game(headless=True)
+    game.wave_active = True
+    wall_manager = game.board.wall_manager
+    enemy = Assimilator(game.path, 1)
+    enemy.set_game_reference(game)
+    game.wave_manager.register_enemy(enemy)
+    survivor = Enemy(game.path, "Drone", 1)
+    game.wave_manager.register_enemy(survivor)
+    x, y = enemy.get_position()
+    wall_manager.add_wall(x + 1, y, "hybrid")
+    assert enemy.latch_to(x + 1, y, 'wall', wall_manager)
+    game.selected_enemy = enemy
+
+    enemy.take_damage(enemy.health)
+    game.wave_manager.update_wave(1)
+
+    assert game.enemies == [survivor]
+    assert game.selected_enemy is None
+    assert enemy.uid not in wall_manager.get_wall(x + 1, y).latched_assimilators
+    assert not enemy.is_latched
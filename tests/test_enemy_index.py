@@ -0,0 +1,64 @@
+import pytest
+from core.enemy_index import PathEnemyIndex
+
+
+class _Stub:
+    """Minimal enemy stand-in: the index only looks at alive/leaked."""
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.leaked = False
+
+
+def test_add_move_remove():
+    """Test that occupied indices track enemies as they are added, moved and removed."""
+    index = PathEnemyIndex()
+    a, b = _Stub(), _Stub()
+    index.add(a, 3)
+    index.add(b, 3)
+    assert index.occupied == [3]
+
+    index.move(a, 4)
+    assert index.occupied == [3, 4]
+    assert a.path_slot == 4
+
+    index.remove(b)
+    index.remove(b)  # Second remove is a no-op
+    assert index.occupied == [4]
+    assert len(index) == 1
+
+
+def test_interval_queries():
+    """Test all_in / nearest_in over several intervals."""
+    index = PathEnemyIndex()
+    enemies = {i: _Stub() for i in (1, 5, 6, 12, 20)}
+    for i, e in enemies.items():
+        index.add(e, i)
+
+    assert index.all_in([(0, 5), (10, 15)]) == [enemies[1], enemies[5], enemies[12]]
+    path = [(i, 0) for i in range(25)]
+    assert index.nearest_in([(0, 6), (10, 15)], path, 10, 0) is enemies[12]
+    assert index.nearest_in([(0, 5), (10, 15)], path, 8, 0) is enemies[5]
+    assert index.nearest_in([(7, 11)], path, 8, 0) is None
+
+
+def test_nearest_ties_follow_scan_order():
+    """Test that equally near enemies are picked in row-major diamond scan order."""
+    index = PathEnemyIndex()
+    below, above, left = _Stub(), _Stub(), _Stub()
+    path = [(3, 1), (3, -1), (2, 0)]
+    for i, e in enumerate((below, above, left)):
+        index.add(e, i)
+
+    assert index.nearest_in([(0, 2)], path, 3, 0) is above
+    assert index.nearest_in([(0, 0), (2, 2)], path, 3, 0) is left
+
+
+def test_queries_skip_dead_enemies():
+    """Test that dead enemies still filed in the index are never returned."""
+    index = PathEnemyIndex()
+    dead, live = _Stub(alive=False), _Stub()
+    index.add(live, 2)
+    index.add(dead, 8)
+
+    assert index.nearest_in([(0, 10)], [(i, 0) for i in range(11)], 8, 0) is live
+    assert index.all_in([(0, 10)]) == [live]
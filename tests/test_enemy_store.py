@@ -0,0 +1,86 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.game import Game
+from core.headless import HeadlessRunner
+from models.enemy import Enemy
+from models.enemy_store import EnemyStore
+
+
+def test_attach_detach_round_trip():
+    """Test that fields survive moving into the store and back onto the object."""
+    path = [(x, 0) for x in range(10)]
+    store = EnemyStore(path, capacity=1)
+    enemy = Enemy(path, "Scout", 3)
+    enemy.apply_debuff('slow', 40, 12)
+    health = enemy.health
+
+    store.attach(enemy)
+    enemy.take_damage(5)
+    assert enemy.health == health - 5
+    assert store.health[enemy._slot] == health - 5
+    assert enemy.debuffs['slow'] == {'amount': 40, 'frames_left': 12}
+
+    store.detach(enemy)
+    assert enemy._store is None
+    assert enemy.health == health - 5
+    assert len(store) == 0
+
+
+def test_move_all_matches_scalar_move():
+    """Test that the vectorized move matches Enemy.move tick for tick."""
+    rng = random.Random(7)
+    path = [(x, 0) for x in range(30)]
+    store = EnemyStore(path, capacity=4)  # Forces growth
+    pairs = []
+    for _ in range(20):
+        kind = rng.choice(list(Enemy.TYPES))
+        viewed, plain = Enemy(path, kind, 1), Enemy(path, kind, 1)
+        if rng.random() < 0.5:
+            amount, frames = rng.randint(10, 60), rng.randint(1, 40)
+            viewed.apply_debuff('slow', amount, frames)
+            plain.apply_debuff('slow', amount, frames)
+        store.attach(viewed)
+        pairs.append((viewed, plain))
+
+    for _ in range(400):
+        moved = store.move_all()
+        for viewed, plain in pairs:
+            old = plain.position_index
+            plain.move()
+            assert (viewed in moved) == (plain.position_index != old)
+
+    for viewed, plain in pairs:
+        assert viewed.position_index == plain.position_index
+        assert viewed.move_counter == plain.move_counter
+        assert viewed.leaked == plain.leaked
+        assert viewed.debuffs == plain.debuffs
+
+
+def test_batched_damage():
+    """Test that damage() hits every target once and reports kills."""
+    path = [(0, 0), (1, 0)]
+    store = EnemyStore(path)
+    weak, strong = Enemy(path, "Scout", 1), Enemy(path, "Assimilator", 5)
+    for e in (weak, strong):
+        store.attach(e)
+
+    killed = store.damage([weak, strong], weak.health)
+
+    assert killed
+    assert not weak.alive and strong.alive
+
+
+def test_store_and_fallback_runs_agree():
+    """Test that headless runs with and without the store end in the same state."""
+    def run(use_store):
+        game = Game(headless=True, seed=1234)
+        if not use_store:
+            game.enemy_store = None
+        return HeadlessRunner(game).run(3)
+
+    with_store, without_store = run(True), run(False)
+    for key in ("round_num", "lives", "gold", "enemies", "waves_completed"):
+        assert with_store[key] == without_store[key]
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import os
+import pytest
+from core.game import Game
+from core.headless import HeadlessRunner
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_headless_runs_waves():
+    """Test that the headless runner completes waves without a renderer."""
+    game = Game(headless=True)
+    runner = HeadlessRunner(game)
+
+    stats = runner.run(2)
+
+    assert stats["waves_completed"] == 2
+    assert stats["round_num"] == 3
+    assert stats["ticks"] > 0
+    assert stats["ticks_per_sec"] > 0
+    assert not game.wave_active
+
+
+def test_headless_stops_on_game_over():
+    """Test that the runner stops once the game is over."""
+    game = Game(headless=True)
+    game.lives = 1
+    runner = HeadlessRunner(game)
+
+    stats = runner.run(5)
+
+    assert stats["game_over"]
+    assert stats["waves_completed"] == 0
+
+
+def test_headless_imports_nothing_from_ui():
+    """Test that a headless run pulls in neither ui/ nor pygame."""
+    code = (
+        "import sys\n"
+        "from core.game import Game\n"
+        "from core.headless import HeadlessRunner\n"
+        "HeadlessRunner(Game(headless=True)).run(1)\n"
+        "bad = [m for m in sys.modules if m == 'pygame' or m.startswith('pygame.') or m == 'ui' or m.startswith('ui.')]\n"
+        "assert not bad, bad\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -114,7 +114,7 @@ def test_tower_latch_vulnerability(game):
     """Test that towers can be latched based on their type."""
     # Create a tower (default is latchable)
     tower = Tower(6, 5, "Oscillator")
-    game.towers.append(tower)
+    game.add_tower(tower)
 
     # Create assimilator
     assimilator = Assimilator([(5, 5), (6, 5)], wave_num=9)
@@ -213,7 +213,7 @@ def test_pure_repel(game, board_manager):
     # Create a tower with camouflage active
     tower = Tower(7, 5, "Oscillator")
     tower.game = game  # Set game reference
-    game.towers.append(tower)
+    game.add_tower(tower)
 
     # Enable camouflage meta-unlock
     if not hasattr(game, 'meta_unlocks_active'):
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+pytest.importorskip("pygame")
+
+import ui.swarm_fx as swarm_fx
+from ui.swarm_fx import ParticlePool, SwarmFXManager
+
+
+@pytest.fixture(params=["numpy", "lists"])
+def pool_backend(request, monkeypatch):
+    """Run each test against the NumPy arrays and the plain-list fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(swarm_fx, "np", None)
+    return request.param
+
+
+def test_budget_caps_bursts(pool_backend):
+    """Test that emission beyond capacity is dropped, not queued."""
+    pool = ParticlePool(capacity=20, rng=random.Random(1))
+    pool.emit((0, 0), (255, 0, 0), 15, 30, (1, 2))
+    pool.emit((0, 0), (255, 0, 0), 15, 30, (1, 2))
+
+    assert len(pool) == 20
+    assert pool.dropped == 10
+
+
+def test_update_moves_and_culls(pool_backend):
+    """Test that particles move along their velocity and expire after their lifetime."""
+    pool = ParticlePool(capacity=50, rng=random.Random(2))
+    pool.emit((100, 100), (0, 0, 255), 10, 10, (5, 5))
+
+    pool.update(1.0)
+    x, y = pool.arrays["x"][0], pool.arrays["y"][0]
+    assert abs(((x - 100) ** 2 + (y - 100) ** 2) ** 0.5 - 5) < 1e-3
+
+    for _ in range(10):
+        pool.update(1.0)
+    assert len(pool) == 0
+
+    # Freed slots are reused
+    pool.emit((0, 0), (0, 0, 255), 50, 10, (1, 1))
+    assert len(pool) == 50 and pool.dropped == 0
+
+
+def test_manager_bursts_share_budget(pool_backend):
+    """Test that latch and corruption bursts draw from one global budget."""
+    fx = SwarmFXManager()
+    for _ in range(100):
+        fx.add_latch_effect((10, 10), 3)
+        fx.add_corruption_effect((20, 20))
+
+    assert len(fx.particles) == SwarmFXManager.MAX_PARTICLES
+    assert fx.get_active_effects_count()["particles"] == SwarmFXManager.MAX_PARTICLES
+
+
+def _world_to_screen(wx, wy):
+    return wx * 40.0, 270.0 + wy * 40.0
+
+
+def test_latch_sprites_shared_and_cached():
+    """Test that latches with the same geometry reuse one pre-rendered sprite per jitter variant."""
+    import pygame
+
+    surface = pygame.Surface((400, 600))
+    fx = SwarmFXManager()
+    for _ in range(50):  # Fifty latches, same cell delta and stack
+        fx.draw_latch(surface, (2, 3), (3, 3), 3, _world_to_screen)
+    fx.draw_latch(surface, (5, 5), (6, 5), 3, _world_to_screen)
+
+    assert fx.latch_cache.misses <= SwarmFXManager.LATCH_JITTER_VARIANTS
+    assert fx.latch_cache.hits >= 50 - SwarmFXManager.LATCH_JITTER_VARIANTS
+
+
+def test_large_stack_latch_draws():
+    """Test that a stack of 5+ (glow rings) renders from float screen coordinates."""
+    import pygame
+
+    surface = pygame.Surface((400, 600))
+    fx = SwarmFXManager()
+
+    fx.draw_latch(surface, (2, 3), (2, 4), 6, _world_to_screen)
+
+    assert len(fx.latch_cache) == 1
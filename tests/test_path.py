@@ -147,4 +147,76 @@ def test_disconnected_graph():
 
     # No path between them
     path = graph.get_ordered_path()
-    assert path == []
\ No newline at end of file
+    assert path == []
+
+def _chain(cells):
+    graph = PathGraph()
+    for a, b in zip(cells, cells[1:]):
+        graph.add_edge(a, b)
+    graph.set_start(cells[0])
+    graph.set_end(cells[-1])
+    return graph
+
+
+def test_extend_path_incremental():
+    """Test that extending at the end appends to the cached path without a BFS."""
+    graph = _chain([(0, 0), (1, 0), (2, 0)])
+    cached = graph.get_ordered_path()
+
+    assert graph.extend_path([(3, 0), (3, 1)])
+
+    assert graph.get_ordered_path() is cached
+    assert cached == [(0, 0), (1, 0), (2, 0), (3, 0), (3, 1)]
+    assert graph.end == (3, 1)
+    assert frozenset({(2, 0), (3, 0)}) in graph.edges
+
+
+def test_extend_path_falls_back_on_existing_nodes():
+    """Test that reusing existing nodes triggers a full recompute that matches BFS."""
+    graph = _chain([(0, 0), (1, 0), (2, 0)])
+    graph.get_ordered_path()
+
+    # Loops back onto (1, 0), so the new end is reachable by a shortcut
+    assert not graph.extend_path([(2, 1), (1, 1), (1, 0), (1, -1)])
+
+    assert graph.get_ordered_path() == [(0, 0), (1, 0), (1, -1)]
+
+
+def test_translate_keeps_cache_and_start():
+    """Test that translating shifts nodes, endpoints and the cached path."""
+    graph = _chain([(0, 0), (1, 0), (2, 0)])
+    graph.get_ordered_path()
+
+    graph.translate(2, 2)
+
+    assert graph.start == (2, 2) and graph.end == (4, 2)
+    assert graph.get_ordered_path() == [(2, 2), (3, 2), (4, 2)]
+    assert graph.extend_path([(5, 2)])
+    assert graph.get_ordered_path()[-1] == (5, 2)
+
+
+def test_game_path_graph_survives_expand():
+    """Test that the graph still knows the full path after a west/north expansion."""
+    from core.game import Game
+    game = Game()
+
+    game.expand_grid([(0, 0)])
+
+    assert game.path_graph.get_ordered_path() == game.path
+    assert game.path_graph.get_ordered_path() is not game.path
+
+
+def test_path_index_and_closest_lookup():
+    """Test path_index and closest_path_index against a brute-force scan."""
+    from core.game import Game
+    game = Game()
+
+    assert all(game.path[i] == pos for pos, i in game.path_index.items())
+    for y in range(-2, game.height + 2):
+        for x in range(-2, game.width + 2):
+            closest = min(game.path, key=lambda p: abs(p[0] - x) + abs(p[1] - y))
+            assert game.closest_path_index(x, y) == game.path.index(closest)
+
+    game.expand_grid([(0, 0)])
+    assert all(game.path[i] == pos for pos, i in game.path_index.items())
+    assert len(game.path_index) == len(set(game.path))
@@ -0,0 +1,102 @@
+import json
+import os
+import pytest
+
+from core.game import Game
+from core.profiler import FrameProfiler
+
+
+def _run_wave(game, frames=30):
+    game.wave_manager.start_next_wave()
+    for frame in range(1, frames + 1):
+        game.wave_manager.update_wave(frame)
+
+
+def test_disabled_profiler_records_nothing():
+    """Test that a disabled profiler collects no samples and wraps nothing."""
+    game = Game()
+    _run_wave(game)
+
+    assert not game.profiler.enabled
+    assert game.profiler.samples == {}
+
+
+def test_update_wave_stages_recorded_when_enabled():
+    """Test that update_wave laps each stage while the profiler is on."""
+    game = Game()
+    game.profiler.enable()
+    _run_wave(game, frames=10)
+
+    stats = game.profiler.stats()
+    for stage in ("wave.spawn", "wave.towers", "wave.move", "wave.grid", "wave.cleanup"):
+        assert stats[stage]["n"] == 10
+
+
+def test_instrument_and_restore():
+    """Test that enabling wraps methods on the instance and disabling restores them."""
+    class Target:
+        def handle_events(self, frame):
+            return frame * 2
+
+    target = Target()
+    prof = FrameProfiler()
+    prof.enable(handler=target)
+    assert "handle_events" in vars(target)
+    assert target.handle_events(3) == 6
+    assert prof.stats()["events"]["n"] == 1
+
+    prof.disable()
+    assert "handle_events" not in vars(target)
+    assert prof.stats()["events"]["n"] == 1  # Samples survive disable
+
+
+def test_rolling_stats():
+    """Test avg/p95/max over the rolling window."""
+    prof = FrameProfiler(window=100)
+    for ms in range(200):
+        prof.record("x", float(ms))
+
+    st = prof.stats()["x"]
+    assert st["n"] == 100
+    assert st["avg"] == pytest.approx(149.5)
+    assert st["p95"] == 195.0
+    assert st["max"] == 199.0
+
+
+def test_dump_writes_json(tmp_path):
+    """Test that dump writes stats and entity counts."""
+    game = Game()
+    game.profiler.enable()
+    _run_wave(game, frames=5)
+
+    path = game.profiler.dump(str(tmp_path / "profile.json"), game)
+    with open(path) as f:
+        data = json.load(f)
+
+    assert data["sections"]["wave.move"]["n"] == 5
+    assert data["counts"]["enemies"] == len(game.enemies)
+
+
+def test_renderer_overlay_and_draw_sections():
+    """Test that the overlay draws and each _draw_* method gets its own section."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from ui.renderer import Renderer
+
+    pygame.init()
+    try:
+        game = Game()
+        renderer = Renderer(game)
+        game.profiler.enable(renderer=renderer)
+        renderer.draw(1)
+        renderer.draw(2)
+
+        stats = game.profiler.stats()
+        assert stats["draw"]["n"] == 2
+        assert "draw.towers" in stats and "draw.profiler" in stats
+
+        game.profiler.disable()
+        assert not any(name.startswith("_draw") for name in vars(renderer))
+    finally:
+        pygame.quit()
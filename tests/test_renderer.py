@@ -0,0 +1,58 @@
+import os
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from core.game import Game
+from ui.renderer import Renderer
+
+PATH_CELL = (120, 80, 40)
+
+
+@pytest.fixture
+def renderer():
+    pygame.init()
+    r = Renderer(Game(seed=7))
+    yield r
+    pygame.quit()
+
+
+def _path_cells_painted(renderer):
+    """Check the corner of each on-screen path cell shows the path colour."""
+    checked = 0
+    for x, y in renderer.game.path:
+        sx, sy = renderer.world_to_screen(x, y)
+        px, py = int(sx) + 2, int(sy) + 2
+        if 0 <= px < renderer.WIDTH and renderer.grid_y <= py < renderer.HEIGHT:
+            assert renderer.screen.get_at((px, py))[:3] == PATH_CELL
+            checked += 1
+    return checked
+
+
+def test_draw_grid_paints_path(renderer):
+    """Test that _draw_grid paints every path cell and its connectors (cached layer)."""
+    assert renderer.game.path
+    renderer._draw_grid()
+
+    assert _path_cells_painted(renderer) > 0
+
+
+def test_draw_grid_uncached(renderer, monkeypatch):
+    """Test the direct-to-screen branch used when the map is too big to cache."""
+    monkeypatch.setattr(Renderer, "MAP_LAYER_MAX_PIXELS", 0)
+    renderer._draw_grid()
+
+    assert renderer._map_layer is None
+    assert _path_cells_painted(renderer) > 0
+
+
+def test_full_frame_with_path(renderer):
+    """Test a full draw() with a path, towers and a running wave."""
+    game = renderer.game
+    game.wave_manager.start_next_wave()
+    for frame in range(1, 120):
+        game.wave_manager.update_wave(frame)
+    renderer.draw(120)
+    renderer.present()
@@ -0,0 +1,207 @@
+import os
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+from core.game import Game
+from ui.renderer import Renderer
+
+
+@pytest.fixture
+def renderer():
+    pygame.init()
+    r = Renderer(Game())
+    yield r
+    pygame.quit()
+
+
+def test_map_layer_cached_between_frames(renderer):
+    """Test that the static map layer is built once and reused while nothing changes."""
+    renderer.draw(1)
+    layer = renderer._map_layer
+    assert layer is not None
+
+    renderer.camera_x += 15  # Panning only moves the blit
+    renderer.draw(2)
+
+    assert renderer._map_layer is layer
+
+
+def test_map_layer_rebuilt_on_change(renderer):
+    """Test that path changes and zoom rebuild the layer."""
+    renderer.draw(1)
+    layer = renderer._map_layer
+
+    renderer.game.path_version += 1
+    renderer.draw(2)
+    assert renderer._map_layer is not layer
+
+    layer = renderer._map_layer
+    renderer.zoom_level = 1.5
+    renderer.draw(3)
+    assert renderer._map_layer is not layer
+
+
+def test_map_layer_falls_back_when_too_large(renderer, monkeypatch):
+    """Test that an oversized layer is skipped and the map drawn directly."""
+    monkeypatch.setattr(Renderer, "MAP_LAYER_MAX_PIXELS", 10)
+
+    renderer.draw(1)
+
+    assert renderer._map_layer is None
+
+
+def test_map_layer_cap_lower_in_web_mode(renderer):
+    """Test that web mode skips the layer at a size desktop still caches."""
+    renderer.zoom_level = 2.0  # ~1.6M pixels on the 18x14 start map: between the two caps
+    renderer.draw(1)
+    assert renderer._map_layer is not None
+
+    renderer.game.web_mode = True
+    renderer.game.path_version += 1
+    renderer.draw(2)
+    assert renderer._map_layer is None
+
+
+def test_surface_cache_lru_eviction():
+    """Test that the LRU counts hits/misses and evicts the least recently used entry."""
+    from ui.surface_cache import SurfaceCache
+
+    cache = SurfaceCache(max_size=2)
+    built = []
+    make = lambda k: (lambda: built.append(k) or k.upper())
+
+    assert cache.get("a", make("a")) == "A"
+    assert cache.get("b", make("b")) == "B"
+    assert cache.get("a", make("a")) == "A"  # hit, "a" becomes most recent
+    cache.get("c", make("c"))                # evicts "b"
+
+    assert built == ["a", "b", "c"]
+    assert "b" not in cache and "a" in cache and len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_text_rendered_once_across_frames(renderer):
+    """Test that a second identical frame renders all of its text from the cache."""
+    renderer.draw(1)
+    misses = renderer.text_cache.misses
+    assert misses > 0
+
+    renderer._panels.clear()  # Repaint the panels too, so all their text is looked up again
+    renderer.draw(1)
+
+    assert renderer.text_cache.misses == misses
+    assert renderer.text_cache.hits >= misses
+
+
+def test_render_text_keys_on_color(renderer):
+    """Test that the same text in another colour is a separate surface."""
+    a = renderer._render_text(renderer.font_s, "Gold", (255, 255, 255))
+    b = renderer._render_text(renderer.font_s, "Gold", (255, 0, 0))
+
+    assert a is not b
+    assert renderer._render_text(renderer.font_s, "Gold", (255, 255, 255)) is a
+    assert renderer._render_text(renderer.font_s, "", (255, 255, 255)) is None
+
+
+def test_cached_panels_match_full_repaint(renderer):
+    """Test that a frame drawn from cached panels is pixel-identical to a full repaint."""
+    renderer.draw(1)
+    repainted = pygame.image.tostring(renderer.screen, "RGB")
+
+    renderer.draw(2)
+
+    assert renderer._panel_rects == []
+    assert pygame.image.tostring(renderer.screen, "RGB") == repainted
+
+
+def test_panel_repainted_only_when_inputs_change(renderer):
+    """Test that a gold change repaints just the right panel and reports it as dirty."""
+    renderer.draw(1)
+    assert renderer.dirty_rects is None  # First frame is flipped whole
+
+    renderer.game.gold += 10
+    renderer.draw(2)
+
+    right = renderer._panels["right_panel"][1]
+    assert renderer._panel_rects == [right]
+    assert right in renderer.dirty_rects
+
+
+def test_panel_keys_follow_content(renderer):
+    """Test that panels key on what they show: equal copies reuse the cache, new content repaints."""
+    game = renderer.game
+    game.shop[0] = {"type": "Plasma Capacitor", "cost": 3}
+    renderer.draw(1)
+    renderer.draw(2)
+
+    game.shop[0] = dict(game.shop[0])  # Same card, new object
+    renderer.draw(3)
+    assert renderer._panel_rects == []
+
+    game.shop[0] = {"type": "Signal Router", "cost": 3}
+    renderer.draw(4)
+    assert renderer._panel_rects == [renderer._panels["shop"][1]]
+
+
+def test_camera_move_presents_full_frame(renderer):
+    """Test that moving the camera falls back to a full flip."""
+    renderer.draw(1)
+    renderer.draw(2)
+    assert renderer.dirty_rects is not None
+
+    renderer.camera_x += 40
+    renderer.draw(3)
+
+    assert renderer.dirty_rects is None
+
+
+def test_overlays_built_once(renderer):
+    """Test that range rings and dialog circles are reused on steady-state frames."""
+    from models.tower import Tower
+
+    game = renderer.game
+    t = Tower(1, 1, "Neural Processor")
+    t.fire_type = "Radius"
+    game.add_tower(t)
+    game.upgrade_dialog_tower = t
+
+    renderer.draw(1)
+    misses = renderer.overlay_cache.misses
+    assert misses >= 2  # Radius ring + dialog range circle
+
+    renderer.draw(2)
+
+    assert renderer.overlay_cache.misses == misses
+    assert renderer.overlay_cache.hits >= 2
+
+
+def test_sprite_atlas_rebuilds_lazily_on_zoom(renderer):
+    """Test that tower/enemy sprites are built once per zoom level and dropped on zoom change."""
+    from models.tower import Tower
+
+    game = renderer.game
+    game.add_tower(Tower(1, 1, "Neural Processor"))
+    game.wave_manager.start_next_wave()
+    for f in range(1, 40):
+        game.wave_manager.update_wave(f)
+    assert game.enemies
+
+    renderer.draw(40)
+    atlas = renderer.atlas
+    builds = atlas.builds
+    assert len(atlas) >= 3  # Tower, enemy body, HP bar
+
+    renderer.draw(41)
+    assert atlas.builds == builds
+
+    renderer.zoom_level = 1.0 + 0.1 + 0.1 - 0.2  # Float drift quantizes to the same level
+    renderer.draw(42)
+    assert atlas.builds == builds
+
+    renderer.zoom_level = 1.5
+    renderer.draw(43)
+    assert atlas.zoom == 1.5
+    assert atlas.builds > builds
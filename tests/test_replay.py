@@ -0,0 +1,109 @@
+import os
+import pytest
+
+from core.game import Game
+from core.replay import Replay, ReplayError, ReplayPlayer, ReplayRecorder, apply_action
+
+
+def _free_cell_near_path(game):
+    return next((x, y) for y in range(game.height) for x in range(game.width)
+                if game.grid[y][x] == '.' and min(abs(x - px) + abs(y - py) for px, py in game.path) == 1)
+
+
+def _play_live(game, recorder):
+    """A short scripted session: buy, place, start waves, toggle auto, pause/unpause."""
+    script = {
+        0: [("buy", (0,)), ("buy", (1,))],
+        5: [("select_bench", (0,))],
+        6: [("place_tower", (*_free_cell_near_path(game), 0))],
+        8: [("auto", (1,))],
+        10: [("start_wave", ())],
+        100: [("pause", (1,))],
+        160: [("pause", (0,))],
+        900: [("reroll", ()), ("cycle_shop_mode", ())],
+        1500: [("auto", (0,))],
+    }
+    frame = 0
+    while frame <= 1500 or game.wave_active:
+        for name, args in script.get(frame, ()):
+            recorder.record(frame, name, *args)
+            apply_action(game, frame, name, args)
+        frame += 1
+        if not game.paused:
+            game.wave_manager.update_wave(frame)
+
+
+def _state(game):
+    return (game.round_num, game.lives, game.gold, [(t.base_type, t.x, t.y) for t in game.towers],
+            [card and card["type"] for card in game.shop], game.rng.sim.getstate())
+
+
+def test_varint_round_trip():
+    """Test that ticks, negative args and big seeds survive encoding."""
+    replay = Replay(seed=2 ** 70 + 5, minimal_mode=True, actions=[
+        (0, "buy", (0,)), (0, "start_wave", ()), (129, "sell_tower", (-3, 300)),
+        (100000, "place_tile", (2, -1, 17, 3)),
+    ])
+
+    loaded = Replay.from_bytes(replay.to_bytes())
+
+    assert loaded.seed == replay.seed and loaded.minimal_mode and not loaded.web_mode
+    assert loaded.actions == replay.actions
+
+
+def test_log_is_compact():
+    """Test that a record is a handful of bytes."""
+    actions = [(i * 30, "place_tower", (10, 12, 3)) for i in range(1000)]
+
+    data = Replay(seed=1, actions=actions).to_bytes()
+
+    assert len(data) < 6 * 1000
+
+
+def test_bad_files_rejected():
+    """Test that non-replays and truncated logs raise ReplayError."""
+    data = Replay(seed=1, actions=[(5, "place_tower", (10, 12, 3))]).to_bytes()
+
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(b"nope" + data[4:])
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(data[:-1])
+
+
+def test_replay_reproduces_session(tmp_path):
+    """Test that replaying a recorded session ends in exactly the recorded state."""
+    path = str(tmp_path / "session.tdr")
+    live = Game(seed=42, headless=True)
+    recorder = ReplayRecorder(path, live)
+    _play_live(live, recorder)
+    recorder.close()
+
+    player = ReplayPlayer(Replay.load(path))
+    stats = player.run()
+
+    assert stats["actions"] == recorder.count
+    assert _state(player.game) == _state(live)
+    assert live.round_num > 2  # The session actually played waves
+
+
+def test_event_handler_records_clicks(tmp_path):
+    """Test that clicks handled by EventHandler are logged with the tick they happened on."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from ui.events import EventHandler
+    from ui.renderer import Renderer
+
+    pygame.init()
+    try:
+        game = Game(seed=3)
+        recorder = ReplayRecorder(str(tmp_path / "clicks.tdr"), game)
+        handler = EventHandler(game, Renderer(game), recorder)
+        for pos in ((40, 60), (handler.renderer.GRID_W + 50, 200)):  # Shop card 0, Next Wave
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+        handler.handle_events(7)
+        recorder.close()
+    finally:
+        pygame.quit()
+
+    assert Replay.load(recorder.path).actions == [(7, "buy", (0,)), (7, "start_wave", ())]
@@ -0,0 +1,102 @@
+import os
+import pytest
+
+from core.game import Game
+from core.headless import HeadlessRunner
+from core.rng import GameRNG
+from models.tower import Tower
+
+
+def _play(game, waves=3):
+    """Place a few towers next to the path and run waves headlessly."""
+    cells = [(x, y) for y in range(game.height) for x in range(game.width)
+             if game.grid[y][x] == '.' and game.closest_path_index(x, y) is not None
+             and min(abs(x - px) + abs(y - py) for px, py in game.path) == 1]
+    for i, (x, y) in enumerate(cells[:6]):
+        game.bench[0] = Tower(0, 0, ["Neural Processor", "Plasma Capacitor", "Signal Router"][i % 3])
+        game.economy.place_tower(x, y, 0)
+    game.round_num = 8  # Assimilators (latch rolls) from wave 9
+    HeadlessRunner(game).run(waves)
+
+
+def _state(game):
+    return (
+        list(game.path),
+        [card and card["type"] for card in game.shop],
+        game.lives, game.gold, game.round_num,
+        [(e.enemy_type, e.position_index, e.health) for e in game.enemies],
+        game.rng.sim.getstate(),
+    )
+
+
+def test_same_seed_same_game():
+    """Test that one seed gives the same map, shop and simulation."""
+    a, b = Game(seed=1234, headless=True), Game(seed=1234, headless=True)
+    assert _state(a) == _state(b)
+
+    _play(a)
+    _play(b)
+    assert _state(a) == _state(b)
+
+
+def test_seed_changes_map():
+    """Test that different seeds give different maps/shops."""
+    games = [Game(seed=s, headless=True) for s in range(5)]
+
+    assert len({(tuple(g.path), tuple(c["type"] for c in g.shop)) for g in games}) > 1
+
+
+def test_unseeded_game_records_its_seed():
+    """Test that a game without a seed picks one and can be recreated from it."""
+    game = Game(headless=True)
+
+    assert _state(Game(seed=game.seed, headless=True)) == _state(game)
+
+
+def test_streams_are_independent():
+    """Test that drawing from one stream leaves the others untouched."""
+    a, b = GameRNG(7), GameRNG(7)
+    for _ in range(100):
+        a.economy.random()
+        a.visual.random()
+
+    assert a.sim.getstate() == b.sim.getstate()
+    assert a.map.getstate() == b.map.getstate()
+
+
+def test_economy_rolls_do_not_touch_simulation():
+    """Test that extra shop rolls don't change the waves that follow."""
+    a, b = Game(seed=99, headless=True), Game(seed=99, headless=True)
+    for _ in range(5):
+        b.shop = [None] * 5
+        b.economy.generate_shop()
+
+    _play(a)
+    _play(b)
+    assert _state(a)[2:] == _state(b)[2:]
+    assert a.rng.economy.getstate() != b.rng.economy.getstate()
+
+
+def test_rendering_does_not_perturb_simulation():
+    """Test that cosmetic effects drawn between ticks leave the simulation bit-identical."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame = pytest.importorskip("pygame")
+    from ui.renderer import Renderer
+
+    plain, drawn = Game(seed=5), Game(seed=5)
+    pygame.init()
+    try:
+        renderer = Renderer(drawn)
+        for game in (plain, drawn):
+            game.wave_manager.start_next_wave()
+        for frame in range(1, 200):
+            for game in (plain, drawn):
+                game.wave_manager.update_wave(frame)
+            renderer.swarm_fx.add_latch_effect((100, 100), 3)
+            renderer.swarm_fx.add_damage_number((120, 100), 7)
+            renderer.draw(frame)
+    finally:
+        pygame.quit()
+
+    assert _state(plain) == _state(drawn)
@@ -0,0 +1,96 @@
+import pickle
+import random
+import pytest
+
+from benchmarks.scenarios import SCENARIOS, extend_path_with_tiles
+from core import snapshot
+from core.game import Game
+from core.snapshot import Autosaver, SnapshotError, load_game, save_game
+
+
+def _tick(game, start, ticks):
+    for frame in range(start, start + ticks):
+        game.wave_manager.update_wave(frame)
+
+
+def _state(game):
+    """Game state that must match after a load (enemy uids excluded: the counter is per process)."""
+    return (
+        game.width, game.height, game.grid, list(game.path), game.path_graph.get_ordered_path(),
+        game.round_num, game.lives, game.gold, game.spawn_timer, len(game.spawn_queue),
+        [(type(e).__name__, e.enemy_type, e.health, e.position_index, e.move_counter, e.slow_frames,
+          getattr(e, 'is_latched', None), getattr(e, 'assimilate_progress', None)) for e in game.enemies],
+        [(t.base_type, t.x, t.y, t.cooldown, t.heat, t.upgrades, t.parents, t.merge_generation,
+          sorted(t.beam_targets.values())) for t in game.towers],
+        [(pos, w.integrity, len(w.latched_assimilators)) for pos, w in game.board.wall_manager.walls.items()],
+        [t and (t.base_type, t.merge_generation) for t in game.bench], game.shop,
+        [getattr(game.rng, name).getstate() for name in game.rng.STREAMS],
+    )
+
+
+@pytest.mark.parametrize("name", ["wave30_mixed_towers", "latched_40"])
+def test_round_trip_mid_wave(name):
+    """Test that a loaded mid-wave game matches the original and keeps ticking identically."""
+    game = SCENARIOS[name](random.Random(0))
+    _tick(game, 1, 40)
+
+    loaded, frame = snapshot.restore(snapshot.decode(snapshot.encode(snapshot.capture(game, 40))), headless=True)
+
+    assert frame == 40
+    assert _state(loaded) == _state(game)
+    _tick(game, 41, 300)
+    _tick(loaded, 41, 300)
+    assert _state(loaded) == _state(game)
+
+
+def test_round_trip_expanded_map(tmp_path):
+    """Test that an expanded grid, tile-extended path, benches and counters survive a file round trip."""
+    game = Game(seed=9, headless=True)
+    extend_path_with_tiles(game, 12, random.Random(1))
+    game.economy.move_to_bench(0)
+    game.economy.cycle_shop_mode()
+    game.gold, game.xp = 321, 77
+    path = str(tmp_path / "save.tds")
+
+    save_game(game, path, frame=1234)
+    loaded, frame = load_game(path, headless=True)
+
+    assert frame == 1234
+    assert _state(loaded) == _state(game)
+    assert loaded.shop_mode == "tiles" and loaded.xp == 77
+    assert loaded.path_index == game.path_index
+
+
+def test_bad_files_rejected():
+    """Test that non-snapshots, other versions, corrupt data and pickled objects raise SnapshotError."""
+    data = snapshot.encode(snapshot.capture(Game(seed=1, headless=True)))
+
+    with pytest.raises(SnapshotError):
+        snapshot.decode(b"nope" + data[4:])
+    with pytest.raises(SnapshotError):
+        snapshot.decode(data[:4] + bytes((snapshot.VERSION + 1,)) + data[5:])
+    with pytest.raises(SnapshotError):
+        snapshot.decode(data[:-10])
+    with pytest.raises(SnapshotError):
+        snapshot.decode(snapshot.pack(pickle.dumps({"x": random.Random()})))
+
+
+def test_autosave_at_wave_clear(tmp_path):
+    """Test that Autosaver writes once per cleared wave, off the calling thread."""
+    path = tmp_path / "auto.tds"
+    game = Game(seed=5, headless=True)
+    autosaver = Autosaver(str(path), game)
+    game.wave_manager.start_next_wave()
+    frame = 0
+    while game.wave_active:
+        frame += 1
+        game.wave_manager.update_wave(frame)
+        autosaver.on_tick(game, frame)
+        assert not path.exists() or game.round_num == 2
+    autosaver.on_tick(game, frame + 1)  # Same wave: no second save
+    autosaver.close()
+
+    assert autosaver.saves == 1
+    loaded, saved_frame = load_game(str(path), headless=True)
+    assert saved_frame == frame and loaded.round_num == 2
+    assert _state(loaded) == _state(game)
@@ -0,0 +1,47 @@
+import pytest
+from core.game import Game
+from core.spawn_queue import SpawnQueue, SpawnSpec
+
+
+def test_queue_streams_specs_in_order():
+    """Test that runs come out in FIFO order, one enemy at a time."""
+    queue = SpawnQueue()
+    queue.add(SpawnSpec("Drone", 1, count=2))
+    queue.add(SpawnSpec("Scout", 1, count=0))  # Empty runs are dropped
+    queue.add(SpawnSpec("Assimilator", 3, count=1, flags=("egrem",)))
+    assert len(queue) == 3
+
+    drawn = []
+    while queue:
+        enemy_type, spec = queue.next_spawn()
+        drawn.append((enemy_type, spec.wave_num, "egrem" in spec.flags))
+
+    assert drawn == [("Drone", 1, False), ("Drone", 1, False), ("Assimilator", 3, True)]
+    assert queue.next_spawn() is None
+
+
+def test_type_pool_picked_per_enemy():
+    """Test that a tuple of types is resolved per spawn from the pool."""
+    queue = SpawnQueue()
+    queue.add(SpawnSpec(("Drone", "Scout"), 4, count=50))
+
+    types = {queue.next_spawn()[0] for _ in range(50)}
+
+    assert types <= {"Drone", "Scout"}
+    assert not queue
+
+
+def test_huge_wave_is_not_prebuilt():
+    """Test that queuing a very large wave builds no enemies up front."""
+    game = Game(headless=True)
+    game.spawn_queue.add(SpawnSpec("Drone", 1, count=1_000_000))
+
+    assert len(game.spawn_queue) == 1_000_000
+    assert not game.enemies
+
+    game.wave_active = True
+    game.spawn_timer = game.spawn_interval
+    game.wave_manager.update_wave(1)
+
+    assert len(game.enemies) == 1
+    assert len(game.spawn_queue) == 999_999
@@ -0,0 +1,76 @@
+import pytest
+from core.timestep import FixedTimestep, FAST_FORWARD_SPEEDS, MAX_SPEED, next_speed, speed_label
+
+
+def _counter():
+    calls = []
+    return calls, lambda: calls.append(1)
+
+
+def test_one_tick_per_frame_at_60hz():
+    """Test that 60 frames of 1/60s run exactly 60 ticks at 1x."""
+    timestep = FixedTimestep(tick_rate=60)
+    calls, step = _counter()
+
+    for _ in range(60):
+        timestep.run(1.0 / 60, step)
+
+    assert len(calls) == 60
+
+
+def test_fast_forward_multiplies_ticks():
+    """Test that fast-forward runs several ticks per rendered frame."""
+    for speed in (2, 4, 8):
+        timestep = FixedTimestep(tick_rate=60)
+        calls, step = _counter()
+
+        ticks = timestep.run(1.0 / 60, step, speed)
+
+        assert ticks == speed
+        assert len(calls) == speed
+
+
+def test_slow_frames_catch_up():
+    """Test that a slow render frame runs the ticks it owes."""
+    timestep = FixedTimestep(tick_rate=60)
+    calls, step = _counter()
+
+    ticks = timestep.run(3.0 / 60, step)
+
+    assert ticks == 3
+
+
+def test_stall_is_clamped():
+    """Test that a long stall doesn't queue up an unbounded burst of ticks."""
+    timestep = FixedTimestep(tick_rate=60, max_frame_time=0.25)
+    calls, step = _counter()
+
+    ticks = timestep.run(10.0, step)
+
+    assert ticks == 15  # 0.25s at 60 Hz
+
+
+def test_max_speed_runs_within_budget():
+    """Test that max speed runs at least one tick and clears the accumulator."""
+    timestep = FixedTimestep(tick_rate=60, max_budget=0.002)
+    calls, step = _counter()
+
+    ticks = timestep.run(1.0 / 60, step, MAX_SPEED)
+
+    assert ticks >= 1
+    assert ticks == len(calls)
+    assert timestep.accumulator == 0.0
+
+
+def test_speed_cycle():
+    """Test that the speed key cycles through every speed and wraps."""
+    speed = FAST_FORWARD_SPEEDS[0]
+    seen = [speed]
+    for _ in range(len(FAST_FORWARD_SPEEDS)):
+        speed = next_speed(speed)
+        seen.append(speed)
+
+    assert seen[:-1] == list(FAST_FORWARD_SPEEDS)
+    assert seen[-1] == 1
+    assert speed_label(MAX_SPEED) == "MAX"
+    assert speed_label(4) == "4x"
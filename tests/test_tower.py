@@ -209,4 +209,102 @@ def test_stat_bonuses_per_tier():
     boost_2 = 1.6
     assert t2.dmg == int(base_dmg * boost_2)
     assert t2.range == base_range + 2
-    assert t2.fire_rate == max(1, int(base_fire_rate / boost_2))
\ No newline at end of file
+    assert t2.fire_rate == max(1, int(base_fire_rate / boost_2))
+
+def test_path_intervals_invalidation():
+    """Test that path intervals are rebuilt when range or the path changes."""
+    from core.game import Game
+    game = Game()
+    x, y = game.path[len(game.path) // 2]
+    t = Tower(x, y, "Plasma Capacitor")
+    before = t.get_path_intervals(game)
+    assert t.get_path_intervals(game) is before  # Cached
+
+    t.upgrades.append("charge_1")  # +1 range
+    t._calculate_stats()
+    assert t.get_path_intervals(game) is not before
+
+    cached = t.get_path_intervals(game)
+    game.path_version += 1
+    assert t.get_path_intervals(game) is not cached
+
+
+def test_ball_targets_nearest_enemy():
+    """Test that Ball towers hit the in-range enemy nearest the tower."""
+    from core.game import Game
+    from models.enemy import Enemy
+    game = Game()
+    game.wave_active = True
+    x, y = game.path[3]
+    t = Tower(x, y, "Plasma Capacitor")
+    behind, ahead = Enemy(game.path, "Drone", 1), Enemy(game.path, "Drone", 1)
+    behind.position_index, ahead.position_index = 3, 5
+    for e in (behind, ahead):
+        game.wave_manager.register_enemy(e)
+
+    result = t.update(game.enemies, 1, game)
+
+    assert result is not None and result[0] is behind
+
+
+def test_targeting_matches_grid_scan():
+    """Test that single-target towers pick the same target as a row-major scan of the range diamond."""
+    import random
+    from core.game import Game
+    from models.enemy import Enemy
+    game = Game(seed=3)
+    rng = random.Random(3)
+    for _ in range(25):
+        e = Enemy(game.path, "Drone", 1)
+        e.position_index = rng.randrange(len(game.path))
+        game.wave_manager.register_enemy(e)
+
+    for reach in (2, 3.5):  # Synergy bonuses make range fractional
+        for x, y in ((x, y) for y in range(game.height) for x in range(game.width)):
+            t = Tower(x, y, "Plasma Capacitor")
+            t.range = reach
+            r = int(t.range)
+            expected = None
+            for dy in range(-r, r + 1):
+                for dx in range(-r, r + 1):
+                    if abs(dx) + abs(dy) > t.range or not (0 <= x + dx < game.width and 0 <= y + dy < game.height):
+                        continue
+                    cell = game.enemy_grid[y + dy][x + dx]
+                    if cell and (expected is None or abs(dx) + abs(dy) < expected[0]):
+                        expected = (abs(dx) + abs(dy), cell[0])
+            target = game.enemy_index.nearest_in(t.get_path_intervals(game), game.path, x, y)
+            assert target is (expected and expected[1])
+
+
+def test_path_intervals_match_range():
+    """Test that path-index intervals cover exactly the in-range path indices."""
+    from core.game import Game
+    game = Game()
+    x, y = game.path[len(game.path) // 2]
+    t = Tower(x, y, "Signal Router")
+
+    intervals = t.get_path_intervals(game)
+
+    covered = [i for lo, hi in intervals for i in range(lo, hi + 1)]
+    expected = [i for i, (px, py) in enumerate(game.path) if abs(px - x) + abs(py - y) <= t.range]
+    assert covered == expected
+
+
+def test_tower_index_tracks_place_sell_and_expand():
+    """Test that get_tower_at follows placement, selling and grid expansion."""
+    from core.game import Game
+    game = Game()
+    gx, gy = next((x, y) for y in range(game.height) for x in range(game.width) if game.grid[y][x] == '.')
+    game.bench[0] = Tower(0, 0, "Neural Processor")
+
+    assert game.economy.place_tower(gx, gy, 0)
+    t = game.get_tower_at(gx, gy)
+    assert t is game.towers[0]
+
+    game.expand_grid([(0, 0)])  # Shifts everything by (2, 2)
+    assert game.get_tower_at(gx, gy) is None
+    assert game.get_tower_at(gx + 2, gy + 2) is t
+
+    assert game.economy.sell_tower_from_grid(gx + 2, gy + 2)
+    assert game.get_tower_at(gx + 2, gy + 2) is None
+    assert not game.towers
@@ -1,15 +1,25 @@
 import pygame
+from datetime import datetime
+from core.timestep import next_speed
 from config import log_debug
 
 
 class EventHandler:
-    def __init__(self, game, renderer):
+    def __init__(self, game, renderer, recorder=None):
         self.game = game
         self.renderer = renderer
+        self.recorder = recorder  # core.replay.ReplayRecorder when --record is on
         self.running = True
+        self._frame = 0
+
+    def _record(self, action, *args):
+        """Log a game-affecting action for replay (no-op unless recording)."""
+        if self.recorder is not None:
+            self.recorder.record(self._frame, action, *args)
 
     def handle_events(self, frame):
         """Handle all Pygame events."""
+        self._frame = frame
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -39,6 +49,17 @@ class EventHandler:
             self.renderer.camera_x = 0
             self.renderer.camera_y = 0
             self.renderer.zoom_level = 1.0
+        elif event.key == pygame.K_f:
+            # Cycle fast-forward 1x -> 2x -> 4x -> 8x -> max
+            self.game.sim_speed = next_speed(self.game.sim_speed)
+        elif event.key == pygame.K_F3:
+            # Profiler overlay (instruments handle_events and Renderer._draw_* while on)
+            self.game.profiler.toggle(self, self.renderer)
+        elif event.key == pygame.K_F4:
+            # Dump profiler stats to JSON in the working directory
+            path = datetime.now().strftime("profile_%Y%m%d_%H%M%S.json")
+            self.game.profiler.dump(path, self.game, self.renderer)
+            log_debug("Profiler stats written", {"path": path}, location="events.py:_handle_keydown")
         elif pygame.K_1 <= event.key <= pygame.K_3:
             # Upgrade bench shortcuts
             slot_idx = event.key - pygame.K_1
@@ -126,6 +147,7 @@ class EventHandler:
                     dy = 318
                     r = pygame.Rect(dx, dy, 30, 20)
                     if r.collidepoint(mx, my):
+                        self._record("track_direction", t.x, t.y, d)
                         t.track_direction = d
                         return
 
@@ -134,6 +156,7 @@ class EventHandler:
             sell_r = pygame.Rect(self.renderer.GRID_W + 10, button_y, 75, 24)
             close_r = pygame.Rect(self.renderer.GRID_W + 95, button_y, 75, 24)
             if sell_r.collidepoint(mx, my):
+                self._record("sell_tower", t.x, t.y)
                 self.game.economy.sell_tower_from_grid(t.x, t.y)
                 self.game.upgrade_dialog_tower = None
             elif close_r.collidepoint(mx, my):
@@ -180,12 +203,15 @@ class EventHandler:
         if play_rect.collidepoint(mx, my):
             log_debug("Play/Pause button clicked", location="events.py:_handle_right_panel_click")
             self.game.paused = not self.game.paused
+            self._record("pause", int(self.game.paused))
         elif next_rect.collidepoint(mx, my):
             log_debug("Next Wave button clicked", location="events.py:_handle_right_panel_click")
+            self._record("start_wave")
             self.game.wave_manager.start_next_wave()
         elif auto_rect.collidepoint(mx, my):
             log_debug("Auto button clicked", location="events.py:_handle_right_panel_click")
             self.game.auto_mode = not self.game.auto_mode
+            self._record("auto", int(self.game.auto_mode))
         else:
             log_debug("No button clicked", location="events.py:_handle_right_panel_click")
 
@@ -199,20 +225,15 @@ class EventHandler:
         log_debug("Shop toggle check", {"toggle_x": tx, "toggle_y": ty, "toggle_w": 35, "toggle_h": 35}, location="events.py:_handle_shop_click")
         if tx <= mx <= tx + 35 and ty <= my <= ty + 35:
             log_debug("Shop toggle clicked", location="events.py:_handle_shop_click")
-            if self.game.shop_mode == "towers":
-                self.game.shop_mode = "tiles"
-            elif self.game.shop_mode == "tiles":
-                self.game.shop_mode = "upgrades"
-            else:
-                self.game.shop_mode = "towers"
-            self.game.shop = [None] * 5
-            self.game.economy.generate_shop()
+            self._record("cycle_shop_mode")
+            self.game.economy.cycle_shop_mode()
             return
 
         for i in range(5):
             x = 15 + i * 80
             y = 15
             if x <= mx <= x+70 and y <= my <= y+100:
+                self._record("buy", i)
                 self.game.economy.move_to_bench(i)
                 return
 
@@ -220,6 +241,7 @@ class EventHandler:
         rx = 15 + 400
         ry = 65
         if rx <= mx <= rx + 35 and ry <= my <= ry + 35:
+            self._record("reroll")
             self.game.economy.reroll_shop()
 
     def _handle_bench_click(self, mx, my, frame):
@@ -239,6 +261,7 @@ class EventHandler:
                     merge_rect = merge_txt.get_rect(center=(mid_x, mid_y))
                     merge_rect.inflate_ip(18, 13)
                     if merge_rect.collidepoint(mx, my):
+                        self._record("confirm_merge")
                         self.game.economy.confirm_merge()
                         handled_merge = True
                 elif self.game.egrem_preview:
@@ -246,6 +269,7 @@ class EventHandler:
                     egrem_rect = egrem_txt.get_rect(center=(mid_x, mid_y))
                     egrem_rect.inflate_ip(18, 13)
                     if egrem_rect.collidepoint(mx, my):
+                        self._record("complete_egrem")
                         self.game.economy._complete_egrem()
                         handled_merge = True
 
@@ -258,10 +282,12 @@ class EventHandler:
                 if x <= mx <= x+60 and y <= my <= y+90:
                     if self.game.bench[i]:
                         clicked_on_bench_card = True
+                        self._record("select_bench", i)
                         self.game.economy.select_for_merge(i, frame)
 
             # Handle cancel if clicked outside merge/egrem area
             if (self.game.merge_preview or self.game.egrem_preview) and not clicked_on_bench_card:
+                self._record("cancel_merge")
                 self.game.economy.cancel_merge()
 
     def _handle_map_bench_click(self, mx, my):
@@ -312,31 +338,25 @@ class EventHandler:
 
         # Place map tile
         if self.game.selected_map_tile is not None:
-            tile_data = self.game.map_tile_bench[self.game.selected_map_tile]
-            if tile_data and self.game.can_place_tile(tile_data, gx, gy, self.game.selected_tile_rotation):
-                self.game.place_map_tile(tile_data, gx, gy, self.game.selected_tile_rotation)
-
-                # Check if expansion needed
-                tile_cells = self.game._get_tile_path_cells(tile_data, gx, gy, self.game.selected_tile_rotation)
-                if self.game.should_expand_map(tile_cells):
-                    self.game.expand_grid(tile_cells)
+            slot, rotation = self.game.selected_map_tile, self.game.selected_tile_rotation
+            size = (self.game.width, self.game.height)
+            self._record("place_tile", slot, gx, gy, rotation)
+            if self.game.place_tile_from_bench(slot, gx, gy, rotation):
+                if (self.game.width, self.game.height) != size:
                     self.renderer.update_dimensions()
-
-                # Remove tile from bench
-                self.game.map_tile_bench[self.game.selected_map_tile] = None
-                self.game.selected_map_tile = None
-                self.game.selected_tile_rotation = 0
             return
 
         # Place tower from bench
         if (self.game.selected_tower is not None and
             self.game.merge_preview is None and
             not self.game.egrem_preview):
+            self._record("place_tower", gx, gy, self.game.selected_tower)
             self.game.economy.place_tower(gx, gy, self.game.selected_tower)
             return
 
         # Clear merge/egrem selections
         if self.game.merge_preview or self.game.egrem_preview or self.game.merge_tower_1 is not None:
+            self._record("cancel_merge")
             self.game.economy.cancel_merge()
 
         # Check for enemy selection
@@ -351,17 +371,19 @@ class EventHandler:
 
         if not enemy_selected:
             # Check for tower selection
-            for t in self.game.towers:
-                if t.x == gx and t.y == gy:
-                    if self.game.selected_upgrade is not None:
-                        upgrade_id = self.game.upgrade_bench[self.game.selected_upgrade]
-                        if self.game.economy.apply_upgrade_from_bench(t, upgrade_id, self.game.selected_upgrade):
-                            self.game.selected_upgrade = None
-                    else:
-                        self.game.upgrade_dialog_tower = t
-                        self.game.upgrade_dialog_choices = self.game.economy.get_upgrade_choices(t)
-                    self.game.selected_enemy = None
-                    return
+            t = self.game.get_tower_at(gx, gy)
+            if t is not None:
+                if self.game.selected_upgrade is not None:
+                    upgrade_id = self.game.upgrade_bench[self.game.selected_upgrade]
+                    self._record("apply_upgrade", gx, gy, self.game.selected_upgrade)
+                    if self.game.economy.apply_upgrade_from_bench(t, upgrade_id, self.game.selected_upgrade):
+                        self.game.selected_upgrade = None
+                else:
+                    self.game.upgrade_dialog_tower = t
+                    self._record("inspect_tower", gx, gy)
+                    self.game.upgrade_dialog_choices = self.game.economy.get_upgrade_choices(t)
+                self.game.selected_enemy = None
+                return
 
             # Empty grid click
             self.game.selected_enemy = None
@@ -375,6 +397,7 @@ class EventHandler:
         elif event.button == 3:  # Right click
             # Cancel merge/egrem
             if self.game.merge_preview or self.game.egrem_preview or self.game.merge_tower_1 is not None:
+                self._record("cancel_merge")
                 self.game.economy.cancel_merge()
                 return
 
@@ -386,6 +409,7 @@ class EventHandler:
                     x = 15 + i * 68
                     y = self.renderer.SHOP_H + 15
                     if x <= mx <= x+60 and y <= my <= y+90:
+                        self._record("sell_bench", i)
                         self.game.economy.sell_from_bench(i)
                         return
 
@@ -400,6 +424,7 @@ class EventHandler:
             if my >= self.renderer.grid_y and mx < self.renderer.GRID_W:
                 gx, gy = self.renderer.screen_to_world(mx, my)
                 gx, gy = int(gx), int(gy)
+                self._record("sell_tower", gx, gy)
                 self.game.economy.sell_tower_from_grid(gx, gy)
 
     def _handle_mousemotion(self, event):
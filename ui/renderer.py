@@ -4,10 +4,28 @@ import json
 from datetime import datetime
 from models.tower import Tower
 from ui.swarm_fx import SwarmFXManager
+from ui.surface_cache import SurfaceCache
+from ui.sprite_atlas import SpriteAtlas
+from core.timestep import speed_label
 from config import log_debug
 
 
 class Renderer:
+    MAP_LAYER_KEY = (255, 0, 255)          # Colorkey for the transparent parts of the map layer
+    MAP_LAYER_MAX_PIXELS = 2048 * 2048     # Above this (deep zoom on a big map) draw directly
+    WEB_MAP_LAYER_MAX_PIXELS = 1024 * 1024 # Same, under pygbag (browser canvas memory is tight)
+    TEXT_CACHE_SIZE = 512                  # Text surfaces kept by the LRU (labels, stats, numbers)
+    OVERLAY_CACHE_SIZE = 128               # Translucent overlays kept by the LRU (rings, glows, swirls)
+    SWIRL_VARIANTS = 8                     # Pre-rendered egrem swirl patterns picked from at random
+    PROFILER_DRAW_ROWS = 10                # Slowest _draw_* sections listed in the profiler overlay
+
+    # Tower border colour by merge type (base towers use light blue)
+    MERGE_BORDER_COLORS = {
+        "pure": (255, 255, 255),    # white for pure
+        "hybrid": (160, 110, 60),   # brown for hybrid
+        "egrem": (80, 255, 80),     # green for egrem
+    }
+
     def __init__(self, game):
         log_debug("Renderer.__init__ start", location="renderer.py")
         self.game = game
@@ -92,7 +110,28 @@ class Renderer:
         log_debug("Renderer initialization complete", location="renderer.py")
 
         # Swarm effects manager
-        self.swarm_fx = SwarmFXManager()
+        self.swarm_fx = SwarmFXManager(rng=game.rng.visual)
+
+        # Rendered text surfaces (see _render_text)
+        self.text_cache = SurfaceCache(self.TEXT_CACHE_SIZE)
+
+        # Pre-rendered translucent overlays (see _overlay)
+        self.overlay_cache = SurfaceCache(self.OVERLAY_CACHE_SIZE)
+
+        # Tower/enemy sprites for the current zoom (see _draw_towers, _draw_enemies)
+        self.atlas = SpriteAtlas(self.TILE)
+
+        # Cached UI panels and dirty rects for partial display updates (see _draw_panel)
+        self._panels = {}           # name -> (key, rect, surface)
+        self._panel_rects = []      # Panels repainted this frame
+        self._overlay_rects = []    # Rects drawn over the panels this frame
+        self._last_overlay_rects = []
+        self._last_view = None      # (size, camera, zoom) presented last frame
+        self.dirty_rects = None     # Rects to pass to display.update (None = flip)
+
+        # Static map layer cache (see _get_map_layer)
+        self._map_layer = None
+        self._map_layer_key = None
 
         # Tower colors
         self.tower_colors = {
@@ -149,18 +188,26 @@ class Renderer:
         # Tier 1: Subtle glow
         if tier >= 1:
             glow_radius = 10 + tier * 5
-            glow_surface = pygame.Surface((width + glow_radius*2, height + glow_radius*2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (255, 255, 255, 50), (width//2 + glow_radius, height//2 + glow_radius), glow_radius)
+
+            def build_glow():
+                glow_surface = pygame.Surface((width + glow_radius*2, height + glow_radius*2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surface, (255, 255, 255, 50), (width//2 + glow_radius, height//2 + glow_radius), glow_radius)
+                return glow_surface
+
+            glow_surface = self._overlay(("tier_glow", width, height, glow_radius), build_glow)
             self.screen.blit(glow_surface, (rect.x - glow_radius, rect.y - glow_radius))
 
         # Tier 2: Gradient fill overlay
         if tier >= 2:
-            gradient_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-            for y in range(height):
-                alpha = int(100 * (1 - y / height))  # Fade from top to bottom
-                color = (255, 255, 255, alpha)
-                pygame.draw.line(gradient_surface, color, (0, y), (width, y))
-            self.screen.blit(gradient_surface, rect.topleft)
+            def build_gradient():
+                gradient_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+                for y in range(height):
+                    alpha = int(100 * (1 - y / height))  # Fade from top to bottom
+                    color = (255, 255, 255, alpha)
+                    pygame.draw.line(gradient_surface, color, (0, y), (width, y))
+                return gradient_surface
+
+            self.screen.blit(self._overlay(("tier_gradient", width, height), build_gradient), rect.topleft)
 
         # Tier 3: Thick border
         if tier >= 3:
@@ -169,17 +216,23 @@ class Renderer:
 
         # Tier 4: Aura particles
         if tier >= 4:
-            import random
+            rng = self.game.rng.visual
             for _ in range(5 + tier):  # More particles for higher tiers
-                px = center_x + random.randint(-width//2, width//2)
-                py = center_y + random.randint(-height//2, height//2)
+                px = center_x + rng.randint(-width//2, width//2)
+                py = center_y + rng.randint(-height//2, height//2)
                 pygame.draw.circle(self.screen, (255, 255, 255), (px, py), 1)
 
     def _draw_egrem_swirls(self, x, y, width, height):
-        """Draw chaotic swirl effects for Egrem towers."""
+        """Draw chaotic swirl effects for Egrem towers (a random pick from SWIRL_VARIANTS cached patterns)."""
+        variant = self.game.rng.visual.randrange(self.SWIRL_VARIANTS)
+        key = ("egrem_swirl", width, height, variant)
+        self.screen.blit(self._overlay(key, lambda: self._build_egrem_swirls(width, height)), (x, y))
+
+    def _build_egrem_swirls(self, width, height):
+        """Render one random egrem swirl pattern."""
         import math
-        import random
 
+        rng = self.game.rng.visual
         # Create a surface for the swirl overlay
         swirl_surface = pygame.Surface((width, height), pygame.SRCALPHA)
 
@@ -188,9 +241,9 @@ class Renderer:
 
         for i in range(num_swirls):
             # Random swirl parameters
-            radius = random.randint(10, 25)
-            angle_offset = random.random() * 2 * math.pi
-            swirl_color = (random.randint(60, 100), random.randint(200, 255), random.randint(60, 100), 100)
+            radius = rng.randint(10, 25)
+            angle_offset = rng.random() * 2 * math.pi
+            swirl_color = (rng.randint(60, 100), rng.randint(200, 255), rng.randint(60, 100), 100)
 
             # Draw swirl as connected arcs
             points = []
@@ -203,18 +256,62 @@ class Renderer:
             if len(points) > 2:
                 pygame.draw.lines(swirl_surface, swirl_color, False, points, 2)
 
-        self.screen.blit(swirl_surface, (x, y))
+        return swirl_surface
+
+    def _overlay(self, key, build):
+        """
+        Get a cached translucent overlay surface, building it on first use.
+
+        Args:
+            key: Hashable (kind, size..., colors...) description of the overlay
+            build: Zero-argument callable returning the surface
+
+        Returns:
+            pygame.Surface: Shared surface - blit it, don't draw on it
+        """
+        return self.overlay_cache.get(key, build)
+
+    def _ring_overlay(self, kind, radius, fill, edge):
+        """Filled circle of `radius` with a 2px edge on a (2*radius+4)^2 transparent surface."""
+        def build():
+            s = pygame.Surface((radius*2+4, radius*2+4), pygame.SRCALPHA)
+            pygame.draw.circle(s, fill, (radius+2, radius+2), radius)
+            pygame.draw.circle(s, edge, (radius+2, radius+2), radius, 2)
+            return s
+
+        return self._overlay((kind, radius, self.zoom_level, fill, edge), build)
+
+    def _render_text(self, font, text, color, bgcolor=None, antialias=True):
+        """
+        Render text with web compatibility - convert surface for proper blitting.
+
+        Surfaces are cached in self.text_cache keyed by (font, text, color,
+        antialias, bg), so unchanged labels are only rasterized once. The
+        returned surface is shared: blit it, don't draw on it.
 
-    def _render_text(self, font, text, color, bgcolor=None):
-        """Render text with web compatibility - convert surface for proper blitting."""
+        Returns:
+            pygame.Surface or None if the text is empty or failed to render
+        """
+        key = (font, text, tuple(color), antialias, tuple(bgcolor) if bgcolor else None)
+        return self.text_cache.get(key, lambda: self._rasterize_text(font, text, color, bgcolor, antialias))
+
+    def _rasterize_text(self, font, text, color, bgcolor, antialias):
+        """Uncached font.render for _render_text."""
         try:
-            surf = font.render(text, True, color, bgcolor) if bgcolor else font.render(text, True, color)
+            surf = font.render(text, antialias, color, bgcolor) if bgcolor else font.render(text, antialias, color)
             if surf.get_width() > 0 and surf.get_height() > 0:
                 return surf.convert_alpha() if getattr(self.game, "web_mode", False) else surf
         except Exception:
             pass
         return None
 
+    def _blit_text(self, font, text, color, pos):
+        """Blit cached text at pos (top-left); returns the surface, or None if nothing was drawn."""
+        surf = self._render_text(font, text, color)
+        if surf is not None:
+            self.screen.blit(surf, pos)
+        return surf
+
     def world_to_screen(self, wx, wy):
         """Convert world coordinates to screen coordinates."""
         sx = (wx * self.TILE * self.zoom_level) + self.camera_x
@@ -234,13 +331,25 @@ class Renderer:
         self.HEIGHT = self.SHOP_H + self.BENCH_H + self.game.height * self.TILE
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         self.map_bench_y = self.HEIGHT - 100
+        self._panels.clear()
+        self._last_view = None  # New display surface: present it whole
 
     def draw(self, frame):
-        """Main drawing function."""
+        """
+        Main drawing function.
+
+        Afterwards self.dirty_rects holds the screen areas that may have
+        changed (for pygame.display.update), or None if the whole frame
+        should be presented with pygame.display.flip().
+        """
         if frame <= 3:
             log_debug(f"Draw method called for frame {frame}", location="renderer.py:draw")
+        self._overlay_rects = []
+        self._panel_rects = []
         try:
-            self.screen.fill(self.BLACK)
+            # Panels cover the rest of the screen (cached or repainted on their own black)
+            for rect in self._dynamic_rects():
+                self.screen.fill(self.BLACK, rect)
             if frame <= 3:
                 log_debug("Screen filled with black", location="renderer.py:draw")
         except Exception as e:
@@ -266,6 +375,71 @@ class Renderer:
         self._draw_game_over()
         self._draw_camera_info()
         self._draw_version_info()
+        if self.game.profiler.enabled:
+            self._draw_profiler()
+        self._update_dirty_rects()
+
+    def _dynamic_rects(self):
+        """Screen areas redrawn every frame: the map viewport and the middle of the right column."""
+        return [
+            pygame.Rect(0, self.grid_y, self.GRID_W, self.HEIGHT - self.grid_y),
+            pygame.Rect(self.GRID_W, self.grid_y, self.PANEL_RIGHT_W, self.HEIGHT - 110 - self.grid_y),
+        ]
+
+    def _draw_panel(self, name, rect, key, paint):
+        """
+        Draw a UI panel from its cached surface, repainting only when `key` changes.
+
+        Panels are drawn first, onto a black screen, in a fixed order and
+        without overlapping, so after `paint()` the screen area is exactly
+        the panel and can be copied out as its cache.
+
+        Args:
+            name: Panel name
+            rect: Screen area the panel fully covers
+            key: Hashable snapshot of everything the panel shows (None = animated, always repaint)
+            paint: Callable that draws the panel onto self.screen
+        """
+        rect = pygame.Rect(rect).clip(self.screen.get_rect())
+        entry = self._panels.get(name)
+        if key is not None and entry is not None and entry[0] == key and entry[1] == rect:
+            self.screen.blit(entry[2], rect)
+            return
+        self.screen.fill(self.BLACK, rect)
+        paint()
+        self._panel_rects.append(rect)
+        if key is not None and rect.width and rect.height:
+            self._panels[name] = (key, rect, self.screen.subsurface(rect).copy())
+        else:
+            self._panels.pop(name, None)
+
+    def _mark_overlay(self, rect):
+        """Record an area drawn over the panels so it gets presented (this frame and next)."""
+        if rect:
+            self._overlay_rects.append(pygame.Rect(rect))
+
+    def _update_dirty_rects(self):
+        """Set self.dirty_rects for this frame (None = present the whole screen)."""
+        ox, oy = self.world_to_screen(0, 0)
+        scale = self.TILE * self.zoom_level
+        map_rect = pygame.Rect(int(ox), int(oy), int(self.game.width * scale), int(self.game.height * scale))
+        view = (self.screen.get_size(), self.camera_x, self.camera_y, self.zoom_level)
+        dynamic = self._dynamic_rects()
+
+        if view != self._last_view or self.game.game_over or not dynamic[0].contains(map_rect):
+            # First frame, resize, camera move, or the map spills over the panels
+            self.dirty_rects = None
+        else:
+            self.dirty_rects = dynamic + self._panel_rects + self._overlay_rects + self._last_overlay_rects
+        self._last_view = view
+        self._last_overlay_rects = self._overlay_rects
+
+    def present(self):
+        """Show the frame: display.update on the dirty rects, or a full flip."""
+        if self.dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty_rects)
 
     def _draw_version_info(self):
         """Draw version/timestamp info in top right corner."""
@@ -274,14 +448,50 @@ class Renderer:
         version_text = now.strftime("v%Y-%m-%d %H:%M")
 
         # Render text
-        text_surface = self.font_s.render(version_text, True, self.TEXT)
+        text_surface = self._render_text(self.font_s, version_text, self.TEXT)
         text_rect = text_surface.get_rect()
 
         # Position in top right corner
         text_rect.topright = (self.WIDTH - 5, 5)
 
         # Draw text
-        self.screen.blit(text_surface, text_rect)
+        self._mark_overlay(self.screen.blit(text_surface, text_rect))
+
+    def _draw_profiler(self):
+        """Draw the profiler overlay (F3): rolling ms per section and entity counts."""
+        prof = self.game.profiler
+        stats = prof.stats()
+        # Event handling and update_wave stages in order, then the slowest draw sections
+        wave = [n for n in ("events", "wave.spawn", "wave.towers", "wave.auras", "wave.latch", "wave.walls",
+                            "wave.move", "wave.grid", "wave.cleanup", "draw") if n in stats]
+        draws = sorted((n for n in stats if n.startswith("draw.")), key=lambda n: -stats[n]["avg"])
+        rows = [("section", "avg", "p95", "max")]
+        for name in wave + draws[:self.PROFILER_DRAW_ROWS]:
+            st = stats[name]
+            rows.append((name, f"{st['avg']:.2f}", f"{st['p95']:.2f}", f"{st['max']:.2f}"))
+        counts = prof.entity_counts(self.game, self)
+        footer = ["  ".join(f"{k}:{v}" for k, v in counts.items()), "F3 hide  F4 dump JSON"]
+
+        line_h = self.font_s.get_linesize()
+        panel = pygame.Rect(8, self.grid_y + 8, 330, line_h * (len(rows) + len(footer)) + 10)
+        self.screen.blit(self._overlay(("profiler_bg", panel.width, panel.height), lambda: self._build_profiler_bg(panel.size)), panel)
+        y = panel.y + 5
+        for row in rows:
+            self._blit_text(self.font_s, row[0], self.TEXT, (panel.x + 6, y))
+            # Timings right-aligned in fixed columns
+            for i, value in enumerate(row[1:]):
+                label = self._render_text(self.font_s, value, self.TEXT)
+                self.screen.blit(label, (panel.x + 200 + 55 * i - label.get_width(), y))
+            y += line_h
+        for line in footer:
+            self._blit_text(self.font_s, line, self.TEXT, (panel.x + 6, y))
+            y += line_h
+        self._mark_overlay(panel)
+
+    def _build_profiler_bg(self, size):
+        s = pygame.Surface(size, pygame.SRCALPHA)
+        s.fill((0, 0, 0, 190))
+        return s
 
     def _draw_latch_effects(self):
         """Draw assimilator latch effects."""
@@ -309,7 +519,12 @@ class Renderer:
         self.swarm_fx.draw(self.screen)
 
     def _draw_shop(self):
-        """Draw the shop section."""
+        """Draw the shop section (cached until the cards or shop mode change)."""
+        key = (self.game.shop_mode, tuple((c["type"], c["cost"]) if c else None for c in self.game.shop))
+        self._draw_panel("shop", (0, 0, self.GRID_W, self.SHOP_H), key, self._paint_shop)
+
+    def _paint_shop(self):
+        """Paint the shop section."""
         pygame.draw.rect(self.screen, self.SHOP_BG, (0, 0, self.GRID_W, self.SHOP_H))
         pygame.draw.line(self.screen, self.GRID, (0, self.SHOP_H), (self.GRID_W, self.SHOP_H), 2)
 
@@ -323,8 +538,8 @@ class Renderer:
             if card:
                 if "tile_data" in card:
                     tile = card["tile_data"]
-                    self.screen.blit(self.font_s.render(tile["name"][:10], True, self.TEXT), (x+5, y+5))
-                    self.screen.blit(self.font_s.render(f"{tile['width']}x{tile['height']}", True, self.TEXT), (x+5, y+20))
+                    self._blit_text(self.font_s, tile["name"][:10], self.TEXT, (x+5, y+5))
+                    self._blit_text(self.font_s, f"{tile['width']}x{tile['height']}", self.TEXT, (x+5, y+20))
                     # Draw mini path preview
                     path_grid = tile["path_grid"]
                     cell_size = 8
@@ -334,20 +549,20 @@ class Renderer:
                         for px in range(len(path_grid[py])):
                             if path_grid[py][px]:
                                 pygame.draw.rect(self.screen, self.PATH, (start_x + px*cell_size, start_y + py*cell_size, cell_size, cell_size))
-                    self.screen.blit(self.font_s.render(f"${card['cost']}", True, self.TEXT), (x+5, y+75))
+                    self._blit_text(self.font_s, f"${card['cost']}", self.TEXT, (x+5, y+75))
                 elif "name" in card:
                     # Upgrade card
                     name = card["name"]
                     desc = card["desc"]
-                    self.screen.blit(self.font_s.render(name[:10], True, self.TEXT), (x+5, y+5))
+                    self._blit_text(self.font_s, name[:10], self.TEXT, (x+5, y+5))
                     # Show short description
-                    self.screen.blit(self.font_s.render(desc[:12], True, (180, 180, 200)), (x+5, y+20))
-                    self.screen.blit(self.font_s.render(desc[12:24] if len(desc) > 12 else "", True, (180, 180, 200)), (x+5, y+35))
-                    self.screen.blit(self.font_s.render(f"${card['cost']}", True, self.TEXT), (x+5, y+75))
+                    self._blit_text(self.font_s, desc[:12], (180, 180, 200), (x+5, y+20))
+                    self._blit_text(self.font_s, desc[12:24] if len(desc) > 12 else "", (180, 180, 200), (x+5, y+35))
+                    self._blit_text(self.font_s, f"${card['cost']}", self.TEXT, (x+5, y+75))
                 else:
                     # Tower card
-                    self.screen.blit(self.font_s.render(card["type"][:8], True, self.TEXT), (x+5, y+10))
-                    self.screen.blit(self.font_s.render(f"${card['cost']}", True, self.TEXT), (x+5, y+75))
+                    self._blit_text(self.font_s, card["type"][:8], self.TEXT, (x+5, y+10))
+                    self._blit_text(self.font_s, f"${card['cost']}", self.TEXT, (x+5, y+75))
 
         # Shop mode toggle (moved above refresh button)
         tx = 15 + 400
@@ -356,20 +571,51 @@ class Renderer:
         pygame.draw.rect(self.screen, self.CARD_BG, (tx, ty, 35, 35))
         pygame.draw.rect(self.screen, self.TEXT, (tx, ty, 35, 35), 1)
         mode_char = "T" if self.game.shop_mode == "towers" else ("M" if self.game.shop_mode == "tiles" else "U")
-        self.screen.blit(self.font_s.render(mode_char, True, self.TEXT), (tx+10, ty+10))
+        self._blit_text(self.font_s, mode_char, self.TEXT, (tx+10, ty+10))
 
         # Reroll (moved below shop toggle)
         rx = 15 + 400
         ry = 65
         pygame.draw.rect(self.screen, self.CARD_BG, (rx, ry, 35, 35))
         pygame.draw.rect(self.screen, self.TEXT, (rx, ry, 35, 35), 1)
-        self.screen.blit(self.font_s.render("R", True, self.TEXT), (rx+10, ry+10))
+        self._blit_text(self.font_s, "R", self.TEXT, (rx+10, ry+10))
 
     def _draw_bench(self, frame):
-        """Draw the bench section."""
+        """Draw the bench section (cached unless a card is animated) and the egrem flash."""
+        bench = self.game.bench
+        full_fx = not getattr(self.game, 'minimal_mode', True)
+        animated = any(
+            t is not None and (t.base_type == "Nanite Swarm" or (full_fx and t.get_merge_tier() >= 4))
+            for t in bench
+        )  # Egrem swirls and tier 4 particles are random every frame
+        key = None if animated else (
+            full_fx, self.game.merge_tower_1, self.game.merge_tower_2,
+            tuple((t.base_type, t.dmg, t.get_merge_tier(), t.get_merge_type()) if t else None for t in bench),
+        )
+        # +1/+2: the 2px bottom border line hangs off the bench background
+        self._draw_panel("bench", (0, self.SHOP_H, self.GRID_W + 1, self.BENCH_H + 2), key, self._paint_bench)
+
+        # Flash overlay for egrem
+        if self.game.egrem_flash_bench_idx is not None and frame < self.game.egrem_flash_until:
+            flash_alpha = 80 + 60 * (1 - (self.game.egrem_flash_until - frame) / 120)
+            i = self.game.egrem_flash_bench_idx
+            x = 15 + i * 68
+            y = self.SHOP_H + 15
+            alpha = min(140, int(flash_alpha))
+
+            def build_flash():
+                s = pygame.Surface((60, 90))
+                s.set_alpha(alpha)
+                s.fill((255, 80, 80))
+                return s
+
+            self._mark_overlay(self.screen.blit(self._overlay(("egrem_flash", alpha), build_flash), (x, y)))
+
+    def _paint_bench(self):
+        """Paint the bench section."""
         pygame.draw.rect(self.screen, self.BENCH_BG, (0, self.SHOP_H, self.GRID_W, self.BENCH_H))
         pygame.draw.line(self.screen, self.GRID, (0, self.SHOP_H + self.BENCH_H), (self.GRID_W, self.SHOP_H + self.BENCH_H), 2)
-        self.screen.blit(self.font_s.render("BENCH", True, self.TEXT), (15, self.SHOP_H + 5))
+        self._blit_text(self.font_s, "BENCH", self.TEXT, (15, self.SHOP_H + 5))
 
         for i in range(10):
             x = 15 + i * 68
@@ -398,31 +644,25 @@ class Renderer:
                     pygame.draw.rect(self.screen, (80, 255, 80), (x, y, 60, 90), 2)
                     # Add chaotic swirl effects
                     self._draw_egrem_swirls(x, y, 60, 90)
-                    self.screen.blit(self.font_s.render("Egrem", True, (80, 255, 100)), (x+5, y+5))
-                    self.screen.blit(self.font_s.render("spawn", True, (255, 80, 80)), (x+5, y+28))
-                    self.screen.blit(self.font_s.render(f"T{t.get_merge_tier()}", True, self.TEXT), (x+5, y+50))
+                    self._blit_text(self.font_s, "Egrem", (80, 255, 100), (x+5, y+5))
+                    self._blit_text(self.font_s, "spawn", (255, 80, 80), (x+5, y+28))
+                    self._blit_text(self.font_s, f"T{t.get_merge_tier()}", self.TEXT, (x+5, y+50))
                 else:
                     display_name = t.BASE_TYPES[t.base_type]["display"]
-                    self.screen.blit(self.font_s.render(display_name[:6], True, self.TEXT), (x+5, y+5))
-                    self.screen.blit(self.font_s.render(f"D:{t.dmg}", True, self.TEXT), (x+5, y+30))
-                    self.screen.blit(self.font_s.render(f"T{t.get_merge_tier()}", True, self.TEXT), (x+5, y+50))
-
-        # Flash overlay for egrem
-        if self.game.egrem_flash_bench_idx is not None and frame < self.game.egrem_flash_until:
-            flash_alpha = 80 + 60 * (1 - (self.game.egrem_flash_until - frame) / 120)
-            i = self.game.egrem_flash_bench_idx
-            x = 15 + i * 68
-            y = self.SHOP_H + 15
-            s = pygame.Surface((60, 90))
-            s.set_alpha(min(140, int(flash_alpha)))
-            s.fill((255, 80, 80))
-            self.screen.blit(s, (x, y))
+                    self._blit_text(self.font_s, display_name[:6], self.TEXT, (x+5, y+5))
+                    self._blit_text(self.font_s, f"D:{t.dmg}", self.TEXT, (x+5, y+30))
+                    self._blit_text(self.font_s, f"T{t.get_merge_tier()}", self.TEXT, (x+5, y+50))
 
     def _draw_map_tile_bench(self):
-        """Draw the map tile bench."""
+        """Draw the map tile bench (cached until its tiles or selection change)."""
+        key = (self.game.selected_map_tile, tuple(t["name"] if t else None for t in self.game.map_tile_bench))
+        self._draw_panel("map_tile_bench", (0, self.map_bench_y - 10, 281, 100), key, self._paint_map_tile_bench)
+
+    def _paint_map_tile_bench(self):
+        """Paint the map tile bench."""
         pygame.draw.rect(self.screen, self.SHOP_BG, (0, self.map_bench_y - 10, 280, 100))
         pygame.draw.line(self.screen, self.GRID, (0, self.map_bench_y - 10), (280, self.map_bench_y - 10), 2)
-        self.screen.blit(self.font_s.render("MAP TILES", True, self.TEXT), (15, self.map_bench_y - 5))
+        self._blit_text(self.font_s, "MAP TILES", self.TEXT, (15, self.map_bench_y - 5))
 
         for i in range(3):
             x = self.map_bench_x + i * 80
@@ -434,18 +674,23 @@ class Renderer:
             pygame.draw.rect(self.screen, self.TEXT, (x, y, 70, 80), 2)
             if self.game.map_tile_bench[i]:
                 tile = self.game.map_tile_bench[i]
-                self.screen.blit(self.font_s.render(tile["name"][:8], True, self.TEXT), (x+5, y+10))
-                self.screen.blit(self.font_s.render(f"{tile['width']}x{tile['height']}", True, self.TEXT), (x+5, y+50))
+                self._blit_text(self.font_s, tile["name"][:8], self.TEXT, (x+5, y+10))
+                self._blit_text(self.font_s, f"{tile['width']}x{tile['height']}", self.TEXT, (x+5, y+50))
 
     def _draw_upgrade_bench(self):
-        """Draw the upgrade bench."""
+        """Draw the upgrade bench (cached until its upgrades or selection change)."""
+        key = (self.game.selected_upgrade, tuple(self.game.upgrade_bench))
+        self._draw_panel("upgrade_bench", (self.GRID_W, self.HEIGHT - 110, self.PANEL_RIGHT_W, 110), key, self._paint_upgrade_bench)
+
+    def _paint_upgrade_bench(self):
+        """Paint the upgrade bench."""
         upgrade_bench_x = self.GRID_W + 10
         upgrade_bench_y = self.HEIGHT - 100
         log_debug("Drawing upgrade bench", {"bench_x": upgrade_bench_x, "bench_y": upgrade_bench_y}, location="renderer.py:_draw_upgrade_bench")
 
         pygame.draw.rect(self.screen, self.SHOP_BG, (self.GRID_W, upgrade_bench_y - 10, self.PANEL_RIGHT_W, 100))
         pygame.draw.line(self.screen, self.GRID, (self.GRID_W, upgrade_bench_y - 10), (self.WIDTH, upgrade_bench_y - 10), 2)
-        self.screen.blit(self.font_s.render("UPGRADES", True, self.TEXT), (self.GRID_W + 15, upgrade_bench_y - 5))
+        self._blit_text(self.font_s, "UPGRADES", self.TEXT, (self.GRID_W + 15, upgrade_bench_y - 5))
 
         for i in range(3):
             x = upgrade_bench_x + i * 55
@@ -463,11 +708,11 @@ class Renderer:
                 name = u.get("name", upgrade_id)
                 if len(name) > 8:
                     name = name[:6] + ".."
-                self.screen.blit(self.font_s.render(name, True, self.TEXT), (x+3, y+5))
-                self.screen.blit(self.font_s.render(f"${u.get('cost', 0)}", True, self.TEXT), (x+3, y+60))
+                self._blit_text(self.font_s, name, self.TEXT, (x+3, y+5))
+                self._blit_text(self.font_s, f"${u.get('cost', 0)}", self.TEXT, (x+3, y+60))
 
         hint_text = "Click or press 1-3 to select"
-        self.screen.blit(self.font_s.render(hint_text, True, (160, 160, 180)), (self.GRID_W + 15, upgrade_bench_y + 85))
+        self._blit_text(self.font_s, hint_text, (160, 160, 180), (self.GRID_W + 15, upgrade_bench_y + 85))
 
     def _draw_rotate_button(self):
         """Draw the rotate button for selected map tiles."""
@@ -478,23 +723,23 @@ class Renderer:
             # Left rotate button
             pygame.draw.rect(self.screen, self.PANEL_BTN, (rot_x, rot_y, 26, 26))
             pygame.draw.rect(self.screen, self.TEXT, (rot_x, rot_y, 26, 26), 1)
-            self.screen.blit(self.font_s.render("<", True, self.TEXT), (rot_x + 8, rot_y + 6))
+            self._blit_text(self.font_s, "<", self.TEXT, (rot_x + 8, rot_y + 6))
 
             # Right rotate button
             pygame.draw.rect(self.screen, self.PANEL_BTN, (rot_x + 34, rot_y, 26, 26))
             pygame.draw.rect(self.screen, self.TEXT, (rot_x + 34, rot_y, 26, 26), 1)
-            self.screen.blit(self.font_s.render(">", True, self.TEXT), (rot_x + 42, rot_y + 6))
+            self._blit_text(self.font_s, ">", self.TEXT, (rot_x + 42, rot_y + 6))
 
             # Degree label
-            deg_lbl = self.font_s.render(f"{self.game.selected_tile_rotation * 90}\u00b0", True, self.TEXT)
+            deg_lbl = self._render_text(self.font_s, f"{self.game.selected_tile_rotation * 90}\u00b0", self.TEXT)
             self.screen.blit(deg_lbl, (rot_x + 27 - deg_lbl.get_width() // 2, rot_y + 7))
 
             # Step indicator
-            step_lbl = self.font_s.render(f"{self.game.selected_tile_rotation + 1}/4", True, (160, 160, 180))
+            step_lbl = self._render_text(self.font_s, f"{self.game.selected_tile_rotation + 1}/4", (160, 160, 180))
             self.screen.blit(step_lbl, (rot_x + 30 - step_lbl.get_width() // 2, rot_y + 30))
 
             # Hint text
-            hint_lbl = self.font_s.render("A/D or </> rotate", True, (120, 120, 140))
+            hint_lbl = self._render_text(self.font_s, "A/D or </> rotate", (120, 120, 140))
             self.screen.blit(hint_lbl, (rot_x - 10, rot_y + 46))
 
     def _draw_merge_preview(self):
@@ -527,24 +772,36 @@ class Renderer:
 
             # Draw label
             mid_x, mid_y = (cx1 + cx2) // 2, cy
-            label_surf = self.font_merge.render(preview_info["label"], True, (0, 0, 0))
+            label_surf = self._render_text(self.font_merge, preview_info["label"], (0, 0, 0))
             label_rect = label_surf.get_rect(center=(mid_x, mid_y))
             label_rect.inflate_ip(13, 8)
             pygame.draw.rect(self.screen, preview_info["label_bg_color"], label_rect)
             pygame.draw.rect(self.screen, preview_info["label_border_color"], label_rect, 2)
 
-            # Draw label outline
+            # Draw label outline (one white surface blitted at each offset)
+            lx = label_rect.centerx - label_surf.get_width()//2
+            ly = label_rect.centery - label_surf.get_height()//2
+            outline_surf = self._render_text(self.font_merge, preview_info["label"], (255, 255, 255))
             for ox, oy in [(-1,-1),(-1,1),(1,-1),(1,1),(0,-1),(0,1),(-1,0),(1,0)]:
-                self.screen.blit(self.font_merge.render(preview_info["label"], True, (255, 255, 255)),
-                               (label_rect.centerx - label_surf.get_width()//2 + ox, label_rect.centery - label_surf.get_height()//2 + oy))
-            self.screen.blit(label_surf, (label_rect.centerx - label_surf.get_width()//2, label_rect.centery - label_surf.get_height()//2))
+                self.screen.blit(outline_surf, (lx + ox, ly + oy))
+            self.screen.blit(label_surf, (lx, ly))
 
             # Draw cost
-            cost_surf = self.font_s.render(f"${preview_info['cost']}", True, preview_info["cost_color"])
+            cost_surf = self._render_text(self.font_s, f"${preview_info['cost']}", preview_info["cost_color"])
             self.screen.blit(cost_surf, (mid_x - cost_surf.get_width()//2, mid_y + 18))
+            self._mark_overlay((0, self.SHOP_H, self.GRID_W, self.BENCH_H))
 
     def _draw_right_panel(self):
-        """Draw the right panel with game stats and controls."""
+        """Draw the right panel with game stats and controls (cached until a shown value changes)."""
+        g = self.game
+        key = (
+            g.gold, g.lives, g.round_num, getattr(g, 'minimal_mode', True), getattr(g, 'shop_power_level', None),
+            getattr(g, 'xp', None), getattr(g, 'xp_to_next', None), g.paused, g.auto_mode,
+        )
+        self._draw_panel("right_panel", (self.GRID_W, 0, self.PANEL_RIGHT_W, self.SHOP_H + self.BENCH_H + 1), key, self._paint_right_panel)
+
+    def _paint_right_panel(self):
+        """Paint the right panel."""
         pygame.draw.rect(self.screen, self.PANEL_BG, (self.GRID_W, 0, self.PANEL_RIGHT_W, self.SHOP_H + self.BENCH_H))
         pygame.draw.line(self.screen, self.GRID, (self.GRID_W, 0), (self.GRID_W, self.SHOP_H + self.BENCH_H), 2)
 
@@ -552,16 +809,16 @@ class Renderer:
         py = 18  # Starting Y position
 
         # Basic stats
-        self.screen.blit(self.font.render(f"Gold:  {self.game.gold}", True, self.TEXT), (px, py))
+        self._blit_text(self.font, f"Gold:  {self.game.gold}", self.TEXT, (px, py))
         py += 24
-        self.screen.blit(self.font.render(f"Lives: {self.game.lives}", True, self.TEXT), (px, py))
+        self._blit_text(self.font, f"Lives: {self.game.lives}", self.TEXT, (px, py))
         py += 24
-        self.screen.blit(self.font.render(f"Wave:  {self.game.round_num}", True, self.TEXT), (px, py))
+        self._blit_text(self.font, f"Wave:  {self.game.round_num}", self.TEXT, (px, py))
         py += 24
 
         # SPL/XP UI (full mode only)
         if not getattr(self.game, 'minimal_mode', True) and hasattr(self.game, 'shop_power_level'):
-            self.screen.blit(self.font.render(f"SPL:   {self.game.shop_power_level}", True, self.TEXT), (px, py))
+            self._blit_text(self.font, f"SPL:   {self.game.shop_power_level}", self.TEXT, (px, py))
             py += 24
 
             # XP Progress bar
@@ -576,7 +833,7 @@ class Renderer:
             py += bar_height + 4
 
             xp_text = f"XP: {self.game.xp}/{self.game.xp_to_next}"
-            self.screen.blit(self.font_s.render(xp_text, True, self.TEXT), (px, py))
+            self._blit_text(self.font_s, xp_text, self.TEXT, (px, py))
             py += 20
 
         # Add some spacing before buttons
@@ -587,14 +844,14 @@ class Renderer:
         col_play = self.PANEL_BTN_SEL if self.game.paused else self.PANEL_BTN
         pygame.draw.rect(self.screen, col_play, play_rect)
         pygame.draw.rect(self.screen, self.TEXT, play_rect, 1)
-        self.screen.blit(self.font_s.render("Play" if self.game.paused else "Pause", True, self.TEXT), (px + 28, py + 4))
+        self._blit_text(self.font_s, "Play" if self.game.paused else "Pause", self.TEXT, (px + 28, py + 4))
         py += 32
 
         # Next Wave button
         next_rect = pygame.Rect(px, py, 100, 26)
         pygame.draw.rect(self.screen, self.PANEL_BTN, next_rect)
         pygame.draw.rect(self.screen, self.TEXT, next_rect, 1)
-        self.screen.blit(self.font_s.render("Next Wave", True, self.TEXT), (px + 14, py + 4))
+        self._blit_text(self.font_s, "Next Wave", self.TEXT, (px + 14, py + 4))
         py += 32
 
         # Auto toggle button
@@ -602,7 +859,7 @@ class Renderer:
         col_auto = self.PANEL_BTN_SEL if self.game.auto_mode else self.PANEL_BTN
         pygame.draw.rect(self.screen, col_auto, auto_rect)
         pygame.draw.rect(self.screen, self.TEXT, auto_rect, 1)
-        self.screen.blit(self.font_s.render("Auto " + ("ON" if self.game.auto_mode else "OFF"), True, self.TEXT), (px + 18, py + 4))
+        self._blit_text(self.font_s, "Auto " + ("ON" if self.game.auto_mode else "OFF"), self.TEXT, (px + 18, py + 4))
 
     def _draw_upgrade_dialog(self):
         """Draw the upgrade dialog when a tower is selected."""
@@ -615,54 +872,54 @@ class Renderer:
         dialog_height = base_height + upgrade_height
 
         dialog_rect = pygame.Rect(self.GRID_W + 8, 162, 164, dialog_height)
+
+        self._mark_overlay(dialog_rect)
         pygame.draw.rect(self.screen, (35, 35, 50), dialog_rect)
         pygame.draw.rect(self.screen, self.TEXT, dialog_rect, 2)
-        self.screen.blit(self.font.render("Upgrade", True, self.TEXT), (self.GRID_W + 14, 168))
-        self.screen.blit(self.font_s.render(f"{t.base_type}  D:{t.dmg} R:{t.range}", True, self.TEXT), (self.GRID_W + 14, 184))
+        self._blit_text(self.font, "Upgrade", self.TEXT, (self.GRID_W + 14, 168))
+        self._blit_text(self.font_s, f"{t.base_type}  D:{t.dmg} R:{t.range}", self.TEXT, (self.GRID_W + 14, 184))
 
         capacity_text = f"Upgrades: {len(t.upgrades)}/{t.UPGRADE_CAPACITY}"
         capacity_color = (180, 180, 200) if len(t.upgrades) < t.UPGRADE_CAPACITY else (255, 150, 150)
-        self.screen.blit(self.font_s.render(capacity_text, True, capacity_color), (self.GRID_W + 14, 200))
+        self._blit_text(self.font_s, capacity_text, capacity_color, (self.GRID_W + 14, 200))
 
-        self.screen.blit(self.font_s.render("Select upgrade from bench,", True, (160, 160, 180)), (self.GRID_W + 14, 220))
-        self.screen.blit(self.font_s.render("then click tower to apply", True, (160, 160, 180)), (self.GRID_W + 14, 235))
+        self._blit_text(self.font_s, "Select upgrade from bench,", (160, 160, 180), (self.GRID_W + 14, 220))
+        self._blit_text(self.font_s, "then click tower to apply", (160, 160, 180), (self.GRID_W + 14, 235))
 
         button_y = 266 + upgrade_height
         pygame.draw.rect(self.screen, (120, 80, 80), (self.GRID_W + 10, button_y, 75, 24))
         pygame.draw.rect(self.screen, self.TEXT, (self.GRID_W + 10, button_y, 75, 24), 1)
-        self.screen.blit(self.font_s.render("Sell 60%", True, self.TEXT), (self.GRID_W + 18, button_y + 4))
+        self._blit_text(self.font_s, "Sell 60%", self.TEXT, (self.GRID_W + 18, button_y + 4))
         pygame.draw.rect(self.screen, self.PANEL_BTN, (self.GRID_W + 95, button_y, 75, 24))
         pygame.draw.rect(self.screen, self.TEXT, (self.GRID_W + 95, button_y, 75, 24), 1)
-        self.screen.blit(self.font_s.render("Close", True, self.TEXT), (self.GRID_W + 118, button_y + 4))
+        self._blit_text(self.font_s, "Close", self.TEXT, (self.GRID_W + 118, button_y + 4))
 
         tower_stats_y = button_y + 34
-        self.screen.blit(self.font_s.render("Stats:", True, self.TEXT), (self.GRID_W + 14, tower_stats_y))
+        self._blit_text(self.font_s, "Stats:", self.TEXT, (self.GRID_W + 14, tower_stats_y))
         tower_stats_y += 16
-        self.screen.blit(self.font_s.render(f"Damage: {t.dmg}", True, self.TEXT), (self.GRID_W + 14, tower_stats_y))
+        self._blit_text(self.font_s, f"Damage: {t.dmg}", self.TEXT, (self.GRID_W + 14, tower_stats_y))
         tower_stats_y += 16
-        self.screen.blit(self.font_s.render(f"Range: {t.range}", True, self.TEXT), (self.GRID_W + 14, tower_stats_y))
+        self._blit_text(self.font_s, f"Range: {t.range}", self.TEXT, (self.GRID_W + 14, tower_stats_y))
         tower_stats_y += 16
-        self.screen.blit(self.font_s.render(f"Fire Rate: {t.fire_rate}", True, self.TEXT), (self.GRID_W + 14, tower_stats_y))
+        self._blit_text(self.font_s, f"Fire Rate: {t.fire_rate}", self.TEXT, (self.GRID_W + 14, tower_stats_y))
         tower_stats_y += 16
-        self.screen.blit(self.font_s.render(f"Heat: {t.heat:.1f}/{t.max_heat}", True, self.TEXT), (self.GRID_W + 14, tower_stats_y))
+        self._blit_text(self.font_s, f"Heat: {t.heat:.1f}/{t.max_heat}", self.TEXT, (self.GRID_W + 14, tower_stats_y))
         tower_stats_y += 20
         if t.upgrades:
-            self.screen.blit(self.font_s.render("Upgrades:", True, self.TEXT), (self.GRID_W + 14, tower_stats_y))
+            self._blit_text(self.font_s, "Upgrades:", self.TEXT, (self.GRID_W + 14, tower_stats_y))
             for uid in t.upgrades:
                 tower_stats_y += 16
                 from data.upgrades import UPGRADE_DEFS
                 name = UPGRADE_DEFS.get(uid, {}).get("name", uid)
-                self.screen.blit(self.font_s.render(f"- {name}", True, (180, 180, 200)), (self.GRID_W + 14, tower_stats_y))
+                self._blit_text(self.font_s, f"- {name}", (180, 180, 200), (self.GRID_W + 14, tower_stats_y))
 
         # Range visualization
         if t.fire_type != "Overwatch":
             cx = t.x * self.TILE + 20
             cy = self.grid_y + t.y * self.TILE + 20
             rad = t.range * self.TILE
-            s = pygame.Surface((rad*2+4, rad*2+4), pygame.SRCALPHA)
-            pygame.draw.circle(s, (100, 160, 255, 80), (rad+2, rad+2), rad)
-            pygame.draw.circle(s, (160, 220, 255, 150), (rad+2, rad+2), rad, 2)
-            self.screen.blit(s, (cx-rad-2, cy-rad-2))
+            s = self._ring_overlay("dialog_range", rad, (100, 160, 255, 80), (160, 220, 255, 150))
+            self._mark_overlay(self.screen.blit(s, (cx-rad-2, cy-rad-2)))
 
     def _draw_enemy_stats(self):
         """Draw enemy stats when an enemy is selected."""
@@ -671,98 +928,127 @@ class Renderer:
 
         e = self.game.selected_enemy
         enemy_stats_rect = pygame.Rect(self.GRID_W + 8, 162 + 320 + 10, 164, 120)
+        self._mark_overlay(enemy_stats_rect)
         pygame.draw.rect(self.screen, (35, 35, 50), enemy_stats_rect)
         pygame.draw.rect(self.screen, self.TEXT, enemy_stats_rect, 2)
         y_offset = enemy_stats_rect.y + 6
-        self.screen.blit(self.font.render(f"{e.display_name}", True, self.TEXT), (enemy_stats_rect.x + 6, y_offset))
+        self._blit_text(self.font, f"{e.display_name}", self.TEXT, (enemy_stats_rect.x + 6, y_offset))
         y_offset += 20
-        self.screen.blit(self.font_s.render(f"HP: {e.health}/{e.max_health}", True, self.TEXT), (enemy_stats_rect.x + 6, y_offset))
+        self._blit_text(self.font_s, f"HP: {e.health}/{e.max_health}", self.TEXT, (enemy_stats_rect.x + 6, y_offset))
         y_offset += 16
-        self.screen.blit(self.font_s.render(f"Speed: {e.move_speed}", True, self.TEXT), (enemy_stats_rect.x + 6, y_offset))
+        self._blit_text(self.font_s, f"Speed: {e.move_speed}", self.TEXT, (enemy_stats_rect.x + 6, y_offset))
         y_offset += 16
-        self.screen.blit(self.font_s.render(f"Difficulty: {e.difficulty}", True, self.TEXT), (enemy_stats_rect.x + 6, y_offset))
+        self._blit_text(self.font_s, f"Difficulty: {e.difficulty}", self.TEXT, (enemy_stats_rect.x + 6, y_offset))
         y_offset += 16
-        self.screen.blit(self.font_s.render(f"Wave: {e.wave_num}", True, self.TEXT), (enemy_stats_rect.x + 6, y_offset))
+        self._blit_text(self.font_s, f"Wave: {e.wave_num}", self.TEXT, (enemy_stats_rect.x + 6, y_offset))
         y_offset += 16
-        self.screen.blit(self.font_s.render(f"Position: {e.position_index}", True, self.TEXT), (enemy_stats_rect.x + 6, y_offset))
+        self._blit_text(self.font_s, f"Position: {e.position_index}", self.TEXT, (enemy_stats_rect.x + 6, y_offset))
 
     def _draw_grid(self):
-        """Draw the game grid."""
+        """Draw the game grid (static map layer, cached offscreen)."""
+        layer = self._get_map_layer()
+        if layer is None:
+            # Too big to cache at this zoom; paint straight to the screen
+            ox, oy = self.world_to_screen(0, 0)
+            self._paint_map(self.screen, ox, oy)
+            return
+        ox, oy = self.world_to_screen(0, 0)
+        self.screen.blit(layer, (int(ox), int(oy)))
+
+    def _get_map_layer(self):
+        """
+        Get the pre-rendered map layer (grid lines, path, connectors, 'X' cells).
+
+        Rebuilt only when the path/grid version, zoom or grid size changes.
+
+        Returns:
+            pygame.Surface or None if the layer would exceed MAP_LAYER_MAX_PIXELS
+            (WEB_MAP_LAYER_MAX_PIXELS in web mode)
+        """
+        key = (getattr(self.game, 'path_version', 0), self.zoom_level, self.game.width, self.game.height)
+        if key == self._map_layer_key:
+            return self._map_layer
+        cell = self.TILE * self.zoom_level
+        w = int(self.game.width * cell) + 2
+        h = int(self.game.height * cell) + 2
+        self._map_layer_key = key
+        self._map_layer = None
+        limit = self.WEB_MAP_LAYER_MAX_PIXELS if getattr(self.game, "web_mode", False) else self.MAP_LAYER_MAX_PIXELS
+        if w * h <= limit:
+            layer = pygame.Surface((w, h))
+            layer.fill(self.MAP_LAYER_KEY)
+            layer.set_colorkey(self.MAP_LAYER_KEY)
+            self._paint_map(layer, 0, 0)
+            self._map_layer = layer
+        return self._map_layer
+
+    def _paint_map(self, target, ox, oy):
+        """Paint the static map onto `target` with world (0, 0) at (ox, oy)."""
+        cell = self.TILE * self.zoom_level
+
+        def to_target(wx, wy):
+            return ox + wx * cell, oy + wy * cell
+
         for x in range(self.game.width + 1):
-            sx1, sy1 = self.world_to_screen(x, 0)
-            sx2, sy2 = self.world_to_screen(x, self.game.height)
-            pygame.draw.line(self.screen, self.GRID, (sx1, sy1), (sx2, sy2), max(1, int(self.zoom_level)))
+            sx1, sy1 = to_target(x, 0)
+            sx2, sy2 = to_target(x, self.game.height)
+            pygame.draw.line(target, self.GRID, (sx1, sy1), (sx2, sy2), max(1, int(self.zoom_level)))
         for y in range(self.game.height + 1):
-            sx1, sy1 = self.world_to_screen(0, y)
-            sx2, sy2 = self.world_to_screen(self.game.width, y)
-            pygame.draw.line(self.screen, self.GRID, (sx1, sy1), (sx2, sy2), max(1, int(self.zoom_level)))
+            sx1, sy1 = to_target(0, y)
+            sx2, sy2 = to_target(self.game.width, y)
+            pygame.draw.line(target, self.GRID, (sx1, sy1), (sx2, sy2), max(1, int(self.zoom_level)))
 
         # Render grid cells
+        half = cell // 2
         for y in range(self.game.height):
             for x in range(self.game.width):
                 cell_content = self.game.grid[y][x]
                 if cell_content == 'P':
-                    sx, sy = self.world_to_screen(x, y)
-                    cell_rect = pygame.Rect(sx + 1, sy + 1, self.TILE * self.zoom_level - 2, self.TILE * self.zoom_level - 2)
-                    pygame.draw.rect(self.screen, (120, 80, 40), cell_rect)
+                    sx, sy = to_target(x, y)
+                    cell_rect = pygame.Rect(sx + 1, sy + 1, cell - 2, cell - 2)
+                    pygame.draw.rect(target, (120, 80, 40), cell_rect)
 
                     cell_pos = (x, y)
-                    path_index = None
-                    for i, path_pos in enumerate(self.game.path):
-                        if path_pos == cell_pos:
-                            path_index = i
-                            break
+                    path_index = self.game.path_index.get(cell_pos)
 
                     if path_index is not None:
                         prev_pos = self.game.path[path_index - 1] if path_index > 0 else None
                         next_pos = self.game.path[path_index + 1] if path_index < len(self.game.path) - 1 else None
 
-                        center_x = sx + (self.TILE * self.zoom_level) // 2
-                        center_y = sy + (self.TILE * self.zoom_level) // 2
+                        center_x = sx + half
+                        center_y = sy + half
                         path_width = max(2, int(8 * self.zoom_level))
 
-                        if prev_pos:
-                            dx = prev_pos[0] - cell_pos[0]
-                            dy = prev_pos[1] - cell_pos[1]
-                            if dx > 0:
-                                start_x, start_y = center_x + (self.TILE * self.zoom_level) // 2, center_y
-                            elif dx < 0:
-                                start_x, start_y = center_x - (self.TILE * self.zoom_level) // 2, center_y
-                            elif dy > 0:
-                                start_x, start_y = center_x, center_y + (self.TILE * self.zoom_level) // 2
-                            elif dy < 0:
-                                start_x, start_y = center_x, center_y - (self.TILE * self.zoom_level) // 2
-                            else:
-                                start_x, start_y = center_x, center_y
-                            pygame.draw.line(self.screen, (160, 82, 45), (center_x, center_y), (start_x, start_y), path_width)
-
-                        if next_pos:
-                            dx = next_pos[0] - cell_pos[0]
-                            dy = next_pos[1] - cell_pos[1]
+                        # Connector from the centre towards each path neighbour
+                        for neighbor in (prev_pos, next_pos):
+                            if not neighbor:
+                                continue
+                            dx = neighbor[0] - cell_pos[0]
+                            dy = neighbor[1] - cell_pos[1]
                             if dx > 0:
-                                end_x, end_y = center_x + (self.TILE * self.zoom_level) // 2, center_y
+                                end_x, end_y = center_x + half, center_y
                             elif dx < 0:
-                                end_x, end_y = center_x - (self.TILE * self.zoom_level) // 2, center_y
+                                end_x, end_y = center_x - half, center_y
                             elif dy > 0:
-                                end_x, end_y = center_x, center_y + (self.TILE * self.zoom_level) // 2
+                                end_x, end_y = center_x, center_y + half
                             elif dy < 0:
-                                end_x, end_y = center_x, center_y - (self.TILE * self.zoom_level) // 2
+                                end_x, end_y = center_x, center_y - half
                             else:
                                 end_x, end_y = center_x, center_y
-                            pygame.draw.line(self.screen, (160, 82, 45), (center_x, center_y), (end_x, end_y), path_width)
+                            pygame.draw.line(target, (160, 82, 45), (center_x, center_y), (end_x, end_y), path_width)
 
                 elif cell_content == 'X':
-                    sx, sy = self.world_to_screen(x, y)
-                    cell_rect = pygame.Rect(sx + 1, sy + 1, self.TILE * self.zoom_level - 2, self.TILE * self.zoom_level - 2)
-                    pygame.draw.rect(self.screen, (128, 128, 128), cell_rect)
+                    sx, sy = to_target(x, y)
+                    cell_rect = pygame.Rect(sx + 1, sy + 1, cell - 2, cell - 2)
+                    pygame.draw.rect(target, (128, 128, 128), cell_rect)
 
         # Connecting lines
         for i in range(len(self.game.path) - 1):
             x1, y1 = self.game.path[i]
             x2, y2 = self.game.path[i+1]
-            sx1, sy1 = self.world_to_screen(x1, y1)
-            sx2, sy2 = self.world_to_screen(x2, y2)
-            pygame.draw.line(self.screen, (120, 60, 30),
+            sx1, sy1 = to_target(x1, y1)
+            sx2, sy2 = to_target(x2, y2)
+            pygame.draw.line(target, (120, 60, 30),
                            (sx1 + 20 * self.zoom_level, sy1 + 20 * self.zoom_level),
                            (sx2 + 20 * self.zoom_level, sy2 + 20 * self.zoom_level),
                            max(2, int(6 * self.zoom_level)))
@@ -786,10 +1072,8 @@ class Renderer:
                     cy = self.grid_y + t.y * self.TILE + 20
                 if t and t.fire_type != "Overwatch":
                     r = min(t.range * self.TILE * self.zoom_level, 200)
-                    s = pygame.Surface((r*2+4, r*2+4), pygame.SRCALPHA)
-                    pygame.draw.circle(s, (100, 160, 255, 60), (r+2, r+2), r)
-                    pygame.draw.circle(s, (160, 220, 255, 180), (r+2, r+2), r, 2)
-                    self.screen.blit(s, (cx-r-2, cy-r-2))
+                    s = self._ring_overlay("range_preview", r, (100, 160, 255, 60), (160, 220, 255, 180))
+                    self._mark_overlay(self.screen.blit(s, (cx-r-2, cy-r-2)))
 
     def _draw_tile_preview(self):
         """Draw tile placement preview."""
@@ -809,18 +1093,23 @@ class Renderer:
                 preview_x, preview_y = self.world_to_screen(gx, gy)
                 cell_size = self.TILE * self.zoom_level
 
+                def build_cell():
+                    s = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+                    s.fill(fill_color)
+                    return s
+
+                cell_surf = self._overlay(("tile_preview_cell", cell_size, fill_color), build_cell)
+
                 for py in range(len(rotated_grid)):
                     for px in range(len(rotated_grid[py])):
                         if rotated_grid[py][px]:
                             rect = pygame.Rect(preview_x + px*cell_size, preview_y + py*cell_size, cell_size, cell_size)
-                            s = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
-                            s.fill(fill_color)
-                            self.screen.blit(s, rect)
+                            self.screen.blit(cell_surf, rect)
                             pygame.draw.rect(self.screen, border_color, rect, max(1, int(2 * self.zoom_level)))
 
                 label_text = "OK" if placement_valid else "X"
                 label_col = (80, 255, 100) if placement_valid else (255, 80, 80)
-                lbl = self.font_s.render(label_text, True, label_col)
+                lbl = self._render_text(self.font_s, label_text, label_col)
                 self.screen.blit(lbl, (mx + 14, my - 14))
 
     def _draw_attack_beams(self, frame):
@@ -840,87 +1129,75 @@ class Renderer:
                 pygame.draw.line(self.screen, col, (tx, ty), (exx, eyy), w)
 
     def _draw_towers(self):
-        """Draw towers on the grid."""
+        """Draw towers on the grid (one atlas blit each, plus the Radius ring)."""
+        atlas = self.atlas
+        atlas.set_zoom(self.zoom_level)
+        offset = atlas.tower_offset()
+
+        upgrade_id = None
+        if self.game.selected_upgrade is not None:
+            upgrade_id = self.game.upgrade_bench[self.game.selected_upgrade]
+        upgrade_width = max(2, int(4 * self.zoom_level))
+        border_width = max(1, int(2 * self.zoom_level))
+
         for t in self.game.towers:
             col = self.tower_colors.get(t.base_type, (150, 150, 150))
             tx, ty = self.world_to_screen(t.x, t.y)
-            r = pygame.Rect(tx + 6 * self.zoom_level, ty + 6 * self.zoom_level,
-                          (self.TILE * self.zoom_level) - 12, (self.TILE * self.zoom_level) - 12)
-            pygame.draw.rect(self.screen, col, r)
 
             if self.game.selected_upgrade is not None:
-                from data.upgrades import UPGRADE_DEFS
-                upgrade_id = self.game.upgrade_bench[self.game.selected_upgrade]
+                # Green if the selected upgrade can be applied, red otherwise
                 if upgrade_id and len(t.upgrades) < t.UPGRADE_CAPACITY and upgrade_id not in t.upgrades:
-                    pygame.draw.rect(self.screen, (100, 255, 100), r, max(2, int(4 * self.zoom_level)))
+                    sprite = atlas.tower(col, (100, 255, 100), upgrade_width)
                 else:
-                    pygame.draw.rect(self.screen, (255, 100, 100), r, max(2, int(4 * self.zoom_level)))
+                    sprite = atlas.tower(col, (255, 100, 100), upgrade_width)
             else:
                 # Use merge type to determine border color
-                merge_type = t.get_merge_type()
-                if merge_type == "pure":
-                    border_color = (255, 255, 255)  # white for pure
-                elif merge_type == "hybrid":
-                    border_color = (160, 110, 60)  # brown for hybrid
-                elif merge_type == "egrem":
-                    border_color = (80, 255, 80)  # green for egrem
-                else:
-                    border_color = (220, 220, 255)  # light blue for base
-                pygame.draw.rect(self.screen, border_color, r, max(1, int(2 * self.zoom_level)))
+                border_color = self.MERGE_BORDER_COLORS.get(t.get_merge_type(), (220, 220, 255))
+                sprite = atlas.tower(col, border_color, border_width)
+            self.screen.blit(sprite, (int(tx + offset), int(ty + offset)))
 
             if t.fire_type == "Radius":
                 cx = tx + 20 * self.zoom_level
                 cy = ty + 20 * self.zoom_level
                 rad = t.range * self.TILE * self.zoom_level
-                s = pygame.Surface((rad*2+4, rad*2+4), pygame.SRCALPHA)
-                pygame.draw.circle(s, (220, 120, 60, 80), (rad+2, rad+2), rad)
-                pygame.draw.circle(s, (255, 150, 80, 150), (rad+2, rad+2), rad, 2)
-                self.screen.blit(s, (cx-rad-2, cy-rad-2))
+                s = self._ring_overlay("radius_ring", rad, (220, 120, 60, 80), (255, 150, 80, 150))
+                self._mark_overlay(self.screen.blit(s, (cx-rad-2, cy-rad-2)))
 
     def _draw_enemies(self):
-        """Draw enemies."""
+        """Draw enemies (one atlas blit for the body, one for the HP bar)."""
+        atlas = self.atlas
+        atlas.set_zoom(self.zoom_level)
+        full_fx = not getattr(self.game, 'minimal_mode', True)
+        radius = atlas.enemy_radius()
+        bar_width, bar_height = atlas.hp_bar_size()
+        hp_bar = atlas.hp_bar(self.HP_BG, self.HP_FILL)
+        bar_dx, bar_dy = 20 * self.zoom_level, 30 * self.zoom_level
+
         for e in self.game.enemies:
             pos = e.get_position()
             if pos:
                 ex, ey = pos
                 exx, eyy = self.world_to_screen(ex, ey)
                 c = (exx + 20 * self.zoom_level, eyy + 20 * self.zoom_level)
-                # Enemy visuals (full mode: black base with green accents)
-                if not getattr(self.game, 'minimal_mode', True):
-                    # Black base for all enemies
-                    base_color = (0, 0, 0)
-                    pygame.draw.circle(self.screen, base_color, c, max(5, int(13 * self.zoom_level)))
-
-                    # Green accents (veins/eyes)
-                    accent_color = (0, 255, 0) if e.is_egrem_spawned else (0, 180, 0)
-                    radius = max(5, int(13 * self.zoom_level))
-
-                    # Draw accent details - small circles at cardinal points for "veins"
-                    accent_positions = [
-                        (c[0], c[1] - radius//2),  # Top (like eyes)
-                        (c[0], c[1] + radius//2),  # Bottom
-                        (c[0] - radius//2, c[1]),  # Left
-                        (c[0] + radius//2, c[1]),  # Right
-                    ]
-                    accent_radius = max(1, int(3 * self.zoom_level))
-                    for ax, ay in accent_positions:
-                        pygame.draw.circle(self.screen, accent_color, (ax, ay), accent_radius)
+                if full_fx:
+                    # Black base with green accents (veins/eyes), brighter for egrem spawns
+                    sprite = atlas.enemy((0, 0, 0), (0, 255, 0) if e.is_egrem_spawned else (0, 180, 0))
                 else:
                     # Original enemy visuals
-                    enemy_color = (60, 220, 60) if e.is_egrem_spawned else self.ENEMY
-                    pygame.draw.circle(self.screen, enemy_color, c, max(5, int(13 * self.zoom_level)))
+                    sprite = atlas.enemy((60, 220, 60) if e.is_egrem_spawned else self.ENEMY)
+                self.screen.blit(sprite, (int(c[0]) - radius, int(c[1]) - radius))
+
                 ratio = max(0, e.health / e.max_health)
-                bar_width = max(10, int(40 * self.zoom_level))
-                bar_height = max(2, int(6 * self.zoom_level))
-                pygame.draw.rect(self.screen, self.HP_BG, (c[0]-20*self.zoom_level, c[1]-30*self.zoom_level, bar_width, bar_height))
-                pygame.draw.rect(self.screen, self.HP_FILL, (c[0]-20*self.zoom_level, c[1]-30*self.zoom_level, bar_width*ratio, bar_height))
+                fill = min(bar_width, int(bar_width * ratio))
+                self.screen.blit(hp_bar, (int(c[0] - bar_dx), int(c[1] - bar_dy)), (bar_width - fill, 0, bar_width, bar_height))
 
     def _draw_wave_bonus(self, frame):
         """Draw wave bonus text."""
         if frame < self.game.wave_bonus_show_until:
-            txt = self.font.render(self.game.wave_bonus_text, True, (100, 255, 140))
+            txt = self._render_text(self.font, self.game.wave_bonus_text, (100, 255, 140))
             tw, th = txt.get_size()
             pygame.draw.rect(self.screen, (0, 0, 0, 180), (self.WIDTH//2 - tw//2 - 20, 60, tw+40, th+20))
+            self._mark_overlay((self.WIDTH//2 - tw//2 - 20, 60, tw+40, th+20))
             self.screen.blit(txt, (self.WIDTH//2 - tw//2, 70))
 
     def _draw_game_over(self):
@@ -928,20 +1205,23 @@ class Renderer:
         if not self.game.game_over:
             return
 
-        o = pygame.Surface((self.WIDTH, self.HEIGHT))
-        o.set_alpha(180)
-        o.fill((0, 0, 0))
-        self.screen.blit(o, (0, 0))
-        txt = self.font_over.render("GAME OVER", True, (255, 80, 80))
+        def build_dim():
+            o = pygame.Surface((self.WIDTH, self.HEIGHT))
+            o.set_alpha(180)
+            o.fill((0, 0, 0))
+            return o
+
+        self.screen.blit(self._overlay(("game_over_dim", self.WIDTH, self.HEIGHT), build_dim), (0, 0))
+        txt = self._render_text(self.font_over, "GAME OVER", (255, 80, 80))
         self.screen.blit(txt, txt.get_rect(center=(self.WIDTH//2, self.HEIGHT//2 - 60)))
-        s = self.font.render(f"Wave {self.game.final_wave}   Gold {self.game.final_gold}", True, self.TEXT)
+        s = self._render_text(self.font, f"Wave {self.game.final_wave}   Gold {self.game.final_gold}", self.TEXT)
         self.screen.blit(s, s.get_rect(center=(self.WIDTH//2, self.HEIGHT//2)))
-        r = self.font.render("Click anywhere to restart", True, self.TEXT)
+        r = self._render_text(self.font, "Click anywhere to restart", self.TEXT)
         self.screen.blit(r, r.get_rect(center=(self.WIDTH//2, self.HEIGHT//2 + 60)))
 
     def _draw_camera_info(self):
         """Draw camera info in top-right."""
         if not self.game.game_over:
-            camera_info = f"Zoom: {self.zoom_level:.1f}x | Camera: ({self.camera_x:.0f}, {self.camera_y:.0f})"
-            info_surf = self.font_s.render(camera_info, True, self.TEXT)
-            self.screen.blit(info_surf, (self.WIDTH - info_surf.get_width() - 10, 10))
\ No newline at end of file
+            camera_info = f"Speed: {speed_label(self.game.sim_speed)} | Zoom: {self.zoom_level:.1f}x | Camera: ({self.camera_x:.0f}, {self.camera_y:.0f})"
+            info_surf = self._render_text(self.font_s, camera_info, self.TEXT)
+            self._mark_overlay(self.screen.blit(info_surf, (self.WIDTH - info_surf.get_width() - 10, 10)))
\ No newline at end of file
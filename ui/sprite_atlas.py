@@ -0,0 +1,105 @@
+"""
+Zoom-aware sprite atlas for towers and enemies.
+
+Towers and enemies used to be rebuilt from rects and circles every frame.
+SpriteAtlas pre-renders each distinct look (tower colour + border, enemy
+body, HP bar) once for the current zoom, so drawing an entity is one or two
+blits. Zoom is quantized so float drift from repeated +/-0.1 steps doesn't
+spawn new atlases; the atlas is cleared and refilled lazily when the
+quantized zoom changes.
+"""
+
+import pygame
+
+
+class SpriteAtlas:
+    """Sprites for one quantized zoom level, keyed by what they look like."""
+
+    ZOOM_DECIMALS = 2  # Quantize zoom to 0.01
+
+    def __init__(self, tile):
+        """
+        Args:
+            tile: Unzoomed tile size in pixels
+        """
+        self.tile = tile
+        self.zoom = None
+        self.sprites = {}
+        self.builds = 0  # Sprites rendered since creation (for tests/profiling)
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def set_zoom(self, zoom):
+        """Switch to `zoom`, dropping every sprite if the quantized level changed."""
+        zoom = round(zoom, self.ZOOM_DECIMALS)
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self.sprites.clear()
+
+    def _get(self, key, build):
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = build()
+            self.builds += 1
+        return sprite
+
+    def tower_offset(self):
+        """Top-left of a tower sprite relative to its cell's screen position."""
+        return 6 * self.zoom
+
+    def tower(self, color, border_color, border_width):
+        """Filled tower square with a border (opaque)."""
+        def build():
+            size = int(self.tile * self.zoom - 12)
+            s = pygame.Surface((size, size))
+            s.fill(color)
+            pygame.draw.rect(s, border_color, s.get_rect(), border_width)
+            return s
+
+        return self._get(("tower", color, border_color, border_width), build)
+
+    def enemy_radius(self):
+        return max(5, int(13 * self.zoom))
+
+    def enemy(self, body_color, accent_color=None):
+        """
+        Round enemy body, centered on a (2r+1)^2 transparent surface.
+
+        Args:
+            body_color: Body fill
+            accent_color: If set, four accent dots ("veins") at the cardinal points
+        """
+        def build():
+            radius = self.enemy_radius()
+            s = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            c = (radius, radius)
+            pygame.draw.circle(s, body_color, c, radius)
+            if accent_color is not None:
+                accent_radius = max(1, int(3 * self.zoom))
+                d = radius // 2
+                for ax, ay in ((0, -d), (0, d), (-d, 0), (d, 0)):
+                    pygame.draw.circle(s, accent_color, (c[0] + ax, c[1] + ay), accent_radius)
+            return s
+
+        return self._get(("enemy", body_color, accent_color), build)
+
+    def hp_bar_size(self):
+        return max(10, int(40 * self.zoom)), max(2, int(6 * self.zoom))
+
+    def hp_bar(self, bg_color, fill_color):
+        """
+        Double-width HP bar strip: fill on the left half, background on the right.
+
+        Blitting a bar-width window starting `fill` pixels left of the middle
+        shows `fill` pixels of fill followed by background, so any HP ratio
+        is a single blit.
+        """
+        def build():
+            w, h = self.hp_bar_size()
+            s = pygame.Surface((w * 2, h))
+            s.fill(fill_color, (0, 0, w, h))
+            s.fill(bg_color, (w, 0, w, h))
+            return s
+
+        return self._get(("hp_bar", bg_color, fill_color), build)
@@ -0,0 +1,85 @@
+"""
+Bounded surface caches for the renderer.
+
+Most of what the renderer draws each frame (labels, numbers, overlays) is
+identical to the previous frame. SurfaceCache keeps recently used surfaces
+in an LRU keyed by whatever describes them, so they are built once and then
+just blitted. Hit/miss counters make the hit rate easy to check.
+"""
+
+from collections import OrderedDict
+
+
+class SurfaceCache:
+    """LRU of pygame surfaces (or anything else) keyed by a hashable description."""
+
+    def __init__(self, max_size=512):
+        """
+        Args:
+            max_size: Entries kept before the least recently used one is evicted
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, factory):
+        """
+        Get the cached value for `key`, building it with `factory()` on a miss.
+
+        Args:
+            key: Hashable description of the surface
+            factory: Zero-argument callable that builds the value
+
+        Returns:
+            The cached (or freshly built) value
+        """
+        entries = self._entries
+        value = entries.get(key)
+        if value is not None or key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = factory()
+        entries[key] = value
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def hit_rate(self):
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Snapshot of size and counters, e.g. for a debug overlay."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+        }
+
+
+def render_text(cache, font, text, color, antialias=True, bgcolor=None):
+    """
+    font.render through a SurfaceCache, keyed by (font, text, color, antialias, bg).
+
+    Returns:
+        pygame.Surface: Shared surface - callers must not draw on it
+    """
+    key = (font, text, tuple(color), antialias, tuple(bgcolor) if bgcolor else None)
+    if bgcolor:
+        return cache.get(key, lambda: font.render(text, antialias, color, bgcolor))
+    return cache.get(key, lambda: font.render(text, antialias, color))
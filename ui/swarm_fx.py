@@ -10,6 +10,13 @@ import random
 import math
 import sys
 
+from ui.surface_cache import SurfaceCache, render_text
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # pygbag compatibility - check if gfxdraw is available
 try:
     import pygame.gfxdraw
@@ -17,78 +24,139 @@ try:
 except ImportError:
     GFXDRAW_AVAILABLE = False
 
-class ParticleEmitter:
-    """Base particle emitter for swarm effects."""
+class ParticlePool:
+    """
+    Fixed-capacity struct-of-arrays pool holding every swarm particle.
 
-    def __init__(self, pos, color, count, lifetime, velocity_range):
-        self.pos = list(pos)
-        self.color = color
-        self.count = count
-        self.lifetime = lifetime
-        self.velocity_range = velocity_range
-        self.particles = []
-        self._generate_particles()
-
-    def _generate_particles(self):
-        """Generate initial particles."""
-        for _ in range(self.count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(*self.velocity_range)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-
-            particle = {
-                'x': self.pos[0],
-                'y': self.pos[1],
-                'vx': vx,
-                'vy': vy,
-                'life': random.uniform(0.5, 1.0) * self.lifetime,
-                'max_life': self.lifetime,
-                'size': random.uniform(1, 3)
-            }
-            self.particles.append(particle)
+    Bursts append to the end of the live range; update() integrates all
+    particles at once and compacts out the dead ones. Emission beyond
+    `capacity` is dropped, so a pile of latch/corruption bursts costs at
+    most `capacity` particles per frame. Uses NumPy when available, plain
+    lists otherwise.
+    """
 
-    def update(self, dt):
-        """Update particle positions and lifetimes."""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['life'] -= dt
+    FIELDS = ("x", "y", "vx", "vy", "life", "max_life", "size", "r", "g", "b")
 
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+    def __init__(self, capacity=512, rng=None):
+        """
+        Args:
+            capacity: Global particle budget
+            rng: random.Random-like source for burst spread (defaults to the random module)
+        """
+        self.capacity = capacity
+        self.rng = rng or random
+        self.count = 0      # Live particles, packed into slots [0, count)
+        self.dropped = 0    # Particles refused because the budget was full
+        if np is not None:
+            self.arrays = {name: np.zeros(capacity, dtype="f4") for name in self.FIELDS}
+        else:
+            self.arrays = {name: [] for name in self.FIELDS}
 
-    def draw(self, surface):
-        """Draw particles to surface."""
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            color = (*self.color[:3], alpha)
+    def __len__(self):
+        return self.count
+
+    def emit(self, pos, color, count, lifetime, velocity_range):
+        """
+        Add a radial burst of particles (as many as the budget allows).
 
+        Args:
+            pos: (x, y) screen position
+            color: RGB color
+            count: Particles requested
+            lifetime: Max lifetime in frames (each particle gets 50-100% of it)
+            velocity_range: (min, max) speed
+        """
+        n = min(count, self.capacity - self.count)
+        self.dropped += count - n
+        if n <= 0:
+            return
+        rng = self.rng
+        rows = {name: [] for name in self.FIELDS}
+        for _ in range(n):
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(*velocity_range)
+            rows["vx"].append(math.cos(angle) * speed)
+            rows["vy"].append(math.sin(angle) * speed)
+            rows["life"].append(rng.uniform(0.5, 1.0) * lifetime)
+            rows["size"].append(rng.uniform(1, 3))
+        rows["x"] = [pos[0]] * n
+        rows["y"] = [pos[1]] * n
+        rows["max_life"] = [lifetime] * n
+        rows["r"], rows["g"], rows["b"] = ([c] * n for c in color[:3])
+
+        start = self.count
+        for name, values in rows.items():
+            if np is not None:
+                self.arrays[name][start:start + n] = values
+            else:
+                self.arrays[name].extend(values)
+        self.count += n
+
+    def update(self, dt):
+        """Move every particle, age it, and compact out the ones that expired."""
+        if not self.count:
+            return
+        a = self.arrays
+        if np is not None:
+            n = self.count
+            a["x"][:n] += a["vx"][:n] * dt
+            a["y"][:n] += a["vy"][:n] * dt
+            a["life"][:n] -= dt
+            alive = np.flatnonzero(a["life"][:n] > 0)
+            if len(alive) < n:
+                for arr in a.values():
+                    arr[:len(alive)] = arr[alive]
+                self.count = len(alive)
+            return
+        a["x"] = [x + vx * dt for x, vx in zip(a["x"], a["vx"])]
+        a["y"] = [y + vy * dt for y, vy in zip(a["y"], a["vy"])]
+        a["life"] = [life - dt for life in a["life"]]
+        if any(life <= 0 for life in a["life"]):
+            keep = [i for i, life in enumerate(a["life"]) if life > 0]
+            for name in self.FIELDS:
+                a[name] = [a[name][i] for i in keep]
+            self.count = len(keep)
+
+    def clear(self):
+        self.count = 0
+        if np is None:
+            for name in self.FIELDS:
+                self.arrays[name] = []
+
+    def draw(self, surface):
+        """Draw every live particle, fading alpha with remaining life."""
+        if not self.count:
+            return
+        n = self.count
+        a = self.arrays
+        if np is not None:
+            xs = a["x"][:n].astype("i4").tolist()
+            ys = a["y"][:n].astype("i4").tolist()
+            sizes = a["size"][:n].tolist()
+            alphas = (255 * (a["life"][:n] / a["max_life"][:n])).astype("i4").tolist()
+            rs, gs, bs = (a[c][:n].astype("i4").tolist() for c in ("r", "g", "b"))
+        else:
+            xs = [int(x) for x in a["x"]]
+            ys = [int(y) for y in a["y"]]
+            sizes = a["size"]
+            alphas = [int(255 * (life / max_life)) for life, max_life in zip(a["life"], a["max_life"])]
+            rs, gs, bs = a["r"], a["g"], a["b"]
+
+        for x, y, size, alpha, r, g, b in zip(xs, ys, sizes, alphas, rs, gs, bs):
+            color = (r, g, b, alpha)
             # Draw particle as circle - use gfxdraw if available, fallback to regular circle
             if GFXDRAW_AVAILABLE:
-                pygame.gfxdraw.filled_circle(
-                    surface,
-                    int(particle['x']),
-                    int(particle['y']),
-                    int(particle['size']),
-                    color
-                )
+                pygame.gfxdraw.filled_circle(surface, x, y, int(size), color)
             else:
                 # Fallback: draw a small rectangle
-                rect = pygame.Rect(
-                    int(particle['x'] - particle['size']),
-                    int(particle['y'] - particle['size']),
-                    int(particle['size'] * 2),
-                    int(particle['size'] * 2)
-                )
-                pygame.draw.rect(surface, color, rect)
+                pygame.draw.rect(surface, color, (int(x - size), int(y - size), int(size * 2), int(size * 2)))
 
 class SwarmCluster:
     """Visual representation of latched assimilator swarm."""
 
-    def __init__(self, pos, enemy_count, color=(100, 200, 255)):
+    def __init__(self, pos, enemy_count, color=(100, 200, 255), rng=None):
         self.pos = pos
+        self.rng = rng or random
         self.enemy_count = enemy_count
         self.color = color
         self.pulse_timer = 0
@@ -159,7 +227,7 @@ class SwarmCluster:
 
         for i in range(tendril_count):
             angle = (i / tendril_count) * 2 * math.pi
-            length = cluster_radius + random.uniform(5, 15)
+            length = cluster_radius + self.rng.uniform(5, 15)
 
             end_x = self.pos[0] + math.cos(angle) * length
             end_y = self.pos[1] + math.sin(angle) * length
@@ -207,13 +275,14 @@ class TraceGlow:
 class DamageNumber:
     """Floating damage numbers for visual feedback."""
 
-    def __init__(self, pos, value, lifetime=60, color=(255, 100, 100)):
+    def __init__(self, pos, value, lifetime=60, color=(255, 100, 100), rng=None):
         self.pos = list(pos)
         self.value = value
         self.lifetime = lifetime
         self.max_lifetime = lifetime
         self.color = color
-        self.velocity = [random.uniform(-1, 1), random.uniform(-2, -1)]  # Float upward
+        rng = rng or random
+        self.velocity = [rng.uniform(-1, 1), rng.uniform(-2, -1)]  # Float upward
 
     def update(self, dt):
         """Update position and lifetime."""
@@ -221,21 +290,23 @@ class DamageNumber:
         self.pos[1] += self.velocity[1] * dt
         self.lifetime -= dt
 
-    def draw(self, surface):
-        """Draw the damage number."""
+    def draw(self, surface, font, text_cache):
+        """
+        Draw the damage number.
+
+        Args:
+            surface: Target surface
+            font: Damage number font
+            text_cache: SurfaceCache shared by all damage numbers
+        """
         if self.lifetime <= 0:
             return
 
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = (*self.color[:3], alpha)
-
-        # Render text (use built-in font in browser - SysFont not available)
-        font = pygame.font.Font(None, 16) if sys.platform == "emscripten" else pygame.font.SysFont('Arial', 16, bold=True)
-        text = font.render(str(self.value), True, color)
+        # font.render ignores colour alpha, so only RGB goes into the (cached) surfaces
+        text = render_text(text_cache, font, str(self.value), self.color[:3])
 
         # Draw text with slight shadow for visibility
-        shadow_color = (0, 0, 0, alpha // 2)
-        shadow_text = font.render(str(self.value), True, shadow_color)
+        shadow_text = render_text(text_cache, font, str(self.value), (0, 0, 0))
 
         surface.blit(shadow_text, (self.pos[0] + 1, self.pos[1] + 1))
         surface.blit(text, self.pos)
@@ -243,12 +314,31 @@ class DamageNumber:
 class SwarmFXManager:
     """Manages all swarm visual effects."""
 
-    def __init__(self):
-        self.particle_emitters = []
+    MAX_PARTICLES = 512  # Global budget shared by all bursts
+    LATCH_JITTER_VARIANTS = 6  # Pre-rendered animation frames per latch geometry
+    LATCH_JITTER_HOLD = 4      # Frames each variant stays on screen
+
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: random.Random-like source for cosmetic randomness (Game.rng.visual);
+                defaults to the random module
+        """
+        self.rng = rng or random
+        self.particles = ParticlePool(self.MAX_PARTICLES, self.rng)
         self.swarm_clusters = []
         self.trace_glows = []
         self.damage_numbers = []
 
+        # Damage numbers repeat constantly (same value, same colour), so
+        # their surfaces are shared across all DamageNumber instances
+        self.text_cache = SurfaceCache(256)
+        self._damage_font = None
+
+        # Pre-rendered latch sprites (see draw_latch)
+        self.latch_cache = SurfaceCache(256)
+        self._tick = 0
+
     def add_latch_effect(self, pos, stack_count):
         """
         Add visual effect for assimilator latching.
@@ -259,11 +349,10 @@ class SwarmFXManager:
         """
         # Add particle burst
         color = (100, 200, 255)  # Blue for latch
-        emitter = ParticleEmitter(pos, color, 10, 30, (20, 50))
-        self.particle_emitters.append(emitter)
+        self.particles.emit(pos, color, 10, 30, (20, 50))
 
         # Add swarm cluster
-        cluster = SwarmCluster(pos, stack_count, color)
+        cluster = SwarmCluster(pos, stack_count, color, self.rng)
         self.swarm_clusters.append(cluster)
 
     def add_corruption_effect(self, pos, intensity=1.0):
@@ -276,8 +365,7 @@ class SwarmFXManager:
         """
         # Add red particle burst for corruption
         color = (255, 100, 100)
-        emitter = ParticleEmitter(pos, color, 15, 45, (30, 70))
-        self.particle_emitters.append(emitter)
+        self.particles.emit(pos, color, 15, 45, (30, 70))
 
     def add_damage_number(self, pos, damage):
         """
@@ -287,7 +375,7 @@ class SwarmFXManager:
             pos: (x, y) position to display damage
             damage: Damage value to display
         """
-        number = DamageNumber(pos, damage)
+        number = DamageNumber(pos, damage, rng=self.rng)
         self.damage_numbers.append(number)
 
     def add_trace_glow(self, path_segment, intensity=0.8):
@@ -303,21 +391,20 @@ class SwarmFXManager:
 
     def update(self, dt):
         """Update all effects."""
-        # Update and remove dead emitters
-        for emitter in self.particle_emitters[:]:
-            emitter.update(dt)
-            if not emitter.particles:
-                self.particle_emitters.remove(emitter)
+        self._tick += 1
+
+        # Integrate all particles and cull the expired ones
+        self.particles.update(dt)
 
         # Update clusters
         for cluster in self.swarm_clusters:
             cluster.update(dt)
 
-        # Update and remove dead damage numbers
-        for number in self.damage_numbers[:]:
-            number.update(dt)
-            if number.lifetime <= 0:
-                self.damage_numbers.remove(number)
+        # Update damage numbers and drop the expired ones in one pass
+        if self.damage_numbers:
+            for number in self.damage_numbers:
+                number.update(dt)
+            self.damage_numbers = [n for n in self.damage_numbers if n.lifetime > 0]
 
         # Update glows
         for glow in self.trace_glows:
@@ -330,21 +417,33 @@ class SwarmFXManager:
             glow.draw(surface)
 
         # Draw particle effects
-        for emitter in self.particle_emitters:
-            emitter.draw(surface)
+        self.particles.draw(surface)
 
         # Draw swarm clusters
         for cluster in self.swarm_clusters:
             cluster.draw(surface)
 
         # Draw damage numbers (foreground)
-        for number in self.damage_numbers:
-            number.draw(surface)
+        if self.damage_numbers:
+            font = self._get_damage_font()
+            for number in self.damage_numbers:
+                number.draw(surface, font, self.text_cache)
+
+    def _get_damage_font(self):
+        """Font for damage numbers, created once (built-in font in browser - SysFont not available)."""
+        if self._damage_font is None:
+            self._damage_font = pygame.font.Font(None, 16) if sys.platform == "emscripten" else pygame.font.SysFont('Arial', 16, bold=True)
+        return self._damage_font
 
     def draw_latch(self, surface, assimilator_pos, target_pos, stack_count, world_to_screen):
         """
         Draw latch tendrils and effects from assimilator to target.
 
+        The whole latch (tendrils + particle cluster) is pre-rendered into a
+        cached sprite keyed by the screen offset between the two cells
+        (i.e. cell delta and zoom), stack_count and animation variant, so
+        each latch costs one blit per frame.
+
         Args:
             surface: Pygame surface to draw on
             assimilator_pos: (x, y) world position of assimilator
@@ -353,22 +452,44 @@ class SwarmFXManager:
             world_to_screen: Function to convert world coords to screen coords
         """
         # Convert positions to screen coordinates
-        assim_screen = world_to_screen(assimilator_pos[0], assimilator_pos[1])
-        target_screen = world_to_screen(target_pos[0], target_pos[1])
+        ax, ay = world_to_screen(assimilator_pos[0], assimilator_pos[1])
+        tx, ty = world_to_screen(target_pos[0], target_pos[1])
+        dx, dy = int(round(tx - ax)), int(round(ty - ay))
+
+        # Step through the jitter table every few frames; offset by target so
+        # latches on different targets don't pulse in lockstep
+        variant = (self._tick // self.LATCH_JITTER_HOLD + target_pos[0] * 7 + target_pos[1] * 13) % self.LATCH_JITTER_VARIANTS
+        key = (dx, dy, stack_count, variant)
+        sprite, (ox, oy) = self.latch_cache.get(key, lambda: self._build_latch_sprite(dx, dy, stack_count, variant))
+        surface.blit(sprite, (int(ax) + ox, int(ay) + oy))
+
+    def _build_latch_sprite(self, dx, dy, stack_count, variant):
+        """
+        Render one latch (tendrils from (0, 0) to (dx, dy), particles at the target).
+
+        Returns:
+            tuple: (surface, (ox, oy)) - blit at the assimilator's screen position + (ox, oy)
+        """
+        jitter = random.Random(variant)  # Row of the jitter table
+        base_radius = 5 + stack_count
+        margin = int(base_radius * 1.5) + 8
+        ox, oy = min(0, dx) - margin, min(0, dy) - margin
+        sprite = pygame.Surface((abs(dx) + 2 * margin + 1, abs(dy) + 2 * margin + 1), pygame.SRCALPHA)
+        start = (-ox, -oy)
+        end = (dx - ox, dy - oy)
 
         # Draw tendrils - red curved lines from assimilator to target
         if GFXDRAW_AVAILABLE:
-            # Use pygame.gfxdraw for smoother arcs
-            self._draw_tendrils_gfxdraw(surface, assim_screen, target_screen, stack_count)
+            self._draw_tendrils_gfxdraw(sprite, start, end, stack_count)
         else:
-            # Fallback to pygame.draw
-            self._draw_tendrils_fallback(surface, assim_screen, target_screen, stack_count)
+            self._draw_tendrils_fallback(sprite, start, end, stack_count, jitter)
 
         # Draw scaling circles/particles at target
-        self._draw_latch_particles(surface, target_screen, stack_count)
+        self._draw_latch_particles(sprite, end, stack_count, jitter)
+        return sprite, (ox, oy)
 
     def _draw_tendrils_gfxdraw(self, surface, start_pos, end_pos, stack_count):
-        """Draw curved tendrils using pygame.gfxdraw.arc."""
+        """Draw curved tendrils as quadratic bezier polylines."""
         start_x, start_y = start_pos
         end_x, end_y = end_pos
 
@@ -411,7 +532,7 @@ class SwarmFXManager:
                 # Draw line segment
                 pygame.gfxdraw.line(surface, int(x1), int(y1), int(x2), int(y2), base_color)
 
-    def _draw_tendrils_fallback(self, surface, start_pos, end_pos, stack_count):
+    def _draw_tendrils_fallback(self, surface, start_pos, end_pos, stack_count, jitter):
         """Fallback tendril drawing using pygame.draw."""
         start_x, start_y = start_pos
         end_x, end_y = end_pos
@@ -424,13 +545,13 @@ class SwarmFXManager:
 
         for i in range(tendril_count):
             # Simple straight lines with slight randomization
-            offset_x = random.randint(-3, 3)
-            offset_y = random.randint(-3, 3)
+            offset_x = jitter.randint(-3, 3)
+            offset_y = jitter.randint(-3, 3)
             pygame.draw.line(surface, color,
                            (start_x + offset_x, start_y + offset_y),
                            (end_x + offset_x, end_y + offset_y), 2)
 
-    def _draw_latch_particles(self, surface, center_pos, stack_count):
+    def _draw_latch_particles(self, surface, center_pos, stack_count, jitter):
         """Draw particle effects at latch target."""
         center_x, center_y = center_pos
 
@@ -440,25 +561,21 @@ class SwarmFXManager:
 
         # Draw filled circles for dense swarm effect when stack >= 5
         if stack_count >= 5:
-            # Outer glow circle
-            glow_color = (255, 100, 100, 100)  # Semi-transparent red
+            # Outer glow rings, outermost (faintest) first
             for r in range(base_radius + 5, base_radius - 1, -1):
                 alpha = 255 - (r - base_radius) * 20
                 color = (255, 100, 100, max(50, alpha))
-                if GFXDRAW_AVAILABLE:
-                    pygame.gfxdraw.filled_circle(surface, center_x, center_y, r, color)
-                else:
-                    pygame.draw.circle(surface, color, (center_x, center_y), r)
+                pygame.draw.circle(surface, color, (center_x, center_y), r)
 
         # Draw individual particles
         for i in range(particle_count):
             angle = (i / particle_count) * 2 * math.pi
-            distance = random.uniform(base_radius * 0.5, base_radius * 1.5)
+            distance = jitter.uniform(base_radius * 0.5, base_radius * 1.5)
             x = center_x + math.cos(angle) * distance
             y = center_y + math.sin(angle) * distance
 
-            size = random.uniform(1, 3)
-            color = (255, random.randint(50, 150), 50)
+            size = jitter.uniform(1, 3)
+            color = (255, jitter.randint(50, 150), 50)
 
             if GFXDRAW_AVAILABLE:
                 pygame.gfxdraw.filled_circle(surface, int(x), int(y), int(size), color)
@@ -473,7 +590,7 @@ class SwarmFXManager:
     def get_active_effects_count(self):
         """Get count of currently active effects."""
         return {
-            'emitters': len(self.particle_emitters),
+            'particles': len(self.particles),
             'clusters': len(self.swarm_clusters),
             'glows': len(self.trace_glows),
             'damage_numbers': len(self.damage_numbers)
@@ -1,9 +1,10 @@
 import random
 
 class PathGenerator:
-    def __init__(self, height, width):
+    def __init__(self, height, width, rng=None):
         self.height = height
         self.width = width
+        self.rng = rng or random  # Game passes its map stream
         self.path = []
 
     def cell_is_free(self, x, y):
@@ -20,7 +21,7 @@ class PathGenerator:
             valid_move = False
             attempts = 0
             while not valid_move and attempts < 10:  # Prevent infinite loops
-                move = random.randint(0, 2)
+                move = self.rng.randint(0, 2)
                 if move == 0 or x % 2 == 0 or x > (self.width - 2):
                     x += 1
                     valid_move = True